@@ -4,7 +4,7 @@ Core neural network and training components
 
 from .neural_net import GameNet
 from .mcts import MCTS
-from .replay_buffer import SharedReplayBuffer
+from .replay_buffer import SharedReplayBuffer, GAME_TYPE_CODES
 from .training import TrainingManager
 
-__all__ = ['GameNet', 'MCTS', 'SharedReplayBuffer', 'TrainingManager']
\ No newline at end of file
+__all__ = ['GameNet', 'MCTS', 'SharedReplayBuffer', 'GAME_TYPE_CODES', 'TrainingManager']
\ No newline at end of file
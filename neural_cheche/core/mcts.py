@@ -4,7 +4,6 @@ Monte Carlo Tree Search implementation
 
 import numpy as np
 import torch
-from ..utils.gpu_utils import clear_gpu_memory
 from ..error_handling import handle_system_error, ErrorCategory, ErrorSeverity
 from ..error_handling.decorators import handle_errors, graceful_degradation
 
@@ -133,9 +132,6 @@ class MCTS:
                     )
                     continue
 
-            # Clear GPU memory after search
-            clear_gpu_memory()
-
             # Return visit counts as policy
             if not root.children:
                 print("[MCTS] Warning: No children in root node")
@@ -7,24 +7,44 @@ import random
 import numpy as np
 
 
+# Integer tags for the game type stored alongside each experience
+GAME_TYPE_CODES = {"chess": 0, "checkers": 1}
+UNKNOWN_GAME_TYPE = -1
+
+
 class SharedReplayBuffer:
     """Shared replay buffer for storing game experiences"""
     
     def __init__(self, capacity):
         self.buffer = deque(maxlen=capacity)
+        self.game_types = deque(maxlen=capacity)  # Parallel to buffer
         self.capacity = capacity
     
     def add(self, experiences):
         """Add a list of experiences to the buffer"""
-        if isinstance(experiences, list):
-            self.buffer.extend(experiences)
-        else:
-            self.buffer.append(experiences)
+        if not isinstance(experiences, list):
+            experiences = [experiences]
+        self.buffer.extend(experiences)
+        self.game_types.extend(self._game_type_code(exp) for exp in experiences)
+    
+    @staticmethod
+    def _game_type_code(experience):
+        """Get the integer game type tag of an experience"""
+        if len(experience) > 4:
+            return GAME_TYPE_CODES.get(experience[4], UNKNOWN_GAME_TYPE)
+        return UNKNOWN_GAME_TYPE
     
     def sample(self, batch_size):
         """Sample a batch of experiences"""
         return random.sample(self.buffer, min(batch_size, len(self.buffer)))
     
+    def sample_with_types(self, batch_size):
+        """Sample a batch along with an int8 vector of its game type tags"""
+        indices = random.sample(range(len(self.buffer)), min(batch_size, len(self.buffer)))
+        batch = [self.buffer[i] for i in indices]
+        types = np.fromiter((self.game_types[i] for i in indices), dtype=np.int8, count=len(indices))
+        return batch, types
+    
     def get_statistics(self):
         """Get statistics about the replay buffer"""
         if not self.buffer:
@@ -52,6 +72,7 @@ class SharedReplayBuffer:
     def clear(self):
         """Clear all experiences from the buffer"""
         self.buffer.clear()
+        self.game_types.clear()
     
     def __len__(self):
         """Get the number of experiences in the buffer"""
@@ -21,6 +21,54 @@ class TrainingManager:
         # Initialize error handler
         self.error_handler = ErrorHandler()
     
+    def prepare_batch(self, batch):
+        """Convert a batch of experiences into device tensors for training"""
+        states, policies, values = list(zip(*batch))[:3]
+        
+        # Convert states to tensor
+        states_np = []
+        for state in states:
+            if hasattr(state, "cpu"):
+                states_np.append(state.cpu().numpy())
+            else:
+                states_np.append(state)
+        
+        states = torch.tensor(np.array(states_np), dtype=torch.float32)
+        
+        # Move to device
+        if self.device.type != "cpu":
+            states = states.to(self.device)
+        
+        # Prepare target policies
+        target_policies = []
+        for policy in policies:
+            if isinstance(policy, dict):
+                policy_tensor = torch.tensor(list(policy.values()), dtype=torch.float32)
+            else:
+                policy_tensor = torch.tensor(policy, dtype=torch.float32)
+            target_policies.append(policy_tensor)
+        
+        if self.device.type != "cpu":
+            target_policies = [tp.to(self.device) for tp in target_policies]
+        
+        # Prepare target values
+        target_values = torch.tensor(values, dtype=torch.float32).unsqueeze(1)
+        if self.device.type != "cpu":
+            target_values = target_values.to(self.device)
+        
+        return states, target_policies, target_values
+    
+    @staticmethod
+    def select_prepared(prepared, indices):
+        """Select the rows at ``indices`` from tensors returned by ``prepare_batch``"""
+        states, target_policies, target_values = prepared
+        index = torch.as_tensor(indices, dtype=torch.long, device=states.device)
+        return (
+            states.index_select(0, index),
+            [target_policies[i] for i in indices],
+            target_values.index_select(0, index)
+        )
+    
     @handle_errors(
         category=ErrorCategory.TRAINING,
         severity=ErrorSeverity.HIGH,
@@ -29,41 +77,16 @@ class TrainingManager:
         max_retries=3,
         fallback_value={"total_loss": 0.0, "policy_loss": 0.0, "value_loss": 0.0}
     )
-    def train_step(self, batch, game_type="chess"):
-        """Perform a single training step"""
+    def train_step(self, batch, game_type="chess", prepared=None):
+        """Perform a single training step
+        
+        ``prepared`` may hold the tensors returned by ``prepare_batch`` so that
+        several agents training on the same batch only convert it once.
+        """
         try:
-            states, policies, values, _ = zip(*batch)
-            
-            # Convert states to tensor
-            states_np = []
-            for state in states:
-                if hasattr(state, "cpu"):
-                    states_np.append(state.cpu().numpy())
-                else:
-                    states_np.append(state)
-            
-            states = torch.tensor(np.array(states_np), dtype=torch.float32)
-            
-            # Move to device
-            if self.device.type != "cpu":
-                states = states.to(self.device)
-            
-            # Prepare target policies
-            target_policies = []
-            for policy in policies:
-                if isinstance(policy, dict):
-                    policy_tensor = torch.tensor(list(policy.values()), dtype=torch.float32)
-                else:
-                    policy_tensor = torch.tensor(policy, dtype=torch.float32)
-                target_policies.append(policy_tensor)
-            
-            if self.device.type != "cpu":
-                target_policies = [tp.to(self.device) for tp in target_policies]
-            
-            # Prepare target values
-            target_values = torch.tensor(values, dtype=torch.float32).unsqueeze(1)
-            if self.device.type != "cpu":
-                target_values = target_values.to(self.device)
+            if prepared is None:
+                prepared = self.prepare_batch(batch)
+            states, target_policies, target_values = prepared
             
             # Zero gradients
             self.optimizer.zero_grad()
@@ -92,7 +115,6 @@ class TrainingManager:
             
             # Clean up GPU memory
             del states, target_policies, target_values, pred_policies, pred_values, total_loss
-            clear_gpu_memory()
             
             return {
                 "total_loss": loss_value,
@@ -109,14 +131,15 @@ class TrainingManager:
                 severity=ErrorSeverity.HIGH,
                 category=ErrorCategory.TRAINING
             )
-            clear_gpu_memory()
+            # A failed step may have hit an out-of-memory error; release the cache
+            clear_gpu_memory(force=True)
             return {"total_loss": 0.0, "policy_loss": 0.0, "value_loss": 0.0}
     
     def evaluate_batch(self, batch, game_type="chess"):
         """Evaluate a batch without training"""
         try:
             with torch.no_grad():
-                states, policies, values, _ = zip(*batch)
+                states, policies, values = list(zip(*batch))[:3]
                 
                 # Convert states
                 states_np = []
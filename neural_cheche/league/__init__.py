@@ -5,5 +5,7 @@ League management system for Neural CheChe
 from .league_manager import LeagueManager
 from .agents import AIAgent, ChampionAgent, TrainingAgent
 from .competition import Competition, Match
+from .records import MatchRecord, ChampionRecord
 
-__all__ = ['LeagueManager', 'AIAgent', 'ChampionAgent', 'TrainingAgent', 'Competition', 'Match']
\ No newline at end of file
+__all__ = ['LeagueManager', 'AIAgent', 'ChampionAgent', 'TrainingAgent', 'Competition', 'Match',
+           'MatchRecord', 'ChampionRecord']
\ No newline at end of file
@@ -8,6 +8,17 @@ from ..core import GameNet, TrainingManager
 from ..utils import safe_device
 
 
+def _snapshot_state(state):
+    """Recursively copy the tensors of a state dict to CPU"""
+    if torch.is_tensor(state):
+        return state.detach().cpu().clone()
+    if isinstance(state, dict):
+        return {key: _snapshot_state(value) for key, value in state.items()}
+    if isinstance(state, (list, tuple)):
+        return type(state)(_snapshot_state(value) for value in state)
+    return state
+
+
 class AIAgent:
     """Base AI agent class"""
     
@@ -48,16 +59,20 @@ class AIAgent:
         """Copy neural network weights from another agent"""
         self.net.load_state_dict(other_agent.net.state_dict())
     
+    def get_checkpoint(self):
+        """Get a CPU snapshot of the agent's state that training can't mutate"""
+        return {
+            'model_state_dict': _snapshot_state(self.net.state_dict()),
+            'optimizer_state_dict': _snapshot_state(self.optimizer.state_dict()),
+            'wins': self.wins.copy(),
+            'games_played': self.games_played.copy(),
+            'total_reward': self.total_reward.copy(),
+            'name': self.name
+        }
+    
     def save_model(self, filepath):
         """Save the agent's model"""
-        torch.save({
-            'model_state_dict': self.net.state_dict(),
-            'optimizer_state_dict': self.optimizer.state_dict(),
-            'wins': self.wins,
-            'games_played': self.games_played,
-            'total_reward': self.total_reward,
-            'name': self.name
-        }, filepath)
+        torch.save(self.get_checkpoint(), filepath)
     
     def load_model(self, filepath):
         """Load the agent's model"""
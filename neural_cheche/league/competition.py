@@ -6,12 +6,13 @@ import json
 import random
 import time
 import uuid
+from collections import deque
 from datetime import datetime
 from ..games import ChessGame, CheckersGame
 from ..core import MCTS
-from ..utils import clear_gpu_memory
 from ..validation import MoveValidator
 from ..history import MoveLogger, MoveData, GameInfo, GameResult, ScoreTracker
+from .records import MatchRecord
 
 
 class Match:
@@ -84,6 +85,11 @@ class Match:
         self.experiences = []
         self.move_count = 0
         
+        # The previous match may have drawn the other game's side of the window;
+        # later frames of this match only change this game's column
+        if self.visualize and visualization_manager:
+            visualization_manager.request_full_refresh()
+        
         try:
             while not self.game.is_game_over(self.board) and self.move_count < self.max_moves:
                 # Determine current player and agent
@@ -134,9 +140,6 @@ class Match:
             print(f"[Match] Error during match: {e}")
             self.final_reward = 0
         
-        finally:
-            clear_gpu_memory()
-        
         # Add experiences to replay buffer
         if replay_buffer and self.experiences:
             replay_buffer.add(self.experiences)
@@ -256,8 +259,8 @@ class Match:
             # Create simple policy (this would be more sophisticated in practice)
             policy = {str(move): 1.0}
             
-            # Experience format: [state, policy, reward, agent_name]
-            experience = [state_tensor, policy, None, agent.name]
+            # Experience format: [state, policy, reward, agent_name, game_type]
+            experience = [state_tensor, policy, None, agent.name, self.game_type]
             self.experiences.append(experience)
             
         except Exception as e:
@@ -302,153 +305,167 @@ class Match:
         if not vis_manager or not renderer:
             return
         
-        try:
-            # Update game state in visualization manager
-            vis_manager.update_game_state(
-                game_number=self.game_number,
-                generation=self.generation,
-                phase="Playing"
-            )
-            
-            # Set game number in visualization manager
-            vis_manager.set_game_number(self.game_number)
-            
-            # Create comprehensive game state
-            game_state = {
-                "board": self.board,
-                "current_player": current_agent.name,
-                "move_count": self.move_count,
-                "max_moves": self.max_moves,
-                "thinking": True,
-                "captured_pieces": getattr(renderer, 'captured_pieces', {"white": [], "black": []}) if hasattr(renderer, 'captured_pieces') else {"white": [], "black": []}
-            }
-            
-            # Use comprehensive display
-            if self.game_type == "chess":
-                vis_manager.display_comprehensive_game_state(chess_state=game_state)
-            else:
-                vis_manager.display_comprehensive_game_state(checkers_state=game_state)
-            
-            # Draw the actual board with enhanced features
-            offset_x = vis_manager.chess_offset_x if self.game_type == "chess" else vis_manager.checkers_offset_x
-            
-            if hasattr(renderer, 'draw_board_with_captured_pieces'):
-                renderer.draw_board_with_captured_pieces(
-                    vis_manager.screen, self.board,
-                    offset_x, vis_manager.board_offset_y,
-                    f"{self.game_type.title()} - {current_agent.name} thinking...",
-                    None, None, vis_manager.captured_pieces_renderer
-                )
-            else:
-                renderer.draw_board(
-                    vis_manager.screen, self.board, 
-                    offset_x, vis_manager.board_offset_y, 
+        drawn = vis_manager.render_frame(
+            lambda: self._draw_thinking_frame(vis_manager, renderer, current_agent),
+            dirty_rects=[vis_manager.get_game_area(self.game_type)]
+        )
+        if not drawn:
+            # Fallback to basic visualization
+            vis_manager.render_frame(
+                lambda: self._draw_basic_frame(
+                    vis_manager, renderer,
                     f"{self.game_type.title()} - {current_agent.name} thinking..."
                 )
-            
-            # Show thinking indicator
-            vis_manager.display_thinking_indicator(
-                self.game_type, current_agent.name, self.move_count
             )
-            
-            vis_manager.refresh_display()
-            vis_manager.process_events()
-            
-        except Exception as e:
-            print(f"⚠️ Error in enhanced visualization update: {e}")
-            # Fallback to basic visualization
-            vis_manager.clear_screen()
-            offset_x = vis_manager.chess_offset_x if self.game_type == "chess" else vis_manager.checkers_offset_x
+        vis_manager.process_events()
+    
+    def _draw_thinking_frame(self, vis_manager, renderer, current_agent):
+        """Draw the enhanced frame shown while an agent thinks (run inside render_frame)"""
+        # Update game state in visualization manager
+        vis_manager.update_game_state(
+            game_number=self.game_number,
+            generation=self.generation,
+            phase="Playing"
+        )
+        
+        # Set game number in visualization manager
+        vis_manager.set_game_number(self.game_number)
+        
+        # Create comprehensive game state
+        game_state = {
+            "board": self.board,
+            "current_player": current_agent.name,
+            "move_count": self.move_count,
+            "max_moves": self.max_moves,
+            "thinking": True,
+            "captured_pieces": getattr(renderer, 'captured_pieces', {"white": [], "black": []}) if hasattr(renderer, 'captured_pieces') else {"white": [], "black": []}
+        }
+        
+        # Use comprehensive display
+        if self.game_type == "chess":
+            vis_manager.display_comprehensive_game_state(chess_state=game_state)
+        else:
+            vis_manager.display_comprehensive_game_state(checkers_state=game_state)
+        
+        # Draw the actual board with enhanced features
+        offset_x = vis_manager.chess_offset_x if self.game_type == "chess" else vis_manager.checkers_offset_x
+        
+        if hasattr(renderer, 'draw_board_with_captured_pieces'):
+            renderer.draw_board_with_captured_pieces(
+                vis_manager.screen, self.board,
+                offset_x, vis_manager.board_offset_y,
+                f"{self.game_type.title()} - {current_agent.name} thinking...",
+                None, None, vis_manager.captured_pieces_renderer
+            )
+        else:
             renderer.draw_board(
                 vis_manager.screen, self.board, 
                 offset_x, vis_manager.board_offset_y, 
                 f"{self.game_type.title()} - {current_agent.name} thinking..."
             )
-            vis_manager.refresh_display()
+        
+        # Show thinking indicator
+        vis_manager.display_thinking_indicator(
+            self.game_type, current_agent.name, self.move_count
+        )
+        
+        vis_manager.refresh_display()
     
     def _show_move_result(self, vis_manager, renderer, move):
         """Show the result of a move - enhanced version"""
         if not vis_manager or not renderer:
             return
         
-        try:
-            # Determine player info
-            current_player = self.game.get_current_player(self.board)
-            current_agent = self.agent1 if current_player == 1 else self.agent2
-            player_type = "Alpha" if current_agent == self.agent1 else "Beta"
-            
-            # Extract move information
-            move_from = str(getattr(move, 'from_square', getattr(move, 'start', '?')))
-            move_to = str(getattr(move, 'to_square', getattr(move, 'end', '?')))
-            
-            # Display move with enhanced player info
-            position = "top" if player_type == "Alpha" else "bottom"
-            vis_manager.display_move_with_player_info(
-                self.game_type, current_agent.name, move_from, move_to, player_type, position
-            )
-            
-            # Update captured pieces if renderer supports it
-            if hasattr(renderer, 'update_captured_pieces'):
-                # This would need the board before the move, but we'll work with what we have
-                renderer.update_captured_pieces(None, self.board, move)
-            
-            # Create comprehensive game state for display
-            game_state = {
-                "board": self.board,
-                "last_move": move,
-                "move_count": self.move_count,
-                "max_moves": self.max_moves,
-                "move_info": {
-                    f"{position}_player": {
-                        "name": current_agent.name,
-                        "type": player_type,
-                        "move_from": move_from,
-                        "move_to": move_to
-                    }
-                },
-                "captured_pieces": getattr(renderer, 'captured_pieces', {"white": [], "black": []}) if hasattr(renderer, 'captured_pieces') else {"white": [], "black": []}
-            }
-            
-            # Use comprehensive display
-            if self.game_type == "chess":
-                vis_manager.display_comprehensive_game_state(chess_state=game_state)
-            else:
-                vis_manager.display_comprehensive_game_state(checkers_state=game_state)
-            
-            # Draw the board with enhanced features
-            offset_x = vis_manager.chess_offset_x if self.game_type == "chess" else vis_manager.checkers_offset_x
-            
-            if hasattr(renderer, 'draw_board_with_captured_pieces'):
-                renderer.draw_board_with_captured_pieces(
-                    vis_manager.screen, self.board,
-                    offset_x, vis_manager.board_offset_y,
-                    f"{self.game_type.title()} - Move {self.move_count}",
-                    move, None, vis_manager.captured_pieces_renderer
-                )
-            else:
-                renderer.draw_board(
-                    vis_manager.screen, self.board,
-                    offset_x, vis_manager.board_offset_y,
-                    f"{self.game_type.title()} - Move {self.move_count}", last_move=move
-                )
-            
-            vis_manager.refresh_display()
-            
-            # Brief pause to show the move
-            vis_manager.wait_with_events(0.1)
-            
-        except Exception as e:
-            print(f"⚠️ Error in enhanced move result display: {e}")
+        drawn = vis_manager.render_frame(
+            lambda: self._draw_move_result_frame(vis_manager, renderer, move),
+            dirty_rects=[vis_manager.get_game_area(self.game_type)]
+        )
+        if not drawn:
             # Fallback to basic visualization
-            vis_manager.clear_screen()
-            offset_x = vis_manager.chess_offset_x if self.game_type == "chess" else vis_manager.checkers_offset_x
+            vis_manager.render_frame(
+                lambda: self._draw_basic_frame(
+                    vis_manager, renderer,
+                    f"{self.game_type.title()} - Move {self.move_count}", move
+                )
+            )
+        
+        # Brief pause to show the move
+        vis_manager.wait_with_events(0.1)
+    
+    def _draw_move_result_frame(self, vis_manager, renderer, move):
+        """Draw the enhanced frame showing a move's result (run inside render_frame)"""
+        # Determine player info
+        current_player = self.game.get_current_player(self.board)
+        current_agent = self.agent1 if current_player == 1 else self.agent2
+        player_type = "Alpha" if current_agent == self.agent1 else "Beta"
+        
+        # Extract move information
+        move_from = str(getattr(move, 'from_square', getattr(move, 'start', '?')))
+        move_to = str(getattr(move, 'to_square', getattr(move, 'end', '?')))
+        
+        # Display move with enhanced player info
+        position = "top" if player_type == "Alpha" else "bottom"
+        vis_manager.display_move_with_player_info(
+            self.game_type, current_agent.name, move_from, move_to, player_type, position
+        )
+        
+        # Update captured pieces if renderer supports it
+        if hasattr(renderer, 'update_captured_pieces'):
+            # This would need the board before the move, but we'll work with what we have
+            renderer.update_captured_pieces(None, self.board, move)
+        
+        # Create comprehensive game state for display
+        game_state = {
+            "board": self.board,
+            "last_move": move,
+            "move_count": self.move_count,
+            "max_moves": self.max_moves,
+            "move_info": {
+                f"{position}_player": {
+                    "name": current_agent.name,
+                    "type": player_type,
+                    "move_from": move_from,
+                    "move_to": move_to
+                }
+            },
+            "captured_pieces": getattr(renderer, 'captured_pieces', {"white": [], "black": []}) if hasattr(renderer, 'captured_pieces') else {"white": [], "black": []}
+        }
+        
+        # Use comprehensive display
+        if self.game_type == "chess":
+            vis_manager.display_comprehensive_game_state(chess_state=game_state)
+        else:
+            vis_manager.display_comprehensive_game_state(checkers_state=game_state)
+        
+        # Draw the board with enhanced features
+        offset_x = vis_manager.chess_offset_x if self.game_type == "chess" else vis_manager.checkers_offset_x
+        
+        if hasattr(renderer, 'draw_board_with_captured_pieces'):
+            renderer.draw_board_with_captured_pieces(
+                vis_manager.screen, self.board,
+                offset_x, vis_manager.board_offset_y,
+                f"{self.game_type.title()} - Move {self.move_count}",
+                move, None, vis_manager.captured_pieces_renderer
+            )
+        else:
             renderer.draw_board(
                 vis_manager.screen, self.board,
                 offset_x, vis_manager.board_offset_y,
                 f"{self.game_type.title()} - Move {self.move_count}", last_move=move
             )
-            vis_manager.refresh_display()
-            vis_manager.wait_with_events(0.1)
+        
+        vis_manager.refresh_display()
+    
+    def _draw_basic_frame(self, vis_manager, renderer, title, last_move=None):
+        """Draw only the board, used when the enhanced frame fails (run inside render_frame)"""
+        vis_manager.clear_screen()
+        offset_x = vis_manager.chess_offset_x if self.game_type == "chess" else vis_manager.checkers_offset_x
+        renderer.draw_board(
+            vis_manager.screen, self.board,
+            offset_x, vis_manager.board_offset_y,
+            title, last_move=last_move
+        )
+        vis_manager.refresh_display()
     
     def _log_move(self, agent, move, board_before, board_after, thinking_time):
         """Log a move to the move logger"""
@@ -564,6 +581,7 @@ class Competition:
         self.enable_history = enable_history
         self.game_counter = 0  # Track total games played
         self.match_history = []
+        self.recent_matches = deque(maxlen=20)  # Bounded view of the latest matches
         self.validation_statistics = {
             'total_violations': 0,
             'violations_by_agent': {},
@@ -643,16 +661,18 @@ class Competition:
             self._update_validation_statistics(match.validation_violations, agent1.name, agent2.name, game_type)
         
         # Record match in history
-        self.match_history.append({
-            'agent1': agent1.name,
-            'agent2': agent2.name,
-            'game_type': game_type,
-            'winner': match._get_winner_name(),
-            'reward': reward,
-            'move_count': match.move_count,
-            'validation_violations': len(match.validation_violations),
-            'timestamp': time.time()
-        })
+        match_record = MatchRecord(
+            agent1=agent1.name,
+            agent2=agent2.name,
+            game_type=game_type,
+            winner=match._get_winner_name(),
+            reward=reward,
+            move_count=match.move_count,
+            validation_violations=len(match.validation_violations),
+            timestamp=time.time()
+        )
+        self.match_history.append(match_record)
+        self.recent_matches.append(match_record)
         
         return experiences, reward
     
@@ -727,22 +747,21 @@ class Competition:
         
         # Count by game type
         for match in self.match_history:
-            game_type = match['game_type']
+            game_type = match.game_type
             stats['game_type_counts'][game_type] = stats['game_type_counts'].get(game_type, 0) + 1
         
         # Agent performance
         for match in self.match_history:
-            for agent_key in ['agent1', 'agent2']:
-                agent_name = match[agent_key]
+            for agent_name in (match.agent1, match.agent2):
                 if agent_name not in stats['agent_performance']:
                     stats['agent_performance'][agent_name] = {'wins': 0, 'games': 0}
                 
                 stats['agent_performance'][agent_name]['games'] += 1
-                if match['winner'] == agent_name:
+                if match.winner == agent_name:
                     stats['agent_performance'][agent_name]['wins'] += 1
         
         # Average game length
-        total_moves = sum(match['move_count'] for match in self.match_history)
+        total_moves = sum(match.move_count for match in self.match_history)
         stats['average_game_length'] = total_moves / len(self.match_history)
         
         return stats
@@ -826,7 +845,7 @@ class Competition:
                     "validation_enabled": self.enable_validation,
                     "history_enabled": self.enable_history
                 },
-                "match_history": self.match_history,
+                "match_history": [match.to_dict() for match in self.match_history],
                 "validation_statistics": self.validation_statistics,
                 "history_statistics": self.get_history_statistics()
             }
@@ -4,10 +4,16 @@ Main league management system - orchestrates the entire training process
 
 import json
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import torch
 
 from .agents import ChampionAgent, TrainingAgent, WildcardAgent
 from .competition import Competition
-from ..core import SharedReplayBuffer
+from .records import ChampionRecord
+from ..core import SharedReplayBuffer, GAME_TYPE_CODES, TrainingManager
 from ..utils import safe_device, get_gpu_info, get_gpu_memory_info, clear_gpu_memory
 from ..utils import VisualizationManager
 from ..progress import ProgressManager
@@ -18,6 +24,17 @@ from ..error_handling import ErrorHandler, ErrorCategory, ErrorSeverity, Recover
 from ..error_handling.decorators import handle_errors
 
 
+# Per-generation console summary, filled in by _display_generation_stats
+GENERATION_STATS_TEMPLATE = (
+    "\n📊 Generation {generation} Statistics:\n"
+    "  Buffer size: {buffer_size}\n"
+    "  Champion defenses: {defenses}\n"
+    "  Alpha stats: W-{alpha_wins} | Games-{alpha_games}\n"
+    "  Beta stats: W-{beta_wins} | Games-{beta_games}\n"
+    "  GPU Memory: {gpu_memory}"
+)
+
+
 class LeagueManager:
     """Main orchestrator for the Neural CheChe training system"""
     
@@ -64,6 +81,11 @@ class LeagueManager:
         self.generation = 0
         self.training_stats = []
         self.champion_history = []
+        self._recent_champions = deque(maxlen=10)  # Last 10 entries of champion_history
+        
+        # Checkpoint I/O runs on a single worker so writes stay in order
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint_io")
+        self._pending_checkpoint = None
         
         # Visualization
         self.visualization_manager = None
@@ -516,11 +538,11 @@ class LeagueManager:
             total_loss = 0
             for step in range(self.config['training_steps_per_generation']):
                 # Sample batch
-                batch = self.replay_buffer.sample(self.config['batch_size'])
+                batch, game_types = self.replay_buffer.sample_with_types(self.config['batch_size'])
                 
                 # Train on chess and checkers data
-                chess_batch = [exp for exp in batch if 'chess' in str(exp)]
-                checkers_batch = [exp for exp in batch if 'checkers' in str(exp)]
+                chess_batch = [batch[i] for i in np.flatnonzero(game_types == GAME_TYPE_CODES['chess'])]
+                checkers_batch = [batch[i] for i in np.flatnonzero(game_types == GAME_TYPE_CODES['checkers'])]
                 
                 step_loss = 0
                 if chess_batch:
@@ -568,16 +590,21 @@ class LeagueManager:
             self.beta.copy_weights_from(self.champion)
             
             # Record in history
-            self.champion_history.append({
-                'generation': self.generation,
-                'previous_champion': 'Previous',
-                'new_champion': best_agent.name,
-                'win_rate': win_rate
-            })
+            self._record_champion(ChampionRecord(
+                generation=self.generation,
+                previous_champion='Previous',
+                new_champion=best_agent.name,
+                win_rate=win_rate
+            ))
         else:
             print("  🛡️ Champion defended successfully")
             self.champion.record_defense(True)
     
+    def _record_champion(self, record):
+        """Append a promotion record to the champion history"""
+        self.champion_history.append(record)
+        self._recent_champions.append(record)
+    
     def _run_wildcard_phase(self):
         """Phase 4: Wildcard Challenge"""
         print("🎲 Phase 4: Wildcard Challenge")
@@ -627,51 +654,29 @@ class LeagueManager:
         suppress_errors=True
     )
     def _save_progress(self):
-        """Save training progress"""
+        """Snapshot training progress and write it on the checkpoint I/O thread"""
         print("💾 Saving progress...")
         
         try:
-            # Save models with error handling for each
-            try:
-                self.champion.save_model(f"champion_gen_{self.generation}.pth")
-            except Exception as e:
-                if self.error_handler:
-                    self.error_handler.handle_error(
-                        error=e,
-                        category=ErrorCategory.FILE_IO,
-                        severity=ErrorSeverity.MEDIUM,
-                        component="LeagueManager",
-                        context={"operation": "save_champion_model", "generation": self.generation}
-                    )
+            # Snapshot models with error handling for each
+            model_snapshots = {}
+            for label, agent in (('champion', self.champion), ('alpha', self.alpha), ('beta', self.beta)):
+                try:
+                    model_snapshots[label] = agent.get_checkpoint()
+                except Exception as e:
+                    if self.error_handler:
+                        self.error_handler.handle_error(
+                            error=e,
+                            category=ErrorCategory.FILE_IO,
+                            severity=ErrorSeverity.MEDIUM,
+                            component="LeagueManager",
+                            context={"operation": f"save_{label}_model", "generation": self.generation}
+                        )
             
-            try:
-                self.alpha.save_model(f"alpha_gen_{self.generation}.pth")
-            except Exception as e:
-                if self.error_handler:
-                    self.error_handler.handle_error(
-                        error=e,
-                        category=ErrorCategory.FILE_IO,
-                        severity=ErrorSeverity.MEDIUM,
-                        component="LeagueManager",
-                        context={"operation": "save_alpha_model", "generation": self.generation}
-                    )
-            
-            try:
-                self.beta.save_model(f"beta_gen_{self.generation}.pth")
-            except Exception as e:
-                if self.error_handler:
-                    self.error_handler.handle_error(
-                        error=e,
-                        category=ErrorCategory.FILE_IO,
-                        severity=ErrorSeverity.MEDIUM,
-                        component="LeagueManager",
-                        context={"operation": "save_beta_model", "generation": self.generation}
-                    )
-            
-            # Save training statistics
+            # Snapshot training statistics
             stats = {
                 'generation': self.generation,
-                'champion_history': self.champion_history,
+                'champion_history': [record.to_dict() for record in self.champion_history],
                 'buffer_stats': self.replay_buffer.get_statistics(),
                 'agent_stats': {
                     'champion': self.champion.get_stats(),
@@ -681,10 +686,42 @@ class LeagueManager:
                 'competition_stats': self.competition.get_match_statistics()
             }
             
-            with open(f"training_stats_gen_{self.generation}.json", 'w') as f:
+            self._pending_checkpoint = self._io_executor.submit(
+                self._write_checkpoint, model_snapshots, stats, self.generation
+            )
+            
+        except Exception as e:
+            if self.error_handler:
+                self.error_handler.handle_error(
+                    error=e,
+                    category=ErrorCategory.FILE_IO,
+                    severity=ErrorSeverity.MEDIUM,
+                    component="LeagueManager",
+                    context={"operation": "save_progress", "generation": self.generation}
+                )
+            else:
+                print(f"❌ Error saving progress: {e}")
+    
+    def _write_checkpoint(self, model_snapshots, stats, generation):
+        """Write a progress snapshot to disk (runs on the checkpoint I/O thread)"""
+        try:
+            for label, snapshot in model_snapshots.items():
+                try:
+                    torch.save(snapshot, f"{label}_gen_{generation}.pth")
+                except Exception as e:
+                    if self.error_handler:
+                        self.error_handler.handle_error(
+                            error=e,
+                            category=ErrorCategory.FILE_IO,
+                            severity=ErrorSeverity.MEDIUM,
+                            component="LeagueManager",
+                            context={"operation": f"save_{label}_model", "generation": generation}
+                        )
+            
+            with open(f"training_stats_gen_{generation}.json", 'w') as f:
                 json.dump(stats, f, indent=2)
             
-            print("✅ Progress saved")
+            print(f"✅ Progress saved (generation {generation})")
             
         except Exception as e:
             if self.error_handler:
@@ -693,52 +730,75 @@ class LeagueManager:
                     category=ErrorCategory.FILE_IO,
                     severity=ErrorSeverity.MEDIUM,
                     component="LeagueManager",
-                    context={"operation": "save_progress", "generation": self.generation}
+                    context={"operation": "save_progress", "generation": generation}
                 )
             else:
                 print(f"❌ Error saving progress: {e}")
     
+    def _wait_for_checkpoint_writes(self):
+        """Block until any queued checkpoint write has finished"""
+        if self._pending_checkpoint is not None:
+            self._pending_checkpoint.result()
+            self._pending_checkpoint = None
+    
     def _display_generation_stats(self):
         """Display statistics for the current generation"""
-        print(f"\n📊 Generation {self.generation} Statistics:")
-        print(f"  Buffer size: {len(self.replay_buffer)}")
-        print(f"  Champion defenses: {self.champion.defense_record}")
-        print(f"  Alpha stats: W-{self.alpha.wins} | Games-{self.alpha.games_played}")
-        print(f"  Beta stats: W-{self.beta.wins} | Games-{self.beta.games_played}")
-        print(f"  GPU Memory: {get_gpu_memory_info()}")
+        # Sample once and reuse for both the console and the visualization
+        buffer_size = len(self.replay_buffer)
+        gpu_memory = get_gpu_memory_info()
+        
+        print(GENERATION_STATS_TEMPLATE.format(
+            generation=self.generation,
+            buffer_size=buffer_size,
+            defenses=self.champion.defense_record,
+            alpha_wins=self.alpha.wins,
+            alpha_games=self.alpha.games_played,
+            beta_wins=self.beta.wins,
+            beta_games=self.beta.games_played,
+            gpu_memory=gpu_memory
+        ))
         
         # Update visualization if available
         if self.visualization_manager:
-            self.visualization_manager.clear_screen()
-            
-            # Display generation info
-            self.visualization_manager.display_generation_info(
-                self.generation, "Training Complete",
-                {'alpha': self.alpha.wins, 'beta': self.beta.wins}
+            self.visualization_manager.render_frame(
+                lambda: self._draw_generation_stats(buffer_size, gpu_memory)
             )
-            
-            # Display training stats
-            buffer_stats = self.replay_buffer.get_statistics()
-            training_stats = {
-                'buffer_size': len(self.replay_buffer),
-                'mean_reward': buffer_stats.get('mean_reward', 0),
-                'gpu_memory': get_gpu_memory_info()
-            }
-            self.visualization_manager.display_training_stats(training_stats)
-            
-            # Display network info
-            net_info = self.champion.training_manager.get_model_info()
-            net_info['learning_rate'] = self.champion.training_manager.get_learning_rate()
-            self.visualization_manager.display_network_info(net_info)
-            
-            self.visualization_manager.refresh_display()
+    
+    def _draw_generation_stats(self, buffer_size, gpu_memory):
+        """Draw one frame of generation statistics (run inside render_frame)"""
+        self.visualization_manager.clear_screen()
+        
+        # Display generation info
+        self.visualization_manager.display_generation_info(
+            self.generation, "Training Complete",
+            {'alpha': self.alpha.wins, 'beta': self.beta.wins}
+        )
+        
+        # Display training stats
+        buffer_stats = self.replay_buffer.get_statistics()
+        training_stats = {
+            'buffer_size': buffer_size,
+            'mean_reward': buffer_stats.get('mean_reward', 0),
+            'gpu_memory': gpu_memory
+        }
+        self.visualization_manager.display_training_stats(training_stats)
+        
+        # Display network info
+        net_info = self.champion.training_manager.get_model_info()
+        net_info['learning_rate'] = self.champion.training_manager.get_learning_rate()
+        self.visualization_manager.display_network_info(net_info)
+        
+        self.visualization_manager.refresh_display()
     
     def _cleanup(self):
         """Clean up resources"""
         print("🧹 Cleaning up...")
         
+        # Finish queued checkpoint writes
+        self._io_executor.shutdown(wait=True)
+        
         # Clear GPU memory
-        clear_gpu_memory()
+        clear_gpu_memory(force=True)
         
         # Close visualization
         if self.visualization_manager:
@@ -753,6 +813,8 @@ class LeagueManager:
     def load_checkpoint(self, generation):
         """Load training state from a checkpoint"""
         try:
+            self._wait_for_checkpoint_writes()
+            
             # Load models
             self.champion.load_model(f"champion_gen_{generation}.pth")
             self.alpha.load_model(f"alpha_gen_{generation}.pth")
@@ -763,7 +825,8 @@ class LeagueManager:
                 stats = json.load(f)
             
             self.generation = stats['generation']
-            self.champion_history = stats['champion_history']
+            self.champion_history = [ChampionRecord.from_dict(record) for record in stats['champion_history']]
+            self._recent_champions = deque(self.champion_history, maxlen=self._recent_champions.maxlen)
             
             print(f"✅ Checkpoint loaded from generation {generation}")
             
@@ -881,50 +944,58 @@ class LeagueManager:
                 self.progress_manager.update_phase_progress(phase_name, 1.0)
             return
         
-        # Train each agent
+        # Train all agents together on shared batches
         agents_to_train = [self.champion, self.alpha, self.beta]
         training_results = {}
-        total_agents = len(agents_to_train)
+        total_losses = {agent.name: 0.0 for agent in agents_to_train}
+        training_steps = self.config['training_steps_per_generation']
         
-        for agent_idx, agent in enumerate(agents_to_train):
-            print(f"  🎓 Training {agent.name}...")
-            
-            # Update progress for current agent
+        print(f"  🎓 Training {', '.join(agent.name for agent in agents_to_train)}...")
+        
+        for step in range(training_steps):
+            # Update sub-progress
             if self.progress_manager:
-                base_progress = agent_idx / total_agents
-                self.progress_manager.update_phase_progress(phase_name, base_progress)
+                self.progress_manager.update_phase_progress(phase_name, step / training_steps)
             
-            total_loss = 0
-            training_steps = self.config['training_steps_per_generation']
+            # Sample one batch for every agent and convert it to tensors once
+            batch, game_types = self.replay_buffer.sample_with_types(self.config['batch_size'])
+            try:
+                prepared = self.champion.training_manager.prepare_batch(batch)
+            except Exception as e:
+                # Let each train_step convert its own batch under its error handling
+                if self.error_handler:
+                    self.error_handler.handle_error(
+                        error=e,
+                        category=ErrorCategory.TRAINING,
+                        severity=ErrorSeverity.MEDIUM,
+                        component="LeagueManager",
+                        context={"operation": "prepare_batch", "step": step}
+                    )
+                prepared = None
             
-            for step in range(training_steps):
-                # Update sub-progress
-                if self.progress_manager:
-                    step_progress = base_progress + (step / training_steps) / total_agents
-                    self.progress_manager.update_phase_progress(phase_name, step_progress)
-                
-                # Sample batch
-                batch = self.replay_buffer.sample(self.config['batch_size'])
-                
-                # Train on chess and checkers data
-                chess_batch = [exp for exp in batch if 'chess' in str(exp)]
-                checkers_batch = [exp for exp in batch if 'checkers' in str(exp)]
-                
-                step_loss = 0
-                if chess_batch:
-                    loss_info = agent.training_manager.train_step(chess_batch, "chess")
-                    step_loss += loss_info['total_loss']
-                
-                if checkers_batch:
-                    loss_info = agent.training_manager.train_step(checkers_batch, "checkers")
-                    step_loss += loss_info['total_loss']
-                
-                total_loss += step_loss
-                agent.record_training_iteration({'loss': step_loss})
+            # Train on chess and checkers data
+            step_losses = dict.fromkeys(total_losses, 0.0)
+            for game_type, type_code in GAME_TYPE_CODES.items():
+                indices = np.flatnonzero(game_types == type_code)
+                if indices.size == len(batch):
+                    # Single game type: train on the whole batch without re-indexing
+                    self._train_agents_on_batch(agents_to_train, batch, game_type, prepared, step_losses)
+                    break
+                if indices.size:
+                    self._train_agents_on_batch(
+                        agents_to_train, [batch[i] for i in indices], game_type,
+                        TrainingManager.select_prepared(prepared, indices) if prepared is not None else None,
+                        step_losses
+                    )
             
-            avg_loss = total_loss / training_steps
+            for agent in agents_to_train:
+                total_losses[agent.name] += step_losses[agent.name]
+                agent.record_training_iteration({'loss': step_losses[agent.name]})
+        
+        for agent in agents_to_train:
+            avg_loss = total_losses[agent.name] / training_steps
             training_results[agent.name] = avg_loss
-            print(f"    📈 Average loss: {avg_loss:.4f}")
+            print(f"    📈 {agent.name} average loss: {avg_loss:.4f}")
         
         # Complete phase
         if self.progress_manager:
@@ -933,6 +1004,12 @@ class LeagueManager:
         print("✅ Training phase complete")
         return training_results
     
+    def _train_agents_on_batch(self, agents, batch, game_type, prepared, step_losses):
+        """Train several agents on one batch of already prepared tensors"""
+        for agent in agents:
+            loss_info = agent.training_manager.train_step(batch, game_type, prepared=prepared)
+            step_losses[agent.name] += loss_info['total_loss']
+    
     @handle_errors(
         category=ErrorCategory.TRAINING,
         severity=ErrorSeverity.MEDIUM,
@@ -981,12 +1058,12 @@ class LeagueManager:
             self.beta.copy_weights_from(self.champion)
             
             # Record in history
-            self.champion_history.append({
-                'generation': self.generation,
-                'previous_champion': 'Previous',
-                'new_champion': best_agent.name,
-                'win_rate': win_rate
-            })
+            self._record_champion(ChampionRecord(
+                generation=self.generation,
+                previous_champion='Previous',
+                new_champion=best_agent.name,
+                win_rate=win_rate
+            ))
         else:
             print("  🛡️ Champion defended successfully")
             self.champion.record_defense(True)
@@ -1062,7 +1139,7 @@ class LeagueManager:
                 'training_loss': self._calculate_average_training_loss(),
                 'games_played': len(self.competition.match_history),
                 'buffer_utilization': len(self.replay_buffer) / self.config['buffer_capacity'],
-                'champion_defenses': len([h for h in self.champion_history if h.get('win_rate', 0) <= self.config['challenger_threshold']]),
+                'champion_defenses': len([h for h in self.champion_history if h.win_rate <= self.config['challenger_threshold']]),
                 'skill_score': self._calculate_skill_score()
             }
             
@@ -1089,12 +1166,12 @@ class LeagueManager:
     def _calculate_current_win_rate(self) -> float:
         """Calculate current overall win rate"""
         try:
-            if not self.competition.match_history:
+            recent_matches = self.competition.recent_matches  # Last 20 matches
+            if not recent_matches:
                 return 0.0
             
-            recent_matches = self.competition.match_history[-20:]  # Last 20 matches
-            wins = sum(1 for match in recent_matches if match.get('winner') in ['Alpha', 'Beta', 'Champion'])
-            return wins / len(recent_matches) if recent_matches else 0.0
+            wins = sum(1 for match in recent_matches if match.winner in ['Alpha', 'Beta', 'Champion'])
+            return wins / len(recent_matches)
             
         except Exception:
             return 0.0
@@ -1132,13 +1209,16 @@ class LeagueManager:
             # Return recent generation data
             historical_data = []
             
+            # Skill score doesn't change while building the data points
+            current_skill = self._calculate_skill_score()
+            
             # Add data points from champion history
-            for i, champion_data in enumerate(self.champion_history[-10:]):  # Last 10 champions
+            for champion_data in self._recent_champions:  # Last 10 champions
                 historical_data.append({
-                    'generation': champion_data.get('generation', i),
-                    'win_rate': champion_data.get('win_rate', 0.5),
-                    'champion': champion_data.get('new_champion', 'Unknown'),
-                    'skill_score': self._calculate_skill_score()
+                    'generation': champion_data.generation,
+                    'win_rate': champion_data.win_rate,
+                    'champion': champion_data.new_champion,
+                    'skill_score': current_skill
                 })
             
             return historical_data
@@ -0,0 +1,49 @@
+"""
+Compact record types for league match and champion history
+"""
+
+from dataclasses import dataclass, asdict
+from typing import Dict, Any
+
+
+@dataclass
+class MatchRecord:
+    """Outcome of a single match played in a competition"""
+    __slots__ = ('agent1', 'agent2', 'game_type', 'winner', 'reward',
+                 'move_count', 'validation_violations', 'timestamp')
+    agent1: str
+    agent2: str
+    game_type: str
+    winner: str
+    reward: float
+    move_count: int
+    validation_violations: int
+    timestamp: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MatchRecord':
+        """Create from dictionary (JSON deserialization)"""
+        return cls(**data)
+
+
+@dataclass
+class ChampionRecord:
+    """A challenger's promotion to champion"""
+    __slots__ = ('generation', 'previous_champion', 'new_champion', 'win_rate')
+    generation: int
+    previous_champion: str
+    new_champion: str
+    win_rate: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ChampionRecord':
+        """Create from dictionary (JSON deserialization)"""
+        return cls(**data)
@@ -3,8 +3,15 @@ CLI Progress Tracking with tqdm integration
 """
 
 from typing import Dict, List, Any, Optional
+import atexit
+import io
+import queue
 import sys
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import timedelta
+
+import numpy as np
 
 from ..error_handling import ErrorHandler, ErrorCategory, ErrorSeverity
 from ..error_handling.decorators import handle_errors, graceful_degradation
@@ -16,10 +23,103 @@ except ImportError:
     TQDM_AVAILABLE = False
     print("⚠️ tqdm not available, using basic progress display")
 
+# Metrics always shown first in the progress bar postfix
+_PRIORITY_KEYS = ('win_rate', 'training_loss', 'games_played', 'skill_score')
+# Metric value types that compare safely by value and cannot change in place
+_CACHEABLE_TYPES = (int, float, str, type(None))
+_SENTINEL = object()
+_STOP_WRITER = object()
+
+
+class _QueuedWriter:
+    """File-like object that hands progress bar writes to a daemon writer thread
+    
+    Nothing is dropped: write() waits for queue space if the console falls
+    behind, and flush() waits until everything queued has been written.
+    """
+    
+    def __init__(self, stream: io.TextIOBase, maxsize: int):
+        self._stream = stream
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._drain, name="cli_progress_writer", daemon=True)
+        self._thread.start()
+        
+        # Daemon threads die at exit - write out whatever is still queued first
+        atexit.register(self.close)
+    
+    def write(self, text: str) -> int:
+        if not self._thread.is_alive():
+            return self._stream.write(text)
+        self._queue.put(text)
+        return len(text)
+    
+    def flush(self) -> None:
+        """Wait until every queued write has reached the console"""
+        if self._thread.is_alive():
+            self._queue.join()
+        self._stream.flush()
+    
+    def close(self) -> None:
+        """Write everything still queued and stop the writer thread"""
+        atexit.unregister(self.close)
+        if self._thread.is_alive():
+            self._queue.put(_STOP_WRITER)
+            self._thread.join()
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+    
+    def _drain(self) -> None:
+        while True:
+            text = self._queue.get()
+            try:
+                if text is _STOP_WRITER:
+                    break
+                self._stream.write(text)
+                if self._queue.empty():
+                    self._stream.flush()
+            except (OSError, ValueError):
+                pass  # Console went away; keep draining so writers never block
+            finally:
+                self._queue.task_done()
+        
+        try:
+            self._stream.flush()
+        except (OSError, ValueError):
+            pass
+
+
+class _BarFile:
+    """tqdm's handle on a _QueuedWriter
+    
+    tqdm flushes after every write, which must not wait on the console - the
+    writer thread already flushes whenever its queue runs dry.
+    """
+    
+    def __init__(self, writer: _QueuedWriter):
+        self._writer = writer
+    
+    def write(self, text: str) -> int:
+        # Printed lines still held in sys.stdout go out ahead of the bar
+        sys.stdout.flush()
+        return self._writer.write(text)
+    
+    def flush(self) -> None:
+        """No-op - see the class docstring"""
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._writer, name)
+
 
 class CLIProgress:
     """CLI progress tracking with tqdm-style progress bars"""
     
+    STDOUT_BUFFER_SIZE = 64 * 1024
+    WRITER_QUEUE_SIZE = 256
+    HISTORY_CAPACITY = 100
+    HISTORY_METRICS = ('win_rate', 'training_loss', 'skill_score')
+    RECENT_WINDOW = 5
+    
     def __init__(self, total_generations: int):
         self.total_generations = total_generations
         self.current_generation = 0
@@ -27,13 +127,40 @@ class CLIProgress:
         # Initialize error handler
         self.error_handler = ErrorHandler()
         
+        # Progress bars write to their own buffered stream over the stdout file
+        # descriptor, drained by a background thread so console latency stays
+        # off the training loop. sys.stdout itself is left untouched.
+        self._bar_stream = self._create_bar_stream()
+        self._bar_writer: Optional[_QueuedWriter] = None
+        self._bar_file: Optional[_BarFile] = None
+        if self._bar_stream is not None:
+            self._bar_writer = _QueuedWriter(self._bar_stream, self.WRITER_QUEUE_SIZE)
+            self._bar_file = _BarFile(self._bar_writer)
+        
         # Progress bars
         self.generation_bar: Optional[tqdm] = None
         self.phase_bar: Optional[tqdm] = None
         
         # Metrics tracking
         self.current_metrics: Dict[str, Any] = {}
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic()
+        
+        # Per-generation metric history as a ring buffer of NumPy arrays
+        self._history_soa = {key: np.zeros(self.HISTORY_CAPACITY) for key in self.HISTORY_METRICS}
+        self._history_len = 0  # Total generations recorded
+        
+        # Running sums over the last RECENT_WINDOW generations
+        self._recent_sums = dict.fromkeys(self.HISTORY_METRICS, 0.0)
+        
+        # Refresh throttling - each bar redraws at most once per interval
+        self._min_refresh_interval_ns = 100_000_000  # 100 ms
+        self._last_refresh_ns = {"generation": 0, "phase": 0}
+        self._last_phase: Optional[str] = None
+        self._dirty_text = False  # Metrics changed since the postfix was last formatted
+        
+        # Last formatted metrics string and the metric items it was built from
+        self._fmt_cache_key: Optional[tuple] = None
+        self._fmt_cache_val = "Training..."
         
         # Initialize generation progress bar
         self.create_generation_bar()
@@ -60,7 +187,7 @@ class CLIProgress:
                 unit="gen",
                 ncols=100,
                 bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
-                file=sys.stdout
+                file=self._bar_file or sys.stdout
             )
             
             # Add initial metrics display
@@ -105,8 +232,9 @@ class CLIProgress:
                 ncols=80,
                 leave=False,
                 bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}, {rate_fmt}]",
-                file=sys.stdout
+                file=self._bar_file or sys.stdout
             )
+            self._last_phase = phase_name  # Description already matches this phase
             
             return self.phase_bar
             
@@ -125,33 +253,25 @@ class CLIProgress:
         """
         self.current_generation = current
         self.current_metrics = metrics
+        self._record_history(metrics)
         
         if TQDM_AVAILABLE and self.generation_bar:
-            try:
-                # Update progress
-                self.generation_bar.n = current
-                
-                # Create metrics display string
-                metrics_str = self._format_metrics(metrics)
-                self.generation_bar.set_postfix_str(metrics_str)
-                
-                # Refresh display
-                self.generation_bar.refresh()
-                
-            except Exception as e:
-                self.error_handler.handle_error(
-                    error=e,
-                    category=ErrorCategory.PROGRESS,
-                    severity=ErrorSeverity.LOW,
-                    component="CLIProgress",
-                    context={"operation": "update_generation", "generation": current}
-                )
+            # Update progress
+            self.generation_bar.n = current
+            
+            # Metrics display string is formatted when the bar next refreshes
+            self._dirty_text = True
+            
+            # Refresh display
+            self._maybe_refresh("generation")
         else:
             # Fallback display
             progress_pct = (current / self.total_generations) * 100
             metrics_str = self._format_metrics(metrics)
             print(f"🧠 Generation {current}/{self.total_generations} ({progress_pct:.1f}%) - {metrics_str}")
+            sys.stdout.flush()
     
+    @graceful_degradation(fallback_value=None, log_errors=True, component="phase_update")
     def update_phase(self, phase: str, progress: float) -> None:
         """
         Update phase progress
@@ -160,21 +280,26 @@ class CLIProgress:
             phase: Phase name
             progress: Progress percentage (0.0 to 1.0)
         """
+        phase_changed = phase != self._last_phase
+        self._last_phase = phase
+        
         if TQDM_AVAILABLE and self.phase_bar:
-            try:
-                # Update phase bar
-                new_n = int(progress * self.phase_bar.total)
-                self.phase_bar.n = new_n
-                self.phase_bar.set_description(f"⚡ {phase}")
-                self.phase_bar.refresh()
-                
-            except Exception as e:
-                print(f"⚠️ Phase update failed: {e}")
-        else:
-            # Fallback display
+            # Update phase bar
+            new_n = int(progress * self.phase_bar.total)
+            self.phase_bar.n = new_n
+            
+            # The description only changes with the phase
+            if phase_changed:
+                self.phase_bar.set_description(f"⚡ {phase}", refresh=False)
+            self._maybe_refresh("phase", force=phase_changed)
+        elif phase_changed or progress >= 1.0 or self._refresh_due("phase"):
+            # Fallback display, throttled like the bars but never skipping phase boundaries
+            self._last_refresh_ns["phase"] = time.monotonic_ns()
             progress_pct = progress * 100
             print(f"⚡ {phase}: {progress_pct:.1f}%")
+            sys.stdout.flush()
     
+    @graceful_degradation(fallback_value=None, log_errors=True, component="metrics_update")
     def update_metrics(self, metrics: Dict[str, Any]) -> None:
         """
         Update displayed metrics
@@ -183,14 +308,85 @@ class CLIProgress:
             metrics: Dictionary of metrics to display
         """
         self.current_metrics.update(metrics)
+        self._dirty_text = True
         
         if TQDM_AVAILABLE and self.generation_bar:
+            self._maybe_refresh("generation")
+    
+    def _create_bar_stream(self) -> Optional[io.TextIOWrapper]:
+        """Open a larger, non-line-buffered stream over stdout for the progress bars"""
+        try:
+            raw = sys.stdout.buffer.raw
+        except AttributeError:
+            return None  # Not a real file stream (e.g. captured output)
+        
+        sys.stdout.flush()
+        return io.TextIOWrapper(
+            io.BufferedWriter(raw, buffer_size=self.STDOUT_BUFFER_SIZE),
+            encoding=sys.stdout.encoding,
+            errors=sys.stdout.errors,
+            line_buffering=False,
+            write_through=False
+        )
+    
+    def _close_bar_stream(self) -> None:
+        """Write out any pending progress bar output and release the bar stream"""
+        if self._bar_stream is None:
+            return
+        
+        self._bar_writer.close()
+        self._bar_writer = None
+        self._bar_file = None
+        
+        self._bar_stream.flush()
+        
+        # Detach rather than close so the shared file descriptor stays open
+        self._bar_stream.detach().detach()
+        self._bar_stream = None
+    
+    def _record_history(self, metrics: Dict[str, Any]) -> None:
+        """Store a generation's metrics in the history ring buffer"""
+        slot = self._history_len % self.HISTORY_CAPACITY
+        evicted = self._history_len - self.RECENT_WINDOW
+        for key, values in self._history_soa.items():
+            # Missing and non-numeric values count as 0.0, like missing metrics
             try:
-                metrics_str = self._format_metrics(self.current_metrics)
-                self.generation_bar.set_postfix_str(metrics_str)
-                self.generation_bar.refresh()
-            except Exception as e:
-                print(f"⚠️ Metrics update failed: {e}")
+                value = float(metrics.get(key) or 0.0)
+            except (TypeError, ValueError):
+                value = 0.0
+            if evicted >= 0:
+                # Drop the generation that just left the recent window
+                self._recent_sums[key] -= values[evicted % self.HISTORY_CAPACITY]
+            values[slot] = value
+            self._recent_sums[key] += value
+        self._history_len += 1
+    
+    def _refresh_due(self, bar_name: str) -> bool:
+        """Check whether the refresh interval has elapsed for a bar"""
+        return time.monotonic_ns() - self._last_refresh_ns[bar_name] >= self._min_refresh_interval_ns
+    
+    def _maybe_refresh(self, bar_name: str, force: bool = False) -> bool:
+        """
+        Refresh a progress bar if its refresh interval has elapsed
+        
+        Args:
+            bar_name: Either "generation" or "phase"
+            force: Refresh regardless of the interval
+            
+        Returns:
+            True if the bar was redrawn
+        """
+        bar = self.generation_bar if bar_name == "generation" else self.phase_bar
+        if bar is None or not (force or self._refresh_due(bar_name)):
+            return False
+        
+        if bar_name == "generation" and self._dirty_text:
+            bar.postfix = self._format_metrics(self.current_metrics)
+            self._dirty_text = False
+        
+        bar.refresh()
+        self._last_refresh_ns[bar_name] = time.monotonic_ns()
+        return True
     
     def display_growth_summary(self, historical_data: List[Dict[str, Any]]) -> None:
         """
@@ -202,9 +398,7 @@ class CLIProgress:
         if not historical_data:
             return
         
-        print("\n" + "="*60)
-        print("📈 GENERATIONAL GROWTH SUMMARY")
-        print("="*60)
+        lines: List[str] = ["\n" + "="*60, "📈 GENERATIONAL GROWTH SUMMARY", "="*60]
         
         try:
             # Calculate growth metrics
@@ -215,47 +409,63 @@ class CLIProgress:
                 # Win rate improvement
                 if 'win_rate' in first_gen and 'win_rate' in latest_gen:
                     win_rate_change = latest_gen['win_rate'] - first_gen['win_rate']
-                    print(f"🎯 Win Rate: {first_gen['win_rate']:.1%} → {latest_gen['win_rate']:.1%} ({win_rate_change:+.1%})")
+                    lines.append(f"🎯 Win Rate: {first_gen['win_rate']:.1%} → {latest_gen['win_rate']:.1%} ({win_rate_change:+.1%})")
                 
                 # Training loss improvement
                 if 'training_loss' in first_gen and 'training_loss' in latest_gen:
                     loss_change = latest_gen['training_loss'] - first_gen['training_loss']
-                    print(f"📉 Training Loss: {first_gen['training_loss']:.4f} → {latest_gen['training_loss']:.4f} ({loss_change:+.4f})")
+                    lines.append(f"📉 Training Loss: {first_gen['training_loss']:.4f} → {latest_gen['training_loss']:.4f} ({loss_change:+.4f})")
                 
                 # Skill improvement
                 if 'skill_score' in first_gen and 'skill_score' in latest_gen:
                     skill_change = latest_gen['skill_score'] - first_gen['skill_score']
-                    print(f"🧠 Skill Score: {first_gen['skill_score']:.2f} → {latest_gen['skill_score']:.2f} ({skill_change:+.2f})")
+                    lines.append(f"🧠 Skill Score: {first_gen['skill_score']:.2f} → {latest_gen['skill_score']:.2f} ({skill_change:+.2f})")
             
             # Recent performance
-            recent_data = historical_data[-5:]  # Last 5 generations
-            if recent_data:
-                avg_win_rate = sum(d.get('win_rate', 0) for d in recent_data) / len(recent_data)
-                avg_loss = sum(d.get('training_loss', 0) for d in recent_data) / len(recent_data)
-                
-                print(f"\n📊 Recent Performance (last {len(recent_data)} generations):")
-                print(f"   Average Win Rate: {avg_win_rate:.1%}")
-                print(f"   Average Loss: {avg_loss:.4f}")
+            if self._history_len:
+                recent_count = min(self.RECENT_WINDOW, self._history_len)
+                avg_win_rate = self._recent_sums['win_rate'] / recent_count
+                avg_loss = self._recent_sums['training_loss'] / recent_count
+            else:
+                recent_data = historical_data[-5:]
+                recent_count = len(recent_data)
+                avg_win_rate = sum(d.get('win_rate', 0) for d in recent_data) / recent_count
+                avg_loss = sum(d.get('training_loss', 0) for d in recent_data) / recent_count
+            
+            if recent_count:
+                lines.append(f"\n📊 Recent Performance (last {recent_count} generations):")
+                lines.append(f"   Average Win Rate: {avg_win_rate:.1%}")
+                lines.append(f"   Average Loss: {avg_loss:.4f}")
             
             # Training time
-            elapsed = datetime.now() - self.start_time
-            print(f"\n⏱️ Training Time: {self._format_duration(elapsed)}")
+            elapsed = timedelta(seconds=time.monotonic() - self.start_time)
+            lines.append(f"\n⏱️ Training Time: {self._format_duration(elapsed)}")
             
             # Estimated completion
             if self.current_generation > 0:
                 time_per_gen = elapsed / self.current_generation
                 remaining_gens = self.total_generations - self.current_generation
                 eta = time_per_gen * remaining_gens
-                print(f"🎯 Estimated Completion: {self._format_duration(eta)}")
+                lines.append(f"🎯 Estimated Completion: {self._format_duration(eta)}")
             
         except Exception as e:
-            print(f"⚠️ Error displaying growth summary: {e}")
+            # Keep the lines built so far - they are still written below
+            lines.append(f"⚠️ Error displaying growth summary: {e}")
         
-        print("="*60 + "\n")
+        lines.append("="*60 + "\n")
+        
+        # Bar output still queued belongs before the summary
+        if self._bar_writer is not None:
+            self._bar_writer.flush()
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def close_all_bars(self) -> None:
         """Close all progress bars"""
         if TQDM_AVAILABLE:
+            # Show any updates still held back by the refresh throttle
+            self._maybe_refresh("phase", force=True)
+            self._maybe_refresh("generation", force=True)
+            
             if self.phase_bar:
                 self.phase_bar.close()
                 self.phase_bar = None
@@ -268,8 +478,11 @@ class CLIProgress:
         """Clean up CLI progress resources"""
         self.close_all_bars()
         
+        # Bar output must reach the console before the summary below
+        self._close_bar_stream()
+        
         # Final summary
-        elapsed = datetime.now() - self.start_time
+        elapsed = timedelta(seconds=time.monotonic() - self.start_time)
         print(f"\n🏁 Training completed in {self._format_duration(elapsed)}")
         print(f"📊 Final generation: {self.current_generation}/{self.total_generations}")
         
@@ -286,15 +499,22 @@ class CLIProgress:
         if not metrics:
             return "No metrics"
         
+        # Only all-scalar metrics are cached; arrays or tensors have no truth
+        # value when compared and may be updated in place, so they are
+        # formatted afresh every time
+        cache_key = tuple(metrics.items())
+        cacheable = all(isinstance(value, _CACHEABLE_TYPES) for _, value in cache_key)
+        if cacheable and cache_key == self._fmt_cache_key:
+            return self._fmt_cache_val
+        
         try:
-            # Priority metrics to show
-            priority_keys = ['win_rate', 'training_loss', 'games_played', 'skill_score']
-            
             formatted_parts = []
+            get = metrics.get
             
-            for key in priority_keys:
-                if key in metrics:
-                    value = metrics[key]
+            # Priority metrics to show
+            for key in _PRIORITY_KEYS:
+                value = get(key, _SENTINEL)
+                if value is not _SENTINEL:
                     if key == 'win_rate':
                         formatted_parts.append(f"WR:{value:.1%}")
                     elif key == 'training_loss':
@@ -304,31 +524,38 @@ class CLIProgress:
                     elif key == 'skill_score':
                         formatted_parts.append(f"Skill:{value:.2f}")
             
-            # Add other metrics if space allows
-            other_metrics = {k: v for k, v in metrics.items() if k not in priority_keys}
-            if other_metrics and len(formatted_parts) < 3:
-                for key, value in list(other_metrics.items())[:2]:
+            # Add other metrics if space allows - only the first two are considered
+            if len(formatted_parts) < 3:
+                others_seen = 0
+                for key, value in metrics.items():
+                    if key in _PRIORITY_KEYS:
+                        continue
                     if isinstance(value, (int, float)):
                         if isinstance(value, float):
                             formatted_parts.append(f"{key}:{value:.3f}")
                         else:
                             formatted_parts.append(f"{key}:{value}")
+                    others_seen += 1
+                    if others_seen == 2:
+                        break
             
-            return " | ".join(formatted_parts) if formatted_parts else "Training..."
+            metrics_str = " | ".join(formatted_parts) if formatted_parts else "Training..."
+            if cacheable:
+                self._fmt_cache_key = cache_key
+                self._fmt_cache_val = metrics_str
+            return metrics_str
             
-        except Exception as e:
-            return f"Metrics error: {e}"
+        except Exception:
+            return ""
     
     def _format_duration(self, duration: timedelta) -> str:
         """Format duration for display"""
-        total_seconds = int(duration.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
+        minutes, seconds = divmod(int(duration.total_seconds()), 60)
+        hours, minutes = divmod(minutes, 60)
         
         if hours > 0:
-            return f"{hours}h {minutes}m {seconds}s"
+            return str(hours) + "h " + str(minutes) + "m " + str(seconds) + "s"
         elif minutes > 0:
-            return f"{minutes}m {seconds}s"
+            return str(minutes) + "m " + str(seconds) + "s"
         else:
-            return f"{seconds}s"
\ No newline at end of file
+            return str(seconds) + "s"
\ No newline at end of file
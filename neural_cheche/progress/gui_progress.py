@@ -2,14 +2,26 @@
 GUI Progress Tracking with pygame integration
 """
 
-from typing import Dict, List, Any
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Deque, Dict, List, Any, NamedTuple, Optional, Tuple
+import numpy as np
 import pygame
-from datetime import datetime
+import time
 
 from ..error_handling import ErrorHandler, ErrorCategory, ErrorSeverity
 from ..error_handling.decorators import graceful_degradation
 
 
+class LayoutArea(NamedTuple):
+    """Screen-space rectangle of a progress display element"""
+
+    x: int
+    y: int
+    width: int
+    height: int
+
+
 class GUIProgress:
     """GUI progress tracking with visual indicators"""
 
@@ -41,13 +53,40 @@ class GUIProgress:
         self.total_generations = 0
         self.current_phase = "Initializing"
         self.phase_progress = 0.0
+        self._phase_color = self._resolve_phase_color(self.current_phase)
         self.current_metrics: Dict[str, Any] = {}
 
-        # Historical data for charts
-        self.generation_data: List[Dict[str, Any]] = []
+        # Historical data for charts (only recent data is kept for performance)
+        self.generation_data: Deque[Dict[str, Any]] = deque(maxlen=100)
+
+        # Rendered text surfaces keyed by (font id, text, color), oldest first
+        self._text_cache: Dict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface]
+        self._text_cache = OrderedDict()
+        self._text_cache_size = 128
 
         # Layout configuration
-        self.progress_area = {"x": 50, "y": 550, "width": 1140, "height": 120}
+        self.progress_area = LayoutArea(x=50, y=550, width=1140, height=120)
+        self.chart_area = LayoutArea(x=50, y=50, width=300, height=150)
+        self._last_size: Tuple[int, int] = (0, 0)  # Window size of the last layout
+
+        # Bar rects reused across draws; positions and fill widths are set in place
+        self._progress_bg_rect = pygame.Rect(self.progress_area)
+        self._gen_bg_rect = pygame.Rect(0, 0, 400, 25)
+        self._gen_fill_rect = pygame.Rect(0, 0, 0, 25)
+        self._phase_bg_rect = pygame.Rect(0, 0, 300, 15)
+        self._phase_fill_rect = pygame.Rect(0, 0, 0, 15)
+
+        # Static chart background and grid lines, rebuilt when the chart resizes
+        self._chart_bg_surface: Optional[pygame.Surface] = None
+        self._chart_bg_size: Tuple[int, int] = (0, 0)
+        self._build_chart_background()
+
+        # Trend line points and axis labels of generation_data, recomputed only
+        # when the data or the chart area changes
+        self._chart_plot: Optional[
+            Tuple[List[List[int]], List[Tuple[str, Tuple[int, float]]]]
+        ] = None
+        self._chart_dirty = True
 
         # Fonts
         try:
@@ -67,6 +106,73 @@ class GUIProgress:
             self.font_medium = pygame.font.Font(None, 18)
             self.font_small = pygame.font.Font(None, 14)
 
+    @staticmethod
+    def _to_display_format(surface: pygame.Surface) -> pygame.Surface:
+        """
+        Convert a cached surface to the display pixel format for faster blits
+
+        Args:
+            surface: Surface with per-pixel alpha
+
+        Returns:
+            Converted surface, or the original if no display mode is set yet
+        """
+        try:
+            return surface.convert_alpha()
+        except pygame.error:
+            return surface
+
+    def _render_text(
+        self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]
+    ) -> pygame.Surface:
+        """
+        Render antialiased text, reusing the surface from earlier identical renders
+
+        Args:
+            font: Font to render with
+            text: Text to render
+            color: Text color
+
+        Returns:
+            Rendered text surface
+        """
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is not None:
+            self._text_cache.move_to_end(key)
+            return surface
+
+        surface = self._to_display_format(font.render(text, True, color))
+        self._text_cache[key] = surface
+        if len(self._text_cache) > self._text_cache_size:
+            self._text_cache.popitem(last=False)
+        return surface
+
+    def _build_chart_background(self) -> None:
+        """Rasterize the growth chart background, border and grid lines once"""
+        chart_width = self.chart_area.width
+        chart_height = self.chart_area.height
+
+        # One extra row and column: grid lines end just past the border
+        surface = pygame.Surface((chart_width + 1, chart_height + 1), pygame.SRCALPHA)
+
+        chart_rect = pygame.Rect(0, 0, chart_width, chart_height)
+        pygame.draw.rect(surface, (30, 30, 30), chart_rect)
+        pygame.draw.rect(surface, self.colors["text_secondary"], chart_rect, 1)
+
+        for i in range(5):
+            grid_y = (i / 4) * chart_height
+            pygame.draw.line(
+                surface,
+                self.colors["chart_grid"],
+                (0, grid_y),
+                (chart_width, grid_y),
+                1,
+            )
+
+        self._chart_bg_surface = self._to_display_format(surface)
+        self._chart_bg_size = (chart_width, chart_height)
+
     def update_generation(self, current: int, metrics: Dict[str, Any]) -> None:
         """
         Update generation progress
@@ -81,14 +187,15 @@ class GUIProgress:
         # Store data for growth chart
         data_point = {
             "generation": current,
-            "timestamp": datetime.now().isoformat(),
+            "ts": time.time(),
             **metrics,
         }
         self.generation_data.append(data_point)
+        self._chart_dirty = True
 
-        # Keep only recent data for performance
-        if len(self.generation_data) > 100:
-            self.generation_data = self.generation_data[-100:]
+    def _resolve_phase_color(self, phase: str) -> Tuple[int, int, int]:
+        """Look up the progress bar color for a phase"""
+        return self.colors["phase_colors"].get(phase, self.colors["progress_fill"])
 
     def update_phase(self, phase: str, progress: float) -> None:
         """
@@ -98,6 +205,8 @@ class GUIProgress:
             phase: Phase name
             progress: Progress percentage (0.0 to 1.0)
         """
+        if phase != self.current_phase:
+            self._phase_color = self._resolve_phase_color(phase)
         self.current_phase = phase
         self.phase_progress = progress
 
@@ -112,11 +221,12 @@ class GUIProgress:
             y: Y position
         """
         try:
-            bar_width = 400
-            bar_height = 25
+            bg_rect = self._gen_bg_rect
+            bg_rect.topleft = (x, y)
+            bar_width = bg_rect.width
+            bar_height = bg_rect.height
 
             # Background
-            bg_rect = pygame.Rect(x, y, bar_width, bar_height)
             pygame.draw.rect(screen, self.colors["progress_bg"], bg_rect)
             pygame.draw.rect(screen, self.colors["text"], bg_rect, 2)
 
@@ -126,7 +236,9 @@ class GUIProgress:
                 fill_width = int(bar_width * progress_ratio)
 
                 if fill_width > 0:
-                    fill_rect = pygame.Rect(x, y, fill_width, bar_height)
+                    fill_rect = self._gen_fill_rect
+                    fill_rect.topleft = (x, y)
+                    fill_rect.width = fill_width
                     color = (
                         self.colors["progress_complete"]
                         if progress_ratio >= 1.0
@@ -142,8 +254,8 @@ class GUIProgress:
                 percentage = (self.current_generation / self.total_generations) * 100
                 progress_text += f" ({percentage:.1f}%)"
 
-            text_surface = self.font_medium.render(
-                progress_text, True, self.colors["text"]
+            text_surface = self._render_text(
+                self.font_medium, progress_text, self.colors["text"]
             )
             text_rect = text_surface.get_rect(
                 center=(x + bar_width // 2, y + bar_height // 2)
@@ -162,8 +274,8 @@ class GUIProgress:
             error_text = (
                 f"Generation {self.current_generation}/{self.total_generations}"
             )
-            text_surface = self.font_medium.render(
-                error_text, True, self.colors["text"]
+            text_surface = self._render_text(
+                self.font_medium, error_text, self.colors["text"]
             )
             screen.blit(text_surface, (x, y))
 
@@ -179,34 +291,33 @@ class GUIProgress:
         try:
             # Phase title
             phase_text = f"Current Phase: {self.current_phase}"
-            title_surface = self.font_medium.render(
-                phase_text, True, self.colors["text"]
+            title_surface = self._render_text(
+                self.font_medium, phase_text, self.colors["text"]
             )
             screen.blit(title_surface, (x, y))
 
             # Phase progress bar
             bar_y = y + 25
-            bar_width = 300
-            bar_height = 15
+            bg_rect = self._phase_bg_rect
+            bg_rect.topleft = (x, bar_y)
+            bar_width = bg_rect.width
 
             # Background
-            bg_rect = pygame.Rect(x, bar_y, bar_width, bar_height)
             pygame.draw.rect(screen, self.colors["progress_bg"], bg_rect)
             pygame.draw.rect(screen, self.colors["text_secondary"], bg_rect, 1)
 
             # Progress fill
             fill_width = int(bar_width * self.phase_progress)
             if fill_width > 0:
-                fill_rect = pygame.Rect(x, bar_y, fill_width, bar_height)
-                phase_color = self.colors["phase_colors"].get(
-                    self.current_phase, self.colors["progress_fill"]
-                )
-                pygame.draw.rect(screen, phase_color, fill_rect)
+                fill_rect = self._phase_fill_rect
+                fill_rect.topleft = (x, bar_y)
+                fill_rect.width = fill_width
+                pygame.draw.rect(screen, self._phase_color, fill_rect)
 
             # Progress percentage
             progress_pct = f"{self.phase_progress * 100:.1f}%"
-            pct_surface = self.font_small.render(
-                progress_pct, True, self.colors["text_secondary"]
+            pct_surface = self._render_text(
+                self.font_small, progress_pct, self.colors["text_secondary"]
             )
             screen.blit(pct_surface, (x + bar_width + 10, bar_y))
 
@@ -216,7 +327,9 @@ class GUIProgress:
             error_text = (
                 f"Phase: {self.current_phase} ({self.phase_progress * 100:.1f}%)"
             )
-            text_surface = self.font_small.render(error_text, True, self.colors["text"])
+            text_surface = self._render_text(
+                self.font_small, error_text, self.colors["text"]
+            )
             screen.blit(text_surface, (x, y))
 
     def draw_metrics_panel(self, screen: pygame.Surface, x: int, y: int) -> None:
@@ -231,15 +344,15 @@ class GUIProgress:
         try:
             if not self.current_metrics:
                 no_metrics_text = "No metrics available"
-                text_surface = self.font_small.render(
-                    no_metrics_text, True, self.colors["text_secondary"]
+                text_surface = self._render_text(
+                    self.font_small, no_metrics_text, self.colors["text_secondary"]
                 )
                 screen.blit(text_surface, (x, y))
                 return
 
             # Metrics title
-            title_surface = self.font_medium.render(
-                "Current Metrics:", True, self.colors["text"]
+            title_surface = self._render_text(
+                self.font_medium, "Current Metrics:", self.colors["text"]
             )
             screen.blit(title_surface, (x, y))
 
@@ -270,18 +383,20 @@ class GUIProgress:
                     else:
                         display_text = f"{key}: {value}"
 
-                    text_surface = self.font_small.render(
-                        display_text, True, self.colors["text_secondary"]
+                    text_surface = self._render_text(
+                        self.font_small, display_text, self.colors["text_secondary"]
                     )
                     screen.blit(text_surface, (x, metrics_y + i * line_height))
 
         except Exception as e:
             error_text = f"Metrics error: {str(e)[:30]}"
-            text_surface = self.font_small.render(error_text, True, self.colors["text"])
+            text_surface = self._render_text(
+                self.font_small, error_text, self.colors["text"]
+            )
             screen.blit(text_surface, (x, y))
 
     def draw_growth_chart(
-        self, screen: pygame.Surface, data: List[Dict[str, Any]]
+        self, screen: pygame.Surface, data: Deque[Dict[str, Any]]
     ) -> None:
         """
         Draw generational growth chart
@@ -295,59 +410,29 @@ class GUIProgress:
 
         try:
             # Chart area
-            chart_x = 50
-            chart_y = 50
-            chart_width = 300
-            chart_height = 150
+            chart_x, chart_y, chart_width, chart_height = self.chart_area
 
-            # Background
-            chart_rect = pygame.Rect(chart_x, chart_y, chart_width, chart_height)
-            pygame.draw.rect(screen, (30, 30, 30), chart_rect)
-            pygame.draw.rect(screen, self.colors["text_secondary"], chart_rect, 1)
+            # Background and grid lines
+            screen.blit(self._chart_bg_surface, (chart_x, chart_y))
 
             # Title
-            title_surface = self.font_small.render(
-                "Performance Trend", True, self.colors["text"]
+            title_surface = self._render_text(
+                self.font_small, "Performance Trend", self.colors["text"]
             )
             screen.blit(title_surface, (chart_x + 5, chart_y - 20))
 
-            # Extract win rate data
-            win_rates = []
-            generations = []
-
-            for point in data[-20:]:  # Last 20 generations
-                if "win_rate" in point and "generation" in point:
-                    win_rates.append(point["win_rate"])
-                    generations.append(point["generation"])
+            if data is self.generation_data:
+                # Reuse the plot until the data or chart area changes
+                if self._chart_dirty:
+                    self._chart_plot = self._compute_chart_plot(data)
+                    self._chart_dirty = False
+                plot = self._chart_plot
+            else:
+                plot = self._compute_chart_plot(data)
 
-            if len(win_rates) < 2:
+            if plot is None:
                 return
-
-            # Normalize data to chart coordinates
-            min_rate = min(win_rates)
-            max_rate = max(win_rates)
-            rate_range = max_rate - min_rate if max_rate > min_rate else 1
-
-            points = []
-            for i, rate in enumerate(win_rates):
-                chart_x_pos = chart_x + (i / (len(win_rates) - 1)) * chart_width
-                chart_y_pos = (
-                    chart_y
-                    + chart_height
-                    - ((rate - min_rate) / rate_range) * chart_height
-                )
-                points.append((int(chart_x_pos), int(chart_y_pos)))
-
-            # Draw grid lines
-            for i in range(5):
-                grid_y = chart_y + (i / 4) * chart_height
-                pygame.draw.line(
-                    screen,
-                    self.colors["chart_grid"],
-                    (chart_x, grid_y),
-                    (chart_x + chart_width, grid_y),
-                    1,
-                )
+            points, labels = plot
 
             # Draw trend line
             if len(points) > 1:
@@ -358,22 +443,66 @@ class GUIProgress:
                 pygame.draw.circle(screen, self.colors["chart_line"], point, 3)
 
             # Y-axis labels
-            for i in range(3):
-                label_rate = min_rate + (i / 2) * rate_range
-                label_text = f"{label_rate:.1%}"
-                label_surface = self.font_small.render(
-                    label_text, True, self.colors["text_secondary"]
+            for label_text, label_pos in labels:
+                label_surface = self._render_text(
+                    self.font_small, label_text, self.colors["text_secondary"]
                 )
-                label_y = chart_y + chart_height - (i / 2) * chart_height - 5
-                screen.blit(label_surface, (chart_x - 40, label_y))
+                screen.blit(label_surface, label_pos)
 
         except Exception as e:
             # Fallback text
             print(f"⚠️ Chart display error: {e}")
             error_text = f"Chart error: {str(e)[:20]}"
-            text_surface = self.font_small.render(error_text, True, self.colors["text"])
+            text_surface = self._render_text(
+                self.font_small, error_text, self.colors["text"]
+            )
             screen.blit(text_surface, (50, 50))
 
+    def _compute_chart_plot(
+        self, data: Deque[Dict[str, Any]]
+    ) -> Optional[Tuple[List[List[int]], List[Tuple[str, Tuple[int, float]]]]]:
+        """
+        Compute trend line points and Y-axis labels for the growth chart
+
+        Args:
+            data: Historical performance data
+
+        Returns:
+            Points and (text, position) labels, or None with too few win rates
+        """
+        chart_x, chart_y, chart_width, chart_height = self.chart_area
+
+        # Extract win rate data (last 20 generations)
+        win_rates = np.fromiter(
+            (
+                point["win_rate"]
+                for point in islice(data, max(0, len(data) - 20), None)
+                if "win_rate" in point and "generation" in point
+            ),
+            dtype=np.float64,
+        )
+
+        if len(win_rates) < 2:
+            return None
+
+        # Normalize data to chart coordinates
+        min_rate = float(win_rates.min())
+        max_rate = float(win_rates.max())
+        rate_range = max_rate - min_rate if max_rate > min_rate else 1
+
+        steps = np.arange(len(win_rates)) / (len(win_rates) - 1)
+        xs = chart_x + steps * chart_width
+        ys = chart_y + chart_height - (win_rates - min_rate) / rate_range * chart_height
+        points = np.column_stack((xs.astype(np.int32), ys.astype(np.int32))).tolist()
+
+        labels = []
+        for i in range(3):
+            label_rate = min_rate + (i / 2) * rate_range
+            label_y = chart_y + chart_height - (i / 2) * chart_height - 5
+            labels.append((f"{label_rate:.1%}", (chart_x - 40, label_y)))
+
+        return points, labels
+
     def display_growth_chart(self, historical_data: List[Dict[str, Any]]) -> None:
         """
         Update the growth chart with new historical data
@@ -381,12 +510,12 @@ class GUIProgress:
         Args:
             historical_data: List of historical performance data
         """
-        # Store the data for rendering
+        # Store the data for rendering; older entries would be evicted anyway
+        maxlen = self.generation_data.maxlen
+        if len(historical_data) > maxlen:
+            historical_data = historical_data[-maxlen:]
         self.generation_data.extend(historical_data)
-
-        # Keep only recent data for performance
-        if len(self.generation_data) > 100:
-            self.generation_data = self.generation_data[-100:]
+        self._chart_dirty = True
 
     def adapt_to_window_size(self, width: int, height: int) -> None:
         """
@@ -400,19 +529,18 @@ class GUIProgress:
             # Adjust progress area based on window size
             margin = 50
 
-            self.progress_area = {
-                "x": margin,
-                "y": height - 150,  # Bottom area
-                "width": width - 2 * margin,
-                "height": 120,
-            }
-
-            # Ensure minimum size
-            if self.progress_area["width"] < 400:
-                self.progress_area["width"] = 400
+            self.progress_area = LayoutArea(
+                x=margin,
+                y=height - 150,  # Bottom area
+                width=max(width - 2 * margin, 400),  # Ensure minimum size
+                height=120,
+            )
+            self._progress_bg_rect.update(self.progress_area)
+            self._chart_dirty = True
 
-            if self.progress_area["height"] < 80:
-                self.progress_area["height"] = 80
+            chart_size = (self.chart_area.width, self.chart_area.height)
+            if chart_size != self._chart_bg_size:
+                self._build_chart_background()
 
         except Exception as e:
             print(f"⚠️ Error adapting to window size: {e}")
@@ -425,37 +553,14 @@ class GUIProgress:
             screen: Pygame surface to draw on
         """
         try:
-            # Get window dimensions
-            width, height = screen.get_size()
-            self.adapt_to_window_size(width, height)
-
-            # Progress area background
-            progress_bg = pygame.Rect(
-                self.progress_area["x"],
-                self.progress_area["y"],
-                self.progress_area["width"],
-                self.progress_area["height"],
-            )
-            pygame.draw.rect(screen, (20, 20, 20), progress_bg)
-            pygame.draw.rect(screen, self.colors["text_secondary"], progress_bg, 1)
-
-            # Draw progress elements
-            base_x = self.progress_area["x"] + 10
-            base_y = self.progress_area["y"] + 10
-
-            # Generation progress
-            self.draw_generation_progress(screen, base_x, base_y)
+            # Get window dimensions, re-running the layout only on resize
+            size = screen.get_size()
+            width, height = size
+            if size != self._last_size:
+                self.adapt_to_window_size(width, height)
+                self._last_size = size
 
-            # Phase progress
-            self.draw_phase_progress(screen, base_x, base_y + 50)
-
-            # Metrics panel
-            metrics_x = base_x + 450
-            self.draw_metrics_panel(screen, metrics_x, base_y)
-
-            # Growth chart (if space allows)
-            if width > 800:
-                self.draw_growth_chart(screen, self.generation_data)
+            self._draw_progress_elements(screen, width)
 
         except Exception as e:
             # Fallback minimal display
@@ -463,15 +568,49 @@ class GUIProgress:
             error_text = (
                 f"Progress: Gen {self.current_generation}/{self.total_generations}"
             )
-            text_surface = self.font_medium.render(
-                error_text, True, self.colors["text"]
+            text_surface = self._render_text(
+                self.font_medium, error_text, self.colors["text"]
             )
             screen.blit(text_surface, (50, height - 50))
 
+    def _draw_progress_elements(self, surface: pygame.Surface, width: int) -> None:
+        """
+        Draw every progress element onto a surface
+
+        Args:
+            surface: Surface to draw on
+            width: Window width
+        """
+        # Progress area background
+        progress_bg = self._progress_bg_rect
+        pygame.draw.rect(surface, (20, 20, 20), progress_bg)
+        pygame.draw.rect(surface, self.colors["text_secondary"], progress_bg, 1)
+
+        # Draw progress elements
+        base_x = self.progress_area.x + 10
+        base_y = self.progress_area.y + 10
+
+        # Generation progress
+        self.draw_generation_progress(surface, base_x, base_y)
+
+        # Phase progress
+        self.draw_phase_progress(surface, base_x, base_y + 50)
+
+        # Metrics panel
+        metrics_x = base_x + 450
+        self.draw_metrics_panel(surface, metrics_x, base_y)
+
+        # Growth chart (if space allows)
+        if width > 800:
+            self.draw_growth_chart(surface, self.generation_data)
+
     def cleanup(self) -> None:
         """Clean up GUI progress resources"""
         # Clear data to free memory
         self.generation_data.clear()
+        self._chart_plot = None
+        self._chart_dirty = True
         self.current_metrics.clear()
+        self._text_cache.clear()
 
         print("🎮 GUI progress tracking cleanup completed")
@@ -2,16 +2,107 @@
 Progress Manager - Coordinates CLI and GUI progress tracking
 """
 
-from typing import Dict, List, Optional, Any
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Any, Tuple
 from datetime import datetime
+import io
 import json
 import os
+import queue
+import threading
+import time
+
+import numpy as np
 
 from .cli_progress import CLIProgress
 from .gui_progress import GUIProgress
 from ..error_handling import ErrorHandler, ErrorCategory, ErrorSeverity
 from ..error_handling.decorators import handle_errors
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode values JSON has no type for, such as NumPy or torch scalars"""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if ORJSON_AVAILABLE:
+
+    def _dumps(obj: Any) -> bytes:
+        """Encode an object as compact JSON bytes"""
+        return orjson.dumps(
+            obj, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY
+        )
+
+    _loads = orjson.loads
+else:
+
+    def _dumps(obj: Any) -> bytes:
+        """Encode an object as compact JSON bytes"""
+        return json.dumps(obj, separators=(",", ":"), default=_json_default).encode()
+
+    _loads = json.loads
+
+# Histories are append-only JSONL: one compact JSON object per line
+PROGRESS_DATA_DIR = "progress_data"
+GENERATION_HISTORY_PATH = os.path.join(PROGRESS_DATA_DIR, "generation_history.jsonl")
+METRICS_HISTORY_PATH = os.path.join(PROGRESS_DATA_DIR, "metrics_history.jsonl")
+CURRENT_STATE_PATH = os.path.join(PROGRESS_DATA_DIR, "current_state.json")
+
+HISTORY_WRITE_BUFFER_SIZE = 64 * 1024
+SAVE_QUEUE_SIZE = 64  # Queued disk writes before the training thread waits
+TREND_WINDOW = 10  # Generations considered by get_performance_trends
+
+_GenerationUpdate = Callable[[int, Dict[str, Any]], None]
+_PhaseUpdate = Callable[[str, float], None]
+_SaveItem = Tuple[Callable[..., None], tuple]  # (write method, arguments)
+
+# Whole-array JSON files written by earlier versions, migrated on load
+LEGACY_GENERATION_HISTORY_PATH = os.path.join(
+    PROGRESS_DATA_DIR, "generation_history.json"
+)
+LEGACY_METRICS_HISTORY_PATH = os.path.join(PROGRESS_DATA_DIR, "metrics_history.json")
+
+
+def _ends_with_newline(path: str) -> bool:
+    """Check whether a file is missing, empty or ends with a complete line"""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    except FileNotFoundError:
+        return True
+
+
+def _normalize_timestamp(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a legacy ISO "timestamp" field to epoch seconds under "ts"
+
+    History entries record their time as time.time() seconds under "ts";
+    this is the only place older ISO strings are converted.
+    """
+    timestamp = entry.get("timestamp")
+    if "ts" not in entry and isinstance(timestamp, str):
+        try:
+            entry["ts"] = datetime.fromisoformat(timestamp).timestamp()
+        except ValueError:
+            return entry
+        del entry["timestamp"]
+    return entry
+
 
 class ProgressManager:
     """Manages progress tracking for both CLI and GUI interfaces"""
@@ -30,19 +121,71 @@ class ProgressManager:
         self.cli_progress: Optional[CLIProgress] = None
         self.gui_progress: Optional[GUIProgress] = None
 
+        # Update methods of the displays, bound once when each is initialized
+        self._cli_update_generation: Optional[_GenerationUpdate] = None
+        self._cli_update_phase: Optional[_PhaseUpdate] = None
+        self._gui_update_generation: Optional[_GenerationUpdate] = None
+        self._gui_update_phase: Optional[_PhaseUpdate] = None
+
         # Progress state
         self.current_generation = 0
         self.total_generations = 0
         self.current_phase = "Initializing"
         self.phase_progress = 0.0
 
-        # Historical data for growth tracking
-        self.generation_history: List[Dict[str, Any]] = []
-        self.metrics_history: List[Dict[str, Any]] = []
+        # Phase updates reach the displays at most once per update_frequency
+        self._dispatched_phase: Optional[str] = None
+        self._last_dispatch_ts = 0.0
+        self._pending_phase: Optional[Tuple[str, float]] = None
+
+        # Historical data for growth tracking. Only the most recent entries are
+        # kept in memory; the JSONL files on disk hold the full history.
+        self._history_limit = config.get("metrics_history_length", 10000)
+        self.generation_history: Deque[Dict[str, Any]] = deque(
+            maxlen=self._history_limit
+        )
+        self.metrics_history: Deque[Dict[str, Any]] = deque(maxlen=self._history_limit)
+        self._generation_history_total = 0  # Entries on disk and in memory
+
+        # New history entries waiting to be appended to disk, by file path.
+        # Flushed once enough entries or enough time have accumulated; each
+        # flush hands its lists to the save thread and starts new ones.
+        self._pending_history: Dict[str, List[Dict[str, Any]]] = {
+            GENERATION_HISTORY_PATH: [],
+            METRICS_HISTORY_PATH: [],
+        }
+        self._pending_entries = 0
+        self._last_flush_ts = time.monotonic()
+        self._flush_threshold_n = config.get("history_flush_entries", 32)
+        self._flush_threshold_s = config.get("history_flush_interval", 10.0)
+
+        # History files stay open for appending between flushes
+        self._history_files: Dict[str, io.BufferedWriter] = {}
+
+        # Set when the progress state changes after the last current_state.json
+        # was written, so unchanged state is never rewritten
+        self._dirty = True
+
+        # Last performance trends, keyed by (generation, metrics history length)
+        self._trends_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+
+        # Most recent win rates and training losses, kept as generations arrive
+        self._win_rate_window: Deque[float] = deque(maxlen=TREND_WINDOW)
+        self._loss_window: Deque[float] = deque(maxlen=TREND_WINDOW)
+
+        # Disk writes run on a background thread so saves never block training.
+        # It is the only writer of the history files and current_state.json.
+        self._save_queue: "queue.Queue[Optional[_SaveItem]]" = queue.Queue(
+            maxsize=SAVE_QUEUE_SIZE
+        )
+        self._save_thread = threading.Thread(
+            target=self._save_worker, name="progress-save", daemon=True
+        )
+        self._save_thread.start()
 
         # Create progress data directory with error handling
         try:
-            os.makedirs("progress_data", exist_ok=True)
+            os.makedirs(PROGRESS_DATA_DIR, exist_ok=True)
         except Exception as e:
             self.error_handler.handle_error(
                 error=e,
@@ -75,7 +218,10 @@ class ProgressManager:
 
         try:
             self.total_generations = total_generations
+            self._dirty = True
             self.cli_progress = CLIProgress(total_generations)
+            self._cli_update_generation = self.cli_progress.update_generation
+            self._cli_update_phase = self.cli_progress.update_phase
             print("📊 CLI progress tracking initialized")
 
         except Exception as e:
@@ -111,6 +257,8 @@ class ProgressManager:
 
         try:
             self.gui_progress = GUIProgress(visualization_manager)
+            self._gui_update_generation = self.gui_progress.update_generation
+            self._gui_update_phase = self.gui_progress.update_phase
             print("🎮 GUI progress tracking initialized")
 
         except Exception as e:
@@ -132,12 +280,14 @@ class ProgressManager:
             metrics: Dictionary of training metrics
         """
         self.current_generation = current
+        self._dirty = True
+        self._drain_pending_phase()
+        safe_metrics = metrics if metrics is not None else {}
 
         # Update CLI progress with error handling
-        if self.cli_progress:
+        if self._cli_update_generation is not None:
             try:
-                safe_metrics = metrics if metrics is not None else {}
-                self.cli_progress.update_generation(current, safe_metrics)
+                self._cli_update_generation(current, safe_metrics)
             except Exception as e:
                 self.error_handler.handle_error(
                     error=e,
@@ -151,10 +301,9 @@ class ProgressManager:
                 )
 
         # Update GUI progress with error handling
-        if self.gui_progress:
+        if self._gui_update_generation is not None:
             try:
-                safe_metrics = metrics if metrics is not None else {}
-                self.gui_progress.update_generation(current, safe_metrics)
+                self._gui_update_generation(current, safe_metrics)
             except Exception as e:
                 self.error_handler.handle_error(
                     error=e,
@@ -167,17 +316,21 @@ class ProgressManager:
                     },
                 )
 
-        # Store metrics for historical tracking
-        safe_metrics = metrics if metrics is not None else {}
+        # Store metrics for historical tracking (time.time() epoch seconds)
         metrics_entry = {
             "generation": current,
-            "timestamp": datetime.now().isoformat(),
+            "ts": time.time(),
             **safe_metrics,
         }
         self.metrics_history.append(metrics_entry)
-
-        # Save progress data periodically
-        if current % 5 == 0:  # Save every 5 generations
+        self._record_trend_values(metrics_entry)
+        self._trends_cache = None
+        self._pending_history[METRICS_HISTORY_PATH].append(metrics_entry)
+        self._pending_entries += 1
+
+        # Save progress data once enough has accumulated
+        if self._history_flush_due():
+            self._flush_history()
             self._save_progress_data()
 
     def update_phase_progress(self, phase: str, progress: float) -> None:
@@ -190,11 +343,37 @@ class ProgressManager:
         """
         self.current_phase = phase
         self.phase_progress = progress
+        self._dirty = True
+
+        # Coalesce rapid updates within a phase; the latest one is sent later
+        now = time.monotonic()
+        if (
+            phase == self._dispatched_phase
+            and progress < 1.0
+            and now - self._last_dispatch_ts < self.update_frequency
+        ):
+            self._pending_phase = (phase, progress)
+            return
+
+        self._dispatch_phase(phase, progress, now)
+
+    def _dispatch_phase(self, phase: str, progress: float, now: float) -> None:
+        """
+        Send a phase update to the CLI and GUI progress displays
+
+        Args:
+            phase: Name of the current phase
+            progress: Progress percentage (0.0 to 1.0)
+            now: time.monotonic() timestamp of the dispatch
+        """
+        self._pending_phase = None
+        self._dispatched_phase = phase
+        self._last_dispatch_ts = now
 
         # Update CLI progress with error handling
-        if self.cli_progress:
+        if self._cli_update_phase is not None:
             try:
-                self.cli_progress.update_phase(phase, progress)
+                self._cli_update_phase(phase, progress)
             except Exception as e:
                 self.error_handler.handle_error(
                     error=e,
@@ -209,9 +388,9 @@ class ProgressManager:
                 )
 
         # Update GUI progress with error handling
-        if self.gui_progress:
+        if self._gui_update_phase is not None:
             try:
-                self.gui_progress.update_phase(phase, progress)
+                self._gui_update_phase(phase, progress)
             except Exception as e:
                 self.error_handler.handle_error(
                     error=e,
@@ -225,6 +404,12 @@ class ProgressManager:
                     },
                 )
 
+    def _drain_pending_phase(self) -> None:
+        """Send a phase update held back by coalescing, if any"""
+        if self._pending_phase is not None:
+            phase, progress = self._pending_phase
+            self._dispatch_phase(phase, progress, time.monotonic())
+
     def display_generational_growth(
         self, historical_data: List[Dict[str, Any]]
     ) -> None:
@@ -236,6 +421,8 @@ class ProgressManager:
         """
         # Add to our historical data
         self.generation_history.extend(historical_data)
+        self._generation_history_total += len(historical_data)
+        self._queue_history(GENERATION_HISTORY_PATH, historical_data)
 
         # Display in CLI with error handling
         if self.cli_progress:
@@ -280,7 +467,7 @@ class ProgressManager:
                 self.current_generation / max(1, self.total_generations)
             )
             * 100,
-            "historical_data_points": len(self.generation_history),
+            "historical_data_points": self._generation_history_total,
         }
 
     def get_performance_trends(self) -> Dict[str, Any]:
@@ -288,24 +475,20 @@ class ProgressManager:
         if len(self.metrics_history) < 2:
             return {"trend": "insufficient_data"}
 
-        try:
-            # Get recent metrics
-            recent_metrics = self.metrics_history[-10:]  # Last 10 generations
+        # Trends only change when a generation's metrics arrive
+        cache_key = (self.current_generation, len(self.metrics_history))
+        if self._trends_cache is not None and self._trends_cache[0] == cache_key:
+            return self._trends_cache[1]
 
-            # Calculate trends
-            win_rates = [
-                m.get("win_rate", 0) for m in recent_metrics if "win_rate" in m
-            ]
-            training_losses = [
-                m.get("training_loss", 0)
-                for m in recent_metrics
-                if "training_loss" in m
-            ]
+        try:
+            # Calculate trends over the recent windows
+            win_rates = list(self._win_rate_window)
+            training_losses = list(self._loss_window)
 
             trends = {
                 "win_rate_trend": self._calculate_trend(win_rates),
                 "loss_trend": self._calculate_trend(training_losses),
-                "recent_generations": len(recent_metrics),
+                "recent_generations": min(TREND_WINDOW, len(self.metrics_history)),
                 "improvement_rate": 0.0,
             }
 
@@ -315,6 +498,7 @@ class ProgressManager:
                     win_rates
                 )
 
+            self._trends_cache = (cache_key, trends)
             return trends
 
         except Exception as e:
@@ -329,8 +513,12 @@ class ProgressManager:
 
     def cleanup(self) -> None:
         """Clean up progress tracking resources"""
-        # Save final progress data
+        # Show the latest phase progress and save final progress data
+        self._drain_pending_phase()
+        self._flush_history()
         self._save_progress_data()
+        self._stop_save_worker()
+        self._close_history_files()
 
         # Cleanup CLI progress with error handling
         if self.cli_progress:
@@ -360,18 +548,33 @@ class ProgressManager:
 
         print("📊 Progress tracking cleanup completed")
 
+    def _record_trend_values(self, metrics_entry: Dict[str, Any]) -> None:
+        """Add a generation's win rate and training loss to the trend windows"""
+        for key, window in (
+            ("win_rate", self._win_rate_window),
+            ("training_loss", self._loss_window),
+        ):
+            if key not in metrics_entry:
+                continue
+            # Values that are not numbers would break the trend fit; skip them
+            try:
+                window.append(float(metrics_entry[key]))
+            except (TypeError, ValueError):
+                pass
+
     def _calculate_trend(self, values: List[float]) -> str:
         """Calculate trend direction from a list of values"""
         if len(values) < 2:
             return "stable"
 
-        # Simple linear trend calculation
-        first_half = sum(values[: len(values) // 2]) / max(1, len(values) // 2)
-        second_half = sum(values[len(values) // 2 :]) / max(
-            1, len(values) - len(values) // 2
-        )
+        # Least-squares slope, scaled to the change across half the window
+        # (the difference between the two half means for a linear series)
+        y = np.asarray(values, dtype=np.float64)
+        x = np.arange(y.size, dtype=np.float64)
+        x -= x.mean()
+        slope = float(np.dot(x, y - y.mean()) / np.dot(x, x))
 
-        diff = second_half - first_half
+        diff = slope * y.size / 2
 
         if diff > 0.05:  # 5% improvement threshold
             return "improving"
@@ -382,20 +585,186 @@ class ProgressManager:
 
     def _load_historical_data(self) -> None:
         """Load historical progress data from disk"""
+        # Each history file is loaded on its own, so one unreadable file
+        # does not discard the others
+        self.generation_history, self._generation_history_total = (
+            self._load_history_file(
+                GENERATION_HISTORY_PATH, LEGACY_GENERATION_HISTORY_PATH
+            )
+        )
+
+        self.metrics_history, _ = self._load_history_file(
+            METRICS_HISTORY_PATH, LEGACY_METRICS_HISTORY_PATH
+        )
+        for metrics_entry in self.metrics_history:
+            self._record_trend_values(metrics_entry)
+
+        loaded = len(self.generation_history)
+        if loaded < self._generation_history_total:
+            print(
+                f"📈 Loaded last {loaded} of "
+                f"{self._generation_history_total} historical generations"
+            )
+        else:
+            print(f"📈 Loaded {loaded} historical generations")
+
+    def _load_history_file(
+        self, path: str, legacy_path: str
+    ) -> Tuple[Deque[Dict[str, Any]], int]:
+        """
+        Read one history, falling back to an empty one if it cannot be read
+
+        Args:
+            path: JSONL history file
+            legacy_path: JSON array file written by earlier versions
+
+        Returns:
+            Tuple of (recent entries oldest first, total entries in the file)
+        """
+        try:
+            return self._read_history(path, legacy_path)
+        except Exception as e:
+            self.error_handler.handle_error(
+                error=e,
+                category=ErrorCategory.FILE_IO,
+                severity=ErrorSeverity.LOW,
+                component="ProgressManager",
+                context={"operation": "load_historical_data", "path": path},
+            )
+            return deque(maxlen=self._history_limit), 0
+
+    def _read_history(
+        self, path: str, legacy_path: str
+    ) -> Tuple[Deque[Dict[str, Any]], int]:
+        """
+        Read the most recent entries of a JSONL history file
+
+        Only the last lines that fit in memory are decoded. Lines that fail to
+        decode, such as a line torn by a crash during a write, are skipped. A
+        history only found in the legacy JSON array format is copied into the
+        JSONL file, so later appends extend it rather than replace it.
+
+        Args:
+            path: JSONL history file
+            legacy_path: JSON array file written by earlier versions
+
+        Returns:
+            Tuple of (recent entries oldest first, total entries in the file)
+        """
+        recent_lines: Deque[bytes] = deque(maxlen=self._history_limit)
+        total = 0
+        try:
+            with open(path, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        recent_lines.append(line)
+                        total += 1
+        except FileNotFoundError:
+            pass
+        else:
+            entries: Deque[Dict[str, Any]] = deque(maxlen=self._history_limit)
+            skipped = 0
+            for line in recent_lines:
+                try:
+                    entry = _loads(line)
+                except ValueError:
+                    skipped += 1
+                    continue
+                if isinstance(entry, dict):
+                    entries.append(_normalize_timestamp(entry))
+                else:
+                    skipped += 1
+            if skipped:
+                print(f"⚠️ Skipped {skipped} unreadable lines in {path}")
+            return entries, total - skipped
+
         try:
-            # Load generation history
-            gen_history_path = "progress_data/generation_history.json"
-            if os.path.exists(gen_history_path):
-                with open(gen_history_path, "r") as f:
-                    self.generation_history = json.load(f)
+            with open(legacy_path, "rb") as f:
+                legacy_entries = _loads(f.read())
+        except FileNotFoundError:
+            pass
+        else:
+            legacy_entries = [
+                _normalize_timestamp(entry)
+                for entry in legacy_entries
+                if isinstance(entry, dict)
+            ]
+            self._queue_history(path, legacy_entries)
+            self._flush_history()
+            entries = deque(legacy_entries, maxlen=self._history_limit)
+            return entries, len(legacy_entries)
+
+        return deque(maxlen=self._history_limit), 0
+
+    def _queue_history(self, path: str, entries: List[Dict[str, Any]]) -> None:
+        """
+        Buffer new history entries until the next flush
+
+        Args:
+            path: JSONL history file
+            entries: New history entries
+        """
+        self._pending_history[path].extend(entries)
+        self._pending_entries += len(entries)
+
+    def _history_flush_due(self) -> bool:
+        """Check whether enough entries or time have accumulated to flush"""
+        if not self._pending_entries:
+            return False
+        return (
+            self._pending_entries >= self._flush_threshold_n
+            or time.monotonic() - self._last_flush_ts >= self._flush_threshold_s
+        )
+
+    def _flush_history(self) -> None:
+        """Hand all buffered history entries to the save thread"""
+        for path in list(self._pending_history):
+            entries = self._pending_history[path]
+            if entries:
+                self._submit_save(self._append_history, path, entries)
+                self._pending_history[path] = []
+        self._submit_save(self._flush_history_files)
+
+        self._pending_entries = 0
+        self._last_flush_ts = time.monotonic()
+
+    def _append_history(self, path: str, entries: List[Dict[str, Any]]) -> None:
+        """
+        Append entries to a JSONL history file
 
-            # Load metrics history
-            metrics_history_path = "progress_data/metrics_history.json"
-            if os.path.exists(metrics_history_path):
-                with open(metrics_history_path, "r") as f:
-                    self.metrics_history = json.load(f)
+        Args:
+            path: JSONL history file
+            entries: New history entries
+        """
+        if not entries:
+            return
+
+        # Entries are encoded one by one so a bad record only loses itself
+        lines = []
+        for entry in entries:
+            try:
+                lines.append(_dumps(entry) + b"\n")
+            except (TypeError, ValueError) as e:
+                self.error_handler.handle_error(
+                    error=e,
+                    category=ErrorCategory.FILE_IO,
+                    severity=ErrorSeverity.LOW,
+                    component="ProgressManager",
+                    context={"operation": "encode_history_entry", "path": path},
+                )
+        if not lines:
+            return
 
-            print(f"📈 Loaded {len(self.generation_history)} historical generations")
+        try:
+            history_file = self._history_files.get(path)
+            if history_file is None:
+                needs_newline = not _ends_with_newline(path)
+                history_file = open(path, "ab", buffering=HISTORY_WRITE_BUFFER_SIZE)
+                self._history_files[path] = history_file
+                if needs_newline:
+                    # Close off a line torn by an interrupted write
+                    history_file.write(b"\n")
+            history_file.write(b"".join(lines))
 
         except Exception as e:
             self.error_handler.handle_error(
@@ -403,10 +772,43 @@ class ProgressManager:
                 category=ErrorCategory.FILE_IO,
                 severity=ErrorSeverity.LOW,
                 component="ProgressManager",
-                context={"operation": "load_historical_data"},
+                context={"operation": "append_history", "path": path},
             )
-            self.generation_history = []
-            self.metrics_history = []
+
+    def _flush_history_files(self) -> None:
+        """Push buffered history lines from the open files to disk"""
+        for history_file in self._history_files.values():
+            history_file.flush()
+
+    def _close_history_files(self) -> None:
+        """Flush and close the open history files"""
+        for history_file in self._history_files.values():
+            try:
+                history_file.close()
+            except OSError as e:
+                self.error_handler.handle_error(
+                    error=e,
+                    category=ErrorCategory.FILE_IO,
+                    severity=ErrorSeverity.LOW,
+                    component="ProgressManager",
+                    context={"operation": "close_history_file"},
+                )
+        self._history_files.clear()
+
+    def _save_progress_data(self) -> None:
+        """Queue the current progress state snapshot to be saved to disk"""
+        if not self._dirty:
+            return
+
+        current_state = {
+            "current_generation": self.current_generation,
+            "total_generations": self.total_generations,
+            "current_phase": self.current_phase,
+            "phase_progress": self.phase_progress,
+            "last_updated": datetime.now().isoformat(),
+        }
+        self._submit_save(self._write_progress_state, current_state)
+        self._dirty = False
 
     @handle_errors(
         category=ErrorCategory.FILE_IO,
@@ -416,31 +818,20 @@ class ProgressManager:
         max_retries=2,
         suppress_errors=True,
     )
-    def _save_progress_data(self) -> None:
-        """Save progress data to disk"""
-        try:
-            # Save generation history
-            gen_history_path = "progress_data/generation_history.json"
-            with open(gen_history_path, "w") as f:
-                json.dump(self.generation_history, f, indent=2)
-
-            # Save metrics history
-            metrics_history_path = "progress_data/metrics_history.json"
-            with open(metrics_history_path, "w") as f:
-                json.dump(self.metrics_history, f, indent=2)
-
-            # Save current state
-            state_path = "progress_data/current_state.json"
-            current_state = {
-                "current_generation": self.current_generation,
-                "total_generations": self.total_generations,
-                "current_phase": self.current_phase,
-                "phase_progress": self.phase_progress,
-                "last_updated": datetime.now().isoformat(),
-            }
+    def _write_progress_state(self, current_state: Dict[str, Any]) -> None:
+        """
+        Write a progress state snapshot to current_state.json
 
-            with open(state_path, "w") as f:
-                json.dump(current_state, f, indent=2)
+        Args:
+            current_state: Progress state to save
+        """
+        try:
+            # Swap in a fully written temp file so readers never see partial data
+            data = _dumps(current_state)
+            tmp_path = CURRENT_STATE_PATH + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, CURRENT_STATE_PATH)
 
         except Exception as e:
             self.error_handler.handle_error(
@@ -451,6 +842,47 @@ class ProgressManager:
                 context={"operation": "save_progress_data"},
             )
 
+    def _submit_save(self, write: Callable[..., None], *args: Any) -> None:
+        """
+        Queue a disk write for the save thread
+
+        Blocks while the queue is full. Once the thread has stopped, the
+        write runs immediately on the calling thread instead.
+
+        Args:
+            write: Method performing the write
+            *args: Arguments for the write
+        """
+        if self._save_thread.is_alive():
+            self._save_queue.put((write, args))
+        else:
+            write(*args)
+
+    def _save_worker(self) -> None:
+        """Run queued disk writes in order until the stop sentinel arrives"""
+        while True:
+            item = self._save_queue.get()
+            if item is None:
+                break
+
+            write, args = item
+            try:
+                write(*args)
+            except Exception as e:
+                self.error_handler.handle_error(
+                    error=e,
+                    category=ErrorCategory.FILE_IO,
+                    severity=ErrorSeverity.LOW,
+                    component="ProgressManager",
+                    context={"operation": "background_save"},
+                )
+
+    def _stop_save_worker(self) -> None:
+        """Let the save thread finish its queued writes, then stop it"""
+        if self._save_thread.is_alive():
+            self._save_queue.put(None)
+            self._save_thread.join()
+
     def __enter__(self):
         """Context manager entry"""
         return self
@@ -3,7 +3,24 @@ Captured Pieces Renderer - Displays captured pieces for each player
 """
 
 import pygame
-from typing import List, Dict, Any, Tuple
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+
+
+@lru_cache(maxsize=32)
+def _get_font(name: Optional[str], size: int, bold: bool = False) -> pygame.font.Font:
+    """Get a font shared by all renderers, falling back to pygame's default font"""
+    try:
+        if name:
+            return pygame.font.SysFont(name, size, bold=bold)
+        return pygame.font.Font(None, size)
+    except Exception:
+        return pygame.font.Font(None, size)
+
+
+# Cached fonts are invalid once pygame shuts down
+pygame.register_quit(_get_font.cache_clear)
 
 
 class CapturedPiecesRenderer:
@@ -21,6 +38,20 @@ class CapturedPiecesRenderer:
         "black_man": "⚫", "black_king": "♛"
     }
     
+    # Chess piece symbols by (color, kind) of "color_kind" piece names
+    CHESS_COLOR_KIND_SYMBOLS = {
+        ("white", "pawn"): "♙", ("white", "rook"): "♖", ("white", "knight"): "♘",
+        ("white", "bishop"): "♗", ("white", "queen"): "♕", ("white", "king"): "♔",
+        ("black", "pawn"): "♟", ("black", "rook"): "♜", ("black", "knight"): "♞",
+        ("black", "bishop"): "♝", ("black", "queen"): "♛", ("black", "king"): "♚",
+    }
+    
+    # Captured piece names and symbol keys resolved with a single lookup
+    CHESS_NAME_SYMBOLS = {
+        **{f"{color}_{kind}": symbol for (color, kind), symbol in CHESS_COLOR_KIND_SYMBOLS.items()},
+        **PIECE_SYMBOLS,
+    }
+    
     # Piece values for material advantage calculation
     PIECE_VALUES = {
         "pawn": 1, "knight": 3, "bishop": 3, "rook": 5, "queen": 9, "king": 0,
@@ -37,20 +68,80 @@ class CapturedPiecesRenderer:
     BLUE = (0, 0, 200)
     GOLD = (255, 215, 0)
     
+    PANEL_MARGIN = 8  # Room around cached panels for the advantage box outline
+    PANEL_CACHE_SIZE = 8
+    
     def __init__(self, piece_size: int = 30):
         self.piece_size = piece_size
         self.spacing = 5
         
         # Initialize fonts
+        self.piece_font = _get_font("segoeuisymbol", piece_size)
+        self.label_font = _get_font("arial", 16, bold=True)
+        self.value_font = _get_font("arial", 14)
+        
+        # Pre-rendered surfaces, rebuilt whenever the fonts or piece size change
+        self._glyph_cache: Dict[str, Tuple[pygame.Surface, Tuple[int, int]]] = {}
+        self._text_cache: Dict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface] = {}
+        self._tile_surface = None
+        self._area_bg_cache: Dict[Tuple[str, int, int], pygame.Surface] = {}
+        
+        # (surface, position) blit lists refilled by every grid draw
+        self._tile_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self._glyph_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self._panel_cache: "OrderedDict[tuple, Tuple[pygame.Surface, int]]" = OrderedDict()
+        
+        # Capture lists and settings of the last panel drawn, checked before the cache key
+        self._last_panel_inputs = None
+        self._last_panel = None
+        
+        self._build_piece_cache()
+    
+    @staticmethod
+    def _to_display_format(surface: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+        """Convert a cached surface to the display pixel format for faster blits"""
         try:
-            self.piece_font = pygame.font.SysFont("segoeuisymbol", piece_size)
-            self.label_font = pygame.font.SysFont("arial", 16, bold=True)
-            self.value_font = pygame.font.SysFont("arial", 14)
-        except Exception:
-            # Fallback fonts
-            self.piece_font = pygame.font.Font(None, piece_size)
-            self.label_font = pygame.font.Font(None, 16)
-            self.value_font = pygame.font.Font(None, 14)
+            return surface.convert_alpha() if alpha else surface.convert()
+        except pygame.error:
+            # No display mode set yet
+            return surface
+    
+    def _build_piece_cache(self) -> None:
+        """Pre-render the piece tile and all known piece symbols at the current size"""
+        self._glyph_cache.clear()
+        self._text_cache.clear()
+        self._area_bg_cache.clear()
+        self._panel_cache.clear()
+        self._last_panel_inputs = None
+        self._last_panel = None
+        
+        tile = pygame.Surface((self.piece_size, self.piece_size))
+        tile.fill(self.WHITE_COL)
+        pygame.draw.rect(tile, self.BLACK_COL, tile.get_rect(), 1)
+        self._tile_surface = self._to_display_format(tile, alpha=False)
+        
+        for symbol in list(self.PIECE_SYMBOLS.values()) + list(self.CHECKERS_SYMBOLS.values()):
+            self._get_glyph(symbol)
+    
+    def _get_glyph(self, symbol: str) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Get a rendered piece symbol and its offset for centering it on a tile"""
+        glyph = self._glyph_cache.get(symbol)
+        if glyph is None:
+            surface = self._to_display_format(self.piece_font.render(symbol, True, self.BLACK_COL))
+            half = self.piece_size // 2
+            offset = (half - surface.get_width() // 2, half - surface.get_height() // 2)
+            glyph = self._glyph_cache[symbol] = (surface, offset)
+        return glyph
+    
+    def _render_text(self, font: pygame.font.Font, text: str,
+                     color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render antialiased text, reusing the surface from earlier identical renders"""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self._to_display_format(font.render(text, True, color))
+            self._text_cache[key] = surface
+        return surface
     
     def draw_captured_area(self, screen: pygame.Surface, pieces: List[str], 
                           x: int, y: int, color: str, game_type: str = "chess") -> int:
@@ -71,17 +162,15 @@ class CapturedPiecesRenderer:
         try:
             # Draw background area
             area_width = 200
-            area_height = max(80, len(pieces) * (self.piece_size + self.spacing) // 6 + 60)
+            area_height = self._get_area_height(pieces)
             
             # Background
-            bg_color = self.LIGHT_GRAY if color == "white" else self.DARK_GRAY
-            pygame.draw.rect(screen, bg_color, (x, y, area_width, area_height))
-            pygame.draw.rect(screen, self.BLACK_COL, (x, y, area_width, area_height), 2)
+            screen.blit(self._get_area_background(color, area_width, area_height), (x, y))
             
             # Title
             title_text = f"{color.title()} Captured"
             title_color = self.BLACK_COL if color == "white" else self.WHITE_COL
-            title_surface = self.label_font.render(title_text, True, title_color)
+            title_surface = self._render_text(self.label_font, title_text, title_color)
             screen.blit(title_surface, (x + 5, y + 5))
             
             # Draw pieces
@@ -92,12 +181,12 @@ class CapturedPiecesRenderer:
                 # Calculate and display material advantage
                 material_value = self._calculate_material_value(pieces, game_type)
                 value_text = f"Material: {material_value}"
-                value_surface = self.value_font.render(value_text, True, title_color)
+                value_surface = self._render_text(self.value_font, value_text, title_color)
                 screen.blit(value_surface, (x + 5, y + area_height - 20))
             else:
                 # No pieces captured
                 no_pieces_text = "No pieces captured"
-                no_pieces_surface = self.value_font.render(no_pieces_text, True, title_color)
+                no_pieces_surface = self._render_text(self.value_font, no_pieces_text, title_color)
                 text_rect = no_pieces_surface.get_rect(center=(x + area_width // 2, y + area_height // 2))
                 screen.blit(no_pieces_surface, text_rect)
             
@@ -111,114 +200,142 @@ class CapturedPiecesRenderer:
             screen.blit(error_surface, (x, y))
             return 30
     
+    def _get_area_background(self, color: str, width: int, height: int) -> pygame.Surface:
+        """Get a cached captured area background with its border drawn in"""
+        key = (color, width, height)
+        background = self._area_bg_cache.get(key)
+        if background is None:
+            background = pygame.Surface((width, height))
+            background.fill(self.LIGHT_GRAY if color == "white" else self.DARK_GRAY)
+            pygame.draw.rect(background, self.BLACK_COL, background.get_rect(), 2)
+            background = self._area_bg_cache[key] = self._to_display_format(background, alpha=False)
+        return background
+    
+    def _get_area_height(self, pieces: List[str]) -> int:
+        """Get the height of a captured pieces area"""
+        return max(80, len(pieces) * (self.piece_size + self.spacing) // 6 + 60)
+    
     def _draw_pieces_grid(self, screen: pygame.Surface, pieces: List[str], 
                          x: int, y: int, width: int, game_type: str) -> int:
         """Draw pieces in a grid layout"""
-        try:
-            pieces_per_row = max(1, width // (self.piece_size + self.spacing))
-            current_x = x
-            current_y = y
-            pieces_in_row = 0
-            
-            # Group pieces by type for better display
-            piece_counts = {}
-            for piece in pieces:
-                piece_counts[piece] = piece_counts.get(piece, 0) + 1
-            
-            # Draw grouped pieces
-            for piece_type, count in piece_counts.items():
-                for i in range(count):
-                    if pieces_in_row >= pieces_per_row:
-                        current_x = x
-                        current_y += self.piece_size + self.spacing
-                        pieces_in_row = 0
-                    
-                    self._draw_single_piece(screen, piece_type, current_x, current_y, game_type)
-                    
-                    current_x += self.piece_size + self.spacing
-                    pieces_in_row += 1
-            
-            return (current_y - y) + self.piece_size
-            
-        except Exception as e:
-            print(f"⚠️ Error drawing pieces grid: {e}")
-            return 0
-    
-    def _draw_single_piece(self, screen: pygame.Surface, piece: str, 
-                          x: int, y: int, game_type: str) -> None:
-        """Draw a single captured piece"""
-        try:
+        pieces_per_row = max(1, width // (self.piece_size + self.spacing))
+        current_x = x
+        current_y = y
+        pieces_in_row = 0
+        
+        # Collected (surface, position) pairs, drawn with one blits call each
+        tile_blits = self._tile_blits
+        glyph_blits = self._glyph_blits
+        tile_blits.clear()
+        glyph_blits.clear()
+        
+        # Group pieces by type for better display, largest groups first
+        piece_counts = Counter(pieces)
+        
+        # Draw grouped pieces, resolving each piece type's symbol once
+        for piece_type, count in piece_counts.most_common():
             if game_type == "chess":
-                symbol = self._get_chess_symbol(piece)
+                symbol = self._get_chess_symbol(piece_type)
             else:
-                symbol = self._get_checkers_symbol(piece)
-            
+                symbol = self._get_checkers_symbol(piece_type)
             if symbol:
-                # Draw piece background
-                piece_bg = pygame.Rect(x, y, self.piece_size, self.piece_size)
-                pygame.draw.rect(screen, self.WHITE_COL, piece_bg)
-                pygame.draw.rect(screen, self.BLACK_COL, piece_bg, 1)
-                
-                # Draw piece symbol
-                piece_surface = self.piece_font.render(symbol, True, self.BLACK_COL)
-                piece_rect = piece_surface.get_rect(center=piece_bg.center)
-                screen.blit(piece_surface, piece_rect)
+                glyph, (offset_x, offset_y) = self._get_glyph(symbol)
             
-        except Exception as e:
-            print(f"⚠️ Error drawing single piece: {e}")
+            for i in range(count):
+                if pieces_in_row >= pieces_per_row:
+                    current_x = x
+                    current_y += self.piece_size + self.spacing
+                    pieces_in_row = 0
+                
+                if symbol:
+                    tile_blits.append((self._tile_surface, (current_x, current_y)))
+                    glyph_blits.append((glyph, (current_x + offset_x, current_y + offset_y)))
+                
+                current_x += self.piece_size + self.spacing
+                pieces_in_row += 1
+        
+        # Tiles never overlap, so all tiles can go down before the symbols
+        if tile_blits:
+            screen.blits(tile_blits, doreturn=False)
+            screen.blits(glyph_blits, doreturn=False)
+            tile_blits.clear()
+            glyph_blits.clear()
+        
+        return (current_y - y) + self.piece_size
     
     def _get_chess_symbol(self, piece: str) -> str:
         """Get chess piece symbol"""
-        # Handle different piece name formats
+        symbol = self.CHESS_NAME_SYMBOLS.get(piece)
+        if symbol is None:
+            # Other casings of "color_kind" names, then any other format
+            color, _, kind = piece.partition("_")
+            symbol = self.CHESS_COLOR_KIND_SYMBOLS.get((color.lower(), kind.lower()))
+            if symbol is None:
+                symbol = self._match_chess_symbol(piece)
+        return symbol
+    
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _match_chess_symbol(cls, piece: str) -> str:
+        """Match a chess piece symbol from any piece name format"""
         piece_lower = piece.lower()
         
         # Map common piece names to symbols
         if "white" in piece_lower:
             if "pawn" in piece_lower:
-                return self.PIECE_SYMBOLS["P"]
+                return cls.PIECE_SYMBOLS["P"]
             elif "rook" in piece_lower:
-                return self.PIECE_SYMBOLS["R"]
+                return cls.PIECE_SYMBOLS["R"]
             elif "knight" in piece_lower:
-                return self.PIECE_SYMBOLS["N"]
+                return cls.PIECE_SYMBOLS["N"]
             elif "bishop" in piece_lower:
-                return self.PIECE_SYMBOLS["B"]
+                return cls.PIECE_SYMBOLS["B"]
             elif "queen" in piece_lower:
-                return self.PIECE_SYMBOLS["Q"]
+                return cls.PIECE_SYMBOLS["Q"]
             elif "king" in piece_lower:
-                return self.PIECE_SYMBOLS["K"]
+                return cls.PIECE_SYMBOLS["K"]
         elif "black" in piece_lower:
             if "pawn" in piece_lower:
-                return self.PIECE_SYMBOLS["p"]
+                return cls.PIECE_SYMBOLS["p"]
             elif "rook" in piece_lower:
-                return self.PIECE_SYMBOLS["r"]
+                return cls.PIECE_SYMBOLS["r"]
             elif "knight" in piece_lower:
-                return self.PIECE_SYMBOLS["n"]
+                return cls.PIECE_SYMBOLS["n"]
             elif "bishop" in piece_lower:
-                return self.PIECE_SYMBOLS["b"]
+                return cls.PIECE_SYMBOLS["b"]
             elif "queen" in piece_lower:
-                return self.PIECE_SYMBOLS["q"]
+                return cls.PIECE_SYMBOLS["q"]
             elif "king" in piece_lower:
-                return self.PIECE_SYMBOLS["k"]
+                return cls.PIECE_SYMBOLS["k"]
         
         # Try direct symbol lookup
-        return self.PIECE_SYMBOLS.get(piece, "?")
+        return cls.PIECE_SYMBOLS.get(piece, "?")
     
     def _get_checkers_symbol(self, piece: str) -> str:
         """Get checkers piece symbol"""
+        symbol = self.CHECKERS_SYMBOLS.get(piece)
+        if symbol is None:
+            symbol = self._match_checkers_symbol(piece)
+        return symbol
+    
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _match_checkers_symbol(cls, piece: str) -> str:
+        """Match a checkers piece symbol from any piece name format"""
         piece_lower = piece.lower()
         
         if "white" in piece_lower:
             if "king" in piece_lower:
-                return self.CHECKERS_SYMBOLS["white_king"]
+                return cls.CHECKERS_SYMBOLS["white_king"]
             else:
-                return self.CHECKERS_SYMBOLS["white_man"]
+                return cls.CHECKERS_SYMBOLS["white_man"]
         elif "black" in piece_lower:
             if "king" in piece_lower:
-                return self.CHECKERS_SYMBOLS["black_king"]
+                return cls.CHECKERS_SYMBOLS["black_king"]
             else:
-                return self.CHECKERS_SYMBOLS["black_man"]
+                return cls.CHECKERS_SYMBOLS["black_man"]
         
-        return self.CHECKERS_SYMBOLS.get(piece, "?")
+        return cls.CHECKERS_SYMBOLS.get(piece, "?")
     
     def calculate_material_advantage(self, white_pieces: List[str], 
                                    black_pieces: List[str], game_type: str = "chess") -> int:
@@ -246,34 +363,36 @@ class CapturedPiecesRenderer:
     
     def _calculate_material_value(self, pieces: List[str], game_type: str) -> int:
         """Calculate total material value of captured pieces"""
-        try:
-            total_value = 0
-            
-            for piece in pieces:
-                piece_lower = piece.lower()
-                
-                if game_type == "chess":
-                    if "pawn" in piece_lower:
-                        total_value += self.PIECE_VALUES["pawn"]
-                    elif "knight" in piece_lower or "bishop" in piece_lower:
-                        total_value += self.PIECE_VALUES["knight"]  # Both worth 3
-                    elif "rook" in piece_lower:
-                        total_value += self.PIECE_VALUES["rook"]
-                    elif "queen" in piece_lower:
-                        total_value += self.PIECE_VALUES["queen"]
-                    elif "king" in piece_lower:
-                        total_value += self.PIECE_VALUES["king"]
-                else:  # checkers
-                    if "king" in piece_lower:
-                        total_value += self.PIECE_VALUES["king"]  # Checkers king
-                    else:
-                        total_value += self.PIECE_VALUES["man"]
-            
-            return total_value
+        # Capture lists only change on captures, so most frames hit the cache
+        return self._material_value(tuple(pieces), game_type)
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _material_value(cls, pieces: Tuple[str, ...], game_type: str) -> int:
+        """Calculate total material value of a captured pieces tuple"""
+        total_value = 0
+        
+        for piece in pieces:
+            piece_lower = piece.lower()
             
-        except Exception as e:
-            print(f"⚠️ Error calculating material value: {e}")
-            return 0
+            if game_type == "chess":
+                if "pawn" in piece_lower:
+                    total_value += cls.PIECE_VALUES["pawn"]
+                elif "knight" in piece_lower or "bishop" in piece_lower:
+                    total_value += cls.PIECE_VALUES["knight"]  # Both worth 3
+                elif "rook" in piece_lower:
+                    total_value += cls.PIECE_VALUES["rook"]
+                elif "queen" in piece_lower:
+                    total_value += cls.PIECE_VALUES["queen"]
+                elif "king" in piece_lower:
+                    total_value += cls.PIECE_VALUES["king"]
+            else:  # checkers
+                if "king" in piece_lower:
+                    total_value += cls.PIECE_VALUES["king"]  # Checkers king
+                else:
+                    total_value += cls.PIECE_VALUES["man"]
+        
+        return total_value
     
     def draw_advantage_indicator(self, screen: pygame.Surface, advantage: int, 
                                x: int, y: int, game_type: str = "chess") -> None:
@@ -302,7 +421,7 @@ class CapturedPiecesRenderer:
                 color = self.RED
             
             # Draw background
-            text_surface = self.label_font.render(text, True, color)
+            text_surface = self._render_text(self.label_font, text, color)
             text_rect = text_surface.get_rect()
             text_rect.x = x
             text_rect.y = y
@@ -338,19 +457,23 @@ class CapturedPiecesRenderer:
         try:
             panel_width = 220
             
-            # Draw white captured pieces (captured by black)
-            white_height = self.draw_captured_area(screen, white_captured, x, y, "white", game_type)
-            
-            # Draw black captured pieces (captured by white)
-            black_y = y + white_height + 10
-            black_height = self.draw_captured_area(screen, black_captured, x, black_y, "black", game_type)
-            
-            # Draw material advantage indicator
-            advantage = self.calculate_material_advantage(white_captured, black_captured, game_type)
-            advantage_y = black_y + black_height + 10
-            self.draw_advantage_indicator(screen, advantage, x, advantage_y, game_type)
+            # Capture lists are only appended to, so the same list objects at the
+            # same lengths as last frame mean the panel is unchanged
+            last_inputs = self._last_panel_inputs
+            if (last_inputs is not None and
+                    last_inputs[0] is white_captured and last_inputs[1] == len(white_captured) and
+                    last_inputs[2] is black_captured and last_inputs[3] == len(black_captured) and
+                    last_inputs[4:] == (game_type, self.piece_size)):
+                cached_panel = self._last_panel
+            else:
+                cached_panel = self._get_panel(white_captured, black_captured, panel_width, game_type)
+                self._last_panel_inputs = (white_captured, len(white_captured),
+                                           black_captured, len(black_captured),
+                                           game_type, self.piece_size)
+                self._last_panel = cached_panel
             
-            total_height = white_height + black_height + 50  # Extra space for advantage indicator
+            panel_surface, total_height = cached_panel
+            screen.blit(panel_surface, (x - self.PANEL_MARGIN, y - self.PANEL_MARGIN))
             
             return panel_width, total_height
             
@@ -358,6 +481,53 @@ class CapturedPiecesRenderer:
             print(f"⚠️ Error drawing captured pieces panel: {e}")
             return 220, 100  # Fallback dimensions
     
+    def _get_panel(self, white_captured: List[str], black_captured: List[str],
+                   panel_width: int, game_type: str) -> Tuple[pygame.Surface, int]:
+        """Get a captured pieces panel from the cache, drawing it on a miss"""
+        # The panel only changes on captures, so reuse the surface drawn earlier
+        key = (tuple(white_captured), tuple(black_captured), game_type, self.piece_size)
+        cached_panel = self._panel_cache.get(key)
+        if cached_panel is None:
+            cached_panel = self._render_panel(white_captured, black_captured, panel_width, game_type)
+            self._panel_cache[key] = cached_panel
+            if len(self._panel_cache) > self.PANEL_CACHE_SIZE:
+                self._panel_cache.popitem(last=False)
+        else:
+            self._panel_cache.move_to_end(key)
+        return cached_panel
+    
+    def _render_panel(self, white_captured: List[str], black_captured: List[str],
+                      panel_width: int, game_type: str) -> Tuple[pygame.Surface, int]:
+        """
+        Draw the captured pieces panel onto its own surface
+        
+        The panel is drawn PANEL_MARGIN pixels in from the surface's top-left corner.
+        
+        Returns:
+            Tuple of (panel surface, panel height)
+        """
+        margin = self.PANEL_MARGIN
+        expected_height = (self._get_area_height(white_captured) +
+                           self._get_area_height(black_captured) + 50)
+        surface = pygame.Surface((panel_width + 2 * margin, expected_height + 2 * margin),
+                                 pygame.SRCALPHA)
+        
+        # Draw white captured pieces (captured by black)
+        white_height = self.draw_captured_area(surface, white_captured, margin, margin, "white", game_type)
+        
+        # Draw black captured pieces (captured by white)
+        black_y = margin + white_height + 10
+        black_height = self.draw_captured_area(surface, black_captured, margin, black_y, "black", game_type)
+        
+        # Draw material advantage indicator
+        advantage = self.calculate_material_advantage(white_captured, black_captured, game_type)
+        advantage_y = black_y + black_height + 10
+        self.draw_advantage_indicator(surface, advantage, margin, advantage_y, game_type)
+        
+        total_height = white_height + black_height + 50  # Extra space for advantage indicator
+        
+        return self._to_display_format(surface), total_height
+    
     def adapt_to_window_size(self, window_width: int, window_height: int) -> None:
         """
         Adapt captured pieces display to window size
@@ -378,16 +548,12 @@ class CapturedPiecesRenderer:
                 self.piece_size = 35
                 self.spacing = 6
             
-            # Recreate fonts with new size
-            try:
-                self.piece_font = pygame.font.SysFont("segoeuisymbol", self.piece_size)
-                self.label_font = pygame.font.SysFont("arial", max(14, self.piece_size // 2), bold=True)
-                self.value_font = pygame.font.SysFont("arial", max(12, self.piece_size // 3))
-            except Exception:
-                # Fallback fonts
-                self.piece_font = pygame.font.Font(None, self.piece_size)
-                self.label_font = pygame.font.Font(None, max(14, self.piece_size // 2))
-                self.value_font = pygame.font.Font(None, max(12, self.piece_size // 3))
+            # Switch to fonts for the new size
+            self.piece_font = _get_font("segoeuisymbol", self.piece_size)
+            self.label_font = _get_font("arial", max(14, self.piece_size // 2), bold=True)
+            self.value_font = _get_font("arial", max(12, self.piece_size // 3))
+            
+            self._build_piece_cache()
             
         except Exception as e:
             print(f"⚠️ Error adapting to window size: {e}")
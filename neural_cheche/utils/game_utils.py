@@ -2,11 +2,42 @@
 Game utility functions
 """
 
+from functools import lru_cache
+
 import chess
 import draughts
 import numpy as np
 
 
+def _count_draughts_pieces(pieces):
+    """Count (player1_pieces, player2_pieces, player1_kings, player2_kings) in one pass"""
+    player1_pieces = player2_pieces = player1_kings = player2_kings = 0
+    for p in pieces:
+        if p.player == 1:
+            player1_pieces += 1
+            if p.king:
+                player1_kings += 1
+        elif p.player == 2:
+            player2_pieces += 1
+            if p.king:
+                player2_kings += 1
+    return player1_pieces, player2_pieces, player1_kings, player2_kings
+
+
+def _chess_material(board):
+    """Material balance (white minus black) from piece bitboard popcounts"""
+    white = board.occupied_co[chess.WHITE]
+    black = board.occupied_co[chess.BLACK]
+    popcount = chess.popcount
+    return (
+        (popcount(board.pawns & white) - popcount(board.pawns & black))
+        + (popcount(board.knights & white) - popcount(board.knights & black)) * 3
+        + (popcount(board.bishops & white) - popcount(board.bishops & black)) * 3
+        + (popcount(board.rooks & white) - popcount(board.rooks & black)) * 5
+        + (popcount(board.queens & white) - popcount(board.queens & black)) * 9
+    )
+
+
 def get_reward(board, game_type):
     """Enhanced reward function with penalty rules for better AI learning"""
     if game_type == "chess":
@@ -16,10 +47,7 @@ def get_reward(board, game_type):
         # Penalty rules for poor endgame play
         if board.is_stalemate() or board.is_insufficient_material() or board.is_seventyfive_moves():
             # Calculate material advantage
-            material = sum(
-                (len(board.pieces(pt, chess.WHITE)) - len(board.pieces(pt, chess.BLACK))) * val
-                for pt, val in [(chess.PAWN, 1), (chess.KNIGHT, 3), (chess.BISHOP, 3), (chess.ROOK, 5), (chess.QUEEN, 9)]
-            )
+            material = _chess_material(board)
             
             # Penalty for stalemating when winning
             if abs(material) > 5:  # Significant material advantage
@@ -29,10 +57,7 @@ def get_reward(board, game_type):
         
         # Penalty for repetition when winning
         if board.is_fivefold_repetition():
-            material = sum(
-                (len(board.pieces(pt, chess.WHITE)) - len(board.pieces(pt, chess.BLACK))) * val
-                for pt, val in [(chess.PAWN, 1), (chess.KNIGHT, 3), (chess.BISHOP, 3), (chess.ROOK, 5), (chess.QUEEN, 9)]
-            )
+            material = _chess_material(board)
             if abs(material) > 3:  # Penalty for repetition with advantage
                 penalty = -0.5 if material > 0 else 0.5
                 return penalty if board.turn == chess.WHITE else -penalty
@@ -46,11 +71,9 @@ def get_reward(board, game_type):
             return 1 if winner == 1 else -1 if winner == 2 else 0
         
         # Evaluate position based on piece count and advancement
-        pieces = board.get_pieces()
-        player1_pieces = len([p for p in pieces if p.player == 1])
-        player2_pieces = len([p for p in pieces if p.player == 2])
-        player1_kings = len([p for p in pieces if p.player == 1 and p.king])
-        player2_kings = len([p for p in pieces if p.player == 2 and p.king])
+        player1_pieces, player2_pieces, player1_kings, player2_kings = (
+            _count_draughts_pieces(board.get_pieces())
+        )
         
         # Enhanced positional evaluation
         piece_advantage = (player1_pieces - player2_pieces) + 2 * (player1_kings - player2_kings)
@@ -77,6 +100,8 @@ def analyze_game_patterns(experiences, game_type):
     }
     
     # Analyze move quality based on policy confidence
+    confidences = np.empty(len(experiences))
+    count = 0
     for experience in experiences:
         _, policy_str, reward, _ = experience[:4]  # Unpack safely, ignore unused vars
         # Parse policy string to get move probabilities
@@ -86,44 +111,64 @@ def analyze_game_patterns(experiences, game_type):
                 policy_confidence = len(policy_str) / 100  # Simplified metric
             else:
                 policy_confidence = len(str(policy_str)) / 100  # Simplified metric
-            analysis['move_quality_distribution'].append(policy_confidence)
+            confidences[count] = policy_confidence
+            count += 1
         except Exception:
             # More specific exception handling
             continue
     
+    confidences = confidences[:count]
+    analysis['move_quality_distribution'] = confidences.tolist()
+    
     # Calculate strategic insights
-    if analysis['move_quality_distribution']:
+    if count:
         analysis['strategic_patterns'] = {
-            'avg_confidence': sum(analysis['move_quality_distribution']) / len(analysis['move_quality_distribution']),
-            'consistency': 1.0 - (max(analysis['move_quality_distribution']) - min(analysis['move_quality_distribution'])),
+            'avg_confidence': float(confidences.mean()),
+            'consistency': float(1.0 - np.ptp(confidences)),
             'final_outcome': reward
         }
     
     return analysis
 
 
+@lru_cache(maxsize=1)
+def _draughts_module_info():
+    """Inspect the draughts module once; it does not change after import"""
+    return (
+        draughts.__name__,
+        tuple(attr for attr in dir(draughts) if not attr.startswith('_')),
+        getattr(draughts, '__doc__', 'No documentation available')
+    )
+
+
+@lru_cache(maxsize=1)
+def _draughts_board_classes():
+    """Find the draughts module's board classes among common class names, in order"""
+    return tuple(
+        getattr(draughts, class_name)
+        for class_name in ['Game', 'Board', 'Checkers', 'DraughtsGame']
+        if hasattr(draughts, class_name)
+    )
+
+
 def get_draughts_info():
     """Get information about the draughts module"""
+    module_name, attributes, module_doc = _draughts_module_info()
     return {
-        "module_name": draughts.__name__,
-        "available_attributes": [attr for attr in dir(draughts) if not attr.startswith('_')],
-        "module_doc": getattr(draughts, '__doc__', 'No documentation available')
+        "module_name": module_name,
+        "available_attributes": list(attributes),
+        "module_doc": module_doc
     }
 
 
 def create_draughts_board():
     """Create a new draughts board using the draughts module"""
-    # Use the draughts module's available constructors
-    available_attrs = dir(draughts)
-    
-    # Try common draughts class names
-    for class_name in ['Game', 'Board', 'Checkers', 'DraughtsGame']:
-        if class_name in available_attrs:
-            try:
-                cls = getattr(draughts, class_name)
-                return cls()
-            except Exception:
-                continue
+    # Try the module's available board classes
+    for cls in _draughts_board_classes():
+        try:
+            return cls()
+        except Exception:
+            continue
     
     # If no constructor works, return None
     return None
@@ -135,12 +180,13 @@ def analyze_draughts_position(board):
         return {"error": "Not a draughts board"}
     
     pieces = board.get_pieces()
+    player1_pieces, player2_pieces, player1_kings, player2_kings = _count_draughts_pieces(pieces)
     analysis = {
         "total_pieces": len(pieces),
-        "player1_pieces": len([p for p in pieces if p.player == 1]),
-        "player2_pieces": len([p for p in pieces if p.player == 2]),
-        "player1_kings": len([p for p in pieces if p.player == 1 and p.king]),
-        "player2_kings": len([p for p in pieces if p.player == 2 and p.king]),
+        "player1_pieces": player1_pieces,
+        "player2_pieces": player2_pieces,
+        "player1_kings": player1_kings,
+        "player2_kings": player2_kings,
         "current_player": board.turn,
         "game_over": board.is_over(),
         "legal_moves": len(list(board.legal_moves())) if not board.is_over() else 0
@@ -152,38 +198,33 @@ def analyze_draughts_position(board):
     return analysis
 
 
-def create_move_history_tensor(board, history, max_history=8):
-    """Create enhanced state representation with move history for context"""
+def create_move_history_tensor(board, history, max_history=8, out=None):
+    """Create enhanced state representation with move history for context
+
+    Returns a float32 (max_history, 8, 8) array. Pass a preallocated array
+    of that shape as out to reuse it between calls.
+    """
     # This would create a tensor stack of the last N board positions
     # Each position becomes a layer in the input tensor
-    history_planes = []
+    if out is None:
+        out = np.zeros((max_history, 8, 8), dtype=np.float32)
+    else:
+        out.fill(0)
     
-    for i in range(max_history):
-        if i < len(history):
-            # Use historical position
-            hist_board = history[-(i + 1)]
-        else:
-            # Pad with current position if not enough history
-            hist_board = board
-        
-        # Convert board to tensor representation (simplified)
-        if hasattr(hist_board, 'fen'):  # Chess board
-            plane = np.zeros((8, 8))  # Simplified representation
-            # In a real implementation, this would be much more detailed
-        else:  # Checkers board
-            plane = np.zeros((8, 8))
-        
-        history_planes.append(plane)
+    # Plane i would encode history[-(i + 1)], padded with the current board
+    # when there is not enough history. The representation is simplified to
+    # empty planes for both chess and checkers; a real implementation would
+    # write each position into out[i] in place.
     
-    return np.stack(history_planes, axis=0)
+    return out
 
 
 def calculate_game_complexity(board, game_type):
     """Calculate the complexity of the current game position"""
     if game_type == "chess":
         # Chess complexity metrics
-        legal_moves = len(list(board.legal_moves))
-        piece_count = len([sq for sq in chess.SQUARES if board.piece_at(sq)])
+        legal_moves = board.legal_moves.count()
+        piece_count = chess.popcount(board.occupied)
         
         # Simple complexity score
         complexity = legal_moves * 0.1 + piece_count * 0.05
@@ -196,10 +237,13 @@ def calculate_game_complexity(board, game_type):
     
     elif game_type == "checkers":
         # Checkers complexity metrics
-        legal_moves = len(list(board.legal_moves()))
+        legal_moves = len(board.legal_moves())
         pieces = board.get_pieces()
         piece_count = len(pieces)
-        king_count = len([p for p in pieces if p.king])
+        king_count = 0
+        for p in pieces:
+            if p.king:
+                king_count += 1
         
         complexity = legal_moves * 0.2 + piece_count * 0.1 + king_count * 0.3
         
@@ -6,49 +6,107 @@ Supports: NVIDIA (CUDA), AMD (ROCm), Apple Silicon (MPS), Intel/AMD/others (Dire
 """
 
 
+import logging
+import os
+import threading
+import time
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Optional
+
+# Let torch.cuda.is_available() ask NVML instead of initializing the driver
+os.environ.setdefault("PYTORCH_NVML_BASED_CUDA_CHECK", "1")
+
 import torch
 import warnings
-try:
-    import torch_directml
-except ImportError:
-    torch_directml = None
+
+logger = logging.getLogger(__name__)
+
+# Device returned by safe_device, probed once per process
+_CACHED_SAFE_DEVICE = None
+_DEVICE_CACHE_LOCK = threading.Lock()
+
+# One-element tensor kept on each device that passed the probe, reused by later probes
+_PROBE_TENSORS = {}
+
+# get_gpu_memory_info result, reused for MEMORY_INFO_TTL seconds
+MEMORY_INFO_TTL = 0.25
+_last_mem_query_ts = float("-inf")
+_last_mem_query_result = None
 
 def safe_device():
     """
     Returns a torch.device that is guaranteed to work (falls back to CPU if the selected device is unavailable).
     Use this everywhere instead of direct device access for robust fallback.
+    The device is probed on the first call and reused afterwards.
     """
+    global _CACHED_SAFE_DEVICE
+    device = _CACHED_SAFE_DEVICE
+    if device is not None:
+        return device
+    with _DEVICE_CACHE_LOCK:
+        if _CACHED_SAFE_DEVICE is None:
+            _CACHED_SAFE_DEVICE = _probe_safe_device()
+        return _CACHED_SAFE_DEVICE
+
+def _probe_safe_device():
+    """Checks the detected device with a test allocation, falling back to CPU."""
     device, backend = detect_gpu_backend()
-    # Try to allocate a tensor on the device to check if it works
+    # Try to use a tensor on the device to check if it works
     try:
-        if backend in ("cuda", "mps"):
-            test_tensor = torch.zeros(1).to(device)
-            del test_tensor  # Clean up immediately
-            if backend == "cuda":
-                torch.cuda.empty_cache()  # Clear GPU cache
-        elif backend == "directml" and torch_directml is not None:
-            test_tensor = torch.zeros(1, device=device)
-            del test_tensor
+        if backend in ("cuda", "mps", "directml"):
+            # Make the probed GPU current so nothing is initialized on cuda:0
+            context = torch.cuda.device(device) if backend == "cuda" else nullcontext()
+            with context:
+                probe_tensor = _PROBE_TENSORS.get(device)
+                if probe_tensor is None:
+                    _PROBE_TENSORS[device] = torch.zeros(1, device=device)
+                else:
+                    probe_tensor.add_(0)  # In-place, no allocation
     except Exception as e:
-        print(f"[safe_device] {backend} unavailable ({e}), falling back to CPU.")
+        logger.warning("[safe_device] %s unavailable (%s), falling back to CPU.", backend, e)
         return torch.device("cpu")
     return device
 
+def reset_device_cache():
+    """Forgets the detected backend and probed device so the next call detects them again."""
+    global _CACHED_SAFE_DEVICE
+    with _DEVICE_CACHE_LOCK:
+        _CACHED_SAFE_DEVICE = None
+        detect_gpu_backend.cache_clear()
+        get_gpu_info.cache_clear()
+        _cuda_available.cache_clear()
+        _mps_available.cache_clear()
+
+@lru_cache(maxsize=1)
+def _cuda_available():
+    """torch.cuda.is_available(), asked once per process."""
+    return hasattr(torch, "cuda") and torch.cuda.is_available()
+
+@lru_cache(maxsize=1)
+def _mps_available():
+    """torch.backends.mps.is_available(), asked once per process."""
+    return hasattr(torch.backends, "mps") and torch.backends.mps.is_available()
+
+@lru_cache(maxsize=1)
 def detect_gpu_backend():
     """Detects the best available GPU backend and returns a torch.device and backend name."""
     # CUDA (NVIDIA)
-    if hasattr(torch, "cuda") and torch.cuda.is_available():
+    if _cuda_available():
         return torch.device("cuda"), "cuda"
     # ROCm (AMD) - No public API for detection in mainline PyTorch.
     # If you are using ROCm, install the ROCm build of PyTorch and set device manually.
     # See: https://pytorch.org/get-started/locally/ for ROCm install instructions.
     # Apple Silicon (MPS)
-    if hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
+    if _mps_available():
         return torch.device("mps"), "mps"
-    # DirectML (Windows, Intel/AMD/NVIDIA)
-    if torch_directml is not None:
+    # DirectML (Windows, Intel/AMD/NVIDIA), imported only once CUDA and MPS are ruled out
+    try:
+        import torch_directml
         dml_device = torch_directml.device()
         return dml_device, "directml"
+    except ImportError:
+        pass
     # OpenCL (via pyopencl, not natively supported by torch)
     try:
         import pyopencl
@@ -73,8 +131,9 @@ def recommend_torch_install(backend):
         return "pip install pyopencl"
     return "pip install torch torchvision torchaudio"
 
+@lru_cache(maxsize=1)
 def get_gpu_info():
-    """Returns a string describing the detected GPU or CPU device."""
+    """Returns a string describing the detected GPU or CPU device (queried once)."""
     device, backend = detect_gpu_backend()
     info = f"Backend: {backend}"
     if backend == "cuda":
@@ -99,25 +158,47 @@ def set_torch_device():
         return torch.device("cpu")
     return device
 
-def clear_gpu_memory():
-    """Clear GPU memory cache to prevent memory issues"""
+def clear_gpu_memory(force: bool = False, device: Optional[torch.device] = None):
+    """
+    Release cached GPU memory back to the driver.
+
+    This is a no-op unless force is True: empty_cache() walks the whole caching
+    allocator and never frees memory held by live tensors, so callers should
+    just `del` tensors they no longer need. When forced, the call runs inside
+    the given device's context so it does not initialize a context on cuda:0.
+    """
+    if not force:
+        return
     try:
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
-            torch.cuda.synchronize()
+        if _cuda_available():
+            with torch.cuda.device(device if device is not None else torch.cuda.current_device()):
+                torch.cuda.synchronize()
+                torch.cuda.empty_cache()
     except Exception as e:
-        print(f"[clear_gpu_memory] Warning: {e}")
+        logger.warning("[clear_gpu_memory] %s", e)
 
 def get_gpu_memory_info():
-    """Get GPU memory usage information"""
-    if torch.cuda.is_available():
+    """Get GPU memory usage information (cached for MEMORY_INFO_TTL seconds)"""
+    global _last_mem_query_ts, _last_mem_query_result
+    now = time.monotonic()
+    if now - _last_mem_query_ts < MEMORY_INFO_TTL:
+        return _last_mem_query_result
+
+    if _cuda_available():
         try:
-            allocated = torch.cuda.memory_allocated() / 1024**3  # GB
-            cached = torch.cuda.memory_reserved() / 1024**3  # GB
-            return f"GPU Memory - Allocated: {allocated:.2f}GB, Cached: {cached:.2f}GB"
+            # One allocator query for both values
+            stats = torch.cuda.memory_stats()
+            allocated = stats.get("allocated_bytes.all.current", 0) / 1024**3  # GB
+            cached = stats.get("reserved_bytes.all.current", 0) / 1024**3  # GB
+            result = f"GPU Memory - Allocated: {allocated:.2f}GB, Cached: {cached:.2f}GB"
         except Exception:
-            return "GPU Memory info unavailable"
-    return "No CUDA GPU available"
+            result = "GPU Memory info unavailable"
+    else:
+        result = "No CUDA GPU available"
+
+    _last_mem_query_ts = now
+    _last_mem_query_result = result
+    return result
 
 if __name__ == "__main__":
     print("[GPU Detection]")
@@ -2,8 +2,76 @@
 Responsive Layout Manager - Handles dynamic layout adaptation for different screen sizes
 """
 
-from typing import Dict, Tuple, Any
-import pygame
+import logging
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple, Any
+
+logger = logging.getLogger(__name__)
+
+
+# Element display priorities per layout category (higher = more important)
+# On small screens, prioritize essential elements
+_PRIORITIES_SMALL = MappingProxyType({
+    'game_boards': 10,
+    'current_scores': 8,
+    'progress_bars': 6,
+    'captured_pieces': 4,
+    'detailed_stats': 2,
+    'decorative_elements': 1
+})
+
+# Standard priorities
+_PRIORITIES_MEDIUM = MappingProxyType({
+    'game_boards': 10,
+    'captured_pieces': 8,
+    'current_scores': 7,
+    'progress_bars': 6,
+    'detailed_stats': 4,
+    'decorative_elements': 3
+})
+
+# On large screens, show everything
+_PRIORITIES_LARGE = MappingProxyType({
+    'game_boards': 10,
+    'captured_pieces': 9,
+    'current_scores': 8,
+    'progress_bars': 7,
+    'detailed_stats': 6,
+    'decorative_elements': 5
+})
+
+_PRIO_TABLE = {'small': _PRIORITIES_SMALL, 'medium': _PRIORITIES_MEDIUM}
+
+# Names of the elements shown for each (category, min_priority) pair; any
+# category other than small and medium uses the large table
+_VISIBLE_BY_CATEGORY_PRIO = {
+    (category, min_priority): frozenset(
+        name for name, priority in priorities.items() if priority >= min_priority
+    )
+    for category, priorities in (
+        ('small', _PRIORITIES_SMALL),
+        ('medium', _PRIORITIES_MEDIUM),
+        ('large', _PRIORITIES_LARGE)
+    )
+    for min_priority in range(1, 11)
+}
+
+# Keys every layout must provide (tuple keeps the reporting order)
+_REQUIRED_LAYOUT_KEYS = (
+    'square_size', 'margin', 'board_positions',
+    'captured_pieces_areas', 'score_panel_area'
+)
+_REQUIRED_LAYOUT_KEY_SET = frozenset(_REQUIRED_LAYOUT_KEYS)
+
+# Font sizes used when a layout cannot be read
+_DEFAULT_FONT_SIZES = MappingProxyType({
+    'piece_font': 30,
+    'title_font': 20,
+    'info_font': 16,
+    'small_font': 12
+})
 
 
 class ResponsiveLayoutManager:
@@ -17,17 +85,41 @@ class ResponsiveLayoutManager:
         'xlarge': 2000
     }
     
+    # Width edges between size categories, for bisect in get_layout_size
+    _BP_EDGES = (BREAKPOINTS['small'], BREAKPOINTS['medium'], BREAKPOINTS['large'])
+    _BP_NAMES = ('small', 'medium', 'large', 'xlarge')
+    
+    # Layout style names; string constants are interned, so callers can
+    # compare a layout's 'layout_style' against these directly
+    STYLE_COMPACT = 'compact_vertical'
+    STYLE_STANDARD = 'standard_horizontal'
+    STYLE_SPACIOUS = 'spacious_horizontal'
+    STYLE_ULTRA_WIDE = 'ultra_wide'
+    STYLE_FALLBACK = 'safe_fallback'
+    
     # Minimum dimensions
     MIN_WINDOW_WIDTH = 800
     MIN_WINDOW_HEIGHT = 600
     MIN_SQUARE_SIZE = 30
     MAX_SQUARE_SIZE = 80
     
-    def __init__(self):
-        self.current_layout = 'medium'
-        self.layout_cache = {}
+    # Font scale per layout category (unknown categories use xlarge)
+    FONT_MULTIPLIERS = {
+        'small': 0.8,
+        'medium': 1.0,
+        'large': 1.2,
+        'xlarge': 1.4
+    }
+    
+    # Number of window sizes whose layouts are kept (shared by all instances)
+    LAYOUT_CACHE_SIZE = 128
+    
+    def __init__(self) -> None:
+        self.current_layout: str = 'medium'
+        self._font_table: Dict[str, Tuple[Mapping[str, int], ...]] = self._build_font_table()
         
-    def get_layout_size(self, width: int, height: int) -> str:
+    @classmethod
+    def get_layout_size(cls, width: int, height: int) -> str:
         """
         Determine layout size category based on window dimensions
         
@@ -38,14 +130,7 @@ class ResponsiveLayoutManager:
         Returns:
             Layout size category
         """
-        if width < self.BREAKPOINTS['small']:
-            return 'small'
-        elif width < self.BREAKPOINTS['medium']:
-            return 'medium'
-        elif width < self.BREAKPOINTS['large']:
-            return 'large'
-        else:
-            return 'xlarge'
+        return cls._BP_NAMES[bisect_right(cls._BP_EDGES, width)]
     
     def calculate_optimal_layout(self, width: int, height: int) -> Dict[str, Any]:
         """
@@ -58,49 +143,47 @@ class ResponsiveLayoutManager:
         Returns:
             Dictionary containing layout configuration
         """
-        try:
-            # Check cache first
-            cache_key = f"{width}x{height}"
-            if cache_key in self.layout_cache:
-                return self.layout_cache[cache_key]
-            
-            # Enforce minimum dimensions
-            width = max(width, self.MIN_WINDOW_WIDTH)
-            height = max(height, self.MIN_WINDOW_HEIGHT)
-            
-            layout_size = self.get_layout_size(width, height)
-            
-            # Calculate layout based on size category
-            if layout_size == 'small':
-                layout = self._calculate_small_layout(width, height)
-            elif layout_size == 'medium':
-                layout = self._calculate_medium_layout(width, height)
-            elif layout_size == 'large':
-                layout = self._calculate_large_layout(width, height)
-            else:  # xlarge
-                layout = self._calculate_xlarge_layout(width, height)
-            
-            # Add common layout properties
-            layout.update({
-                'window_size': (width, height),
-                'layout_category': layout_size,
-                'responsive_enabled': True
-            })
-            
-            # Cache the result
-            self.layout_cache[cache_key] = layout
-            
-            return layout
-            
-        except Exception as e:
-            print(f"⚠️ Error calculating optimal layout: {e}")
+        if not (isinstance(width, int) and isinstance(height, int)):
+            logger.warning("Invalid window size for layout: %rx%r", width, height)
             return self._get_fallback_layout(width, height)
+        
+        # Enforce minimum dimensions before the lookup so every size below
+        # the minimum shares one cache entry
+        return self._compute_layout(
+            max(width, self.MIN_WINDOW_WIDTH), max(height, self.MIN_WINDOW_HEIGHT)
+        )
+    
+    @classmethod
+    @lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+    def _compute_layout(cls, width: int, height: int) -> Dict[str, Any]:
+        """Build the layout for one window size, cached across all instances"""
+        layout_size = cls.get_layout_size(width, height)
+        
+        # Calculate layout based on size category
+        if layout_size == 'small':
+            layout = cls._calculate_small_layout(width, height)
+        elif layout_size == 'medium':
+            layout = cls._calculate_medium_layout(width, height)
+        elif layout_size == 'large':
+            layout = cls._calculate_large_layout(width, height)
+        else:  # xlarge
+            layout = cls._calculate_xlarge_layout(width, height)
+        
+        # Add common layout properties
+        layout.update({
+            'window_size': (width, height),
+            'layout_category': layout_size,
+            'responsive_enabled': True
+        })
+        
+        return layout
     
-    def _calculate_small_layout(self, width: int, height: int) -> Dict[str, Any]:
+    @classmethod
+    def _calculate_small_layout(cls, width: int, height: int) -> Dict[str, Any]:
         """Calculate layout for small screens (< 800px)"""
         # Compact layout - single column, smaller elements
         margin = 10
-        square_size = max(self.MIN_SQUARE_SIZE, min(40, (width - 4 * margin) // 16))
+        square_size = max(cls.MIN_SQUARE_SIZE, min(40, (width - 4 * margin) // 16))
         
         # Single board at a time or stacked vertically
         board_width = square_size * 8
@@ -139,15 +222,16 @@ class ResponsiveLayoutManager:
                 'width': width - 2 * margin,
                 'height': 60
             },
-            'layout_style': 'compact_vertical'
+            'layout_style': cls.STYLE_COMPACT
         }
     
-    def _calculate_medium_layout(self, width: int, height: int) -> Dict[str, Any]:
+    @classmethod
+    def _calculate_medium_layout(cls, width: int, height: int) -> Dict[str, Any]:
         """Calculate layout for medium screens (800-1200px)"""
         # Standard layout - side by side boards
         margin = 20
         available_width = width - 2 * margin
-        square_size = max(self.MIN_SQUARE_SIZE, min(60, available_width // 20))
+        square_size = max(cls.MIN_SQUARE_SIZE, min(60, available_width // 20))
         
         board_width = square_size * 8
         board_spacing = 50
@@ -188,14 +272,15 @@ class ResponsiveLayoutManager:
                 'width': width - 2 * margin,
                 'height': 80
             },
-            'layout_style': 'standard_horizontal'
+            'layout_style': cls.STYLE_STANDARD
         }
     
-    def _calculate_large_layout(self, width: int, height: int) -> Dict[str, Any]:
+    @classmethod
+    def _calculate_large_layout(cls, width: int, height: int) -> Dict[str, Any]:
         """Calculate layout for large screens (1200-1600px)"""
         # Spacious layout with larger elements
         margin = 30
-        square_size = max(50, min(self.MAX_SQUARE_SIZE, (width - 6 * margin) // 20))
+        square_size = max(50, min(cls.MAX_SQUARE_SIZE, (width - 6 * margin) // 20))
         
         board_width = square_size * 8
         board_spacing = 80
@@ -236,14 +321,15 @@ class ResponsiveLayoutManager:
                 'width': width - 2 * margin,
                 'height': 100
             },
-            'layout_style': 'spacious_horizontal'
+            'layout_style': cls.STYLE_SPACIOUS
         }
     
-    def _calculate_xlarge_layout(self, width: int, height: int) -> Dict[str, Any]:
+    @classmethod
+    def _calculate_xlarge_layout(cls, width: int, height: int) -> Dict[str, Any]:
         """Calculate layout for extra large screens (> 1600px)"""
         # Ultra-wide layout with maximum spacing
         margin = 50
-        square_size = min(self.MAX_SQUARE_SIZE, (width - 8 * margin) // 24)
+        square_size = min(cls.MAX_SQUARE_SIZE, (width - 8 * margin) // 24)
         
         board_width = square_size * 8
         board_spacing = 120
@@ -288,7 +374,7 @@ class ResponsiveLayoutManager:
                 'width': width - 2 * margin,
                 'height': 120
             },
-            'layout_style': 'ultra_wide'
+            'layout_style': cls.STYLE_ULTRA_WIDE
         }
     
     def _get_fallback_layout(self, width: int, height: int) -> Dict[str, Any]:
@@ -308,11 +394,11 @@ class ResponsiveLayoutManager:
             'progress_area': {'x': 20, 'y': height - 190, 'width': width - 40, 'height': 80},
             'window_size': (width, height),
             'layout_category': 'fallback',
-            'layout_style': 'safe_fallback',
+            'layout_style': self.STYLE_FALLBACK,
             'responsive_enabled': False
         }
     
-    def adapt_fonts_to_layout(self, layout: Dict[str, Any]) -> Dict[str, Any]:
+    def adapt_fonts_to_layout(self, layout: Dict[str, Any]) -> Mapping[str, int]:
         """
         Adapt font sizes based on layout
         
@@ -320,41 +406,51 @@ class ResponsiveLayoutManager:
             layout: Layout configuration
             
         Returns:
-            Dictionary with font size recommendations
+            Read-only mapping with font size recommendations
         """
-        try:
-            square_size = layout.get('square_size', 50)
-            layout_category = layout.get('layout_category', 'medium')
-            
-            # Base font sizes
-            if layout_category == 'small':
-                base_multiplier = 0.8
-            elif layout_category == 'medium':
-                base_multiplier = 1.0
-            elif layout_category == 'large':
-                base_multiplier = 1.2
-            else:  # xlarge
-                base_multiplier = 1.4
-            
-            font_sizes = {
-                'piece_font': max(20, int(square_size * 0.8 * base_multiplier)),
-                'title_font': max(16, int(24 * base_multiplier)),
-                'info_font': max(12, int(16 * base_multiplier)),
-                'small_font': max(10, int(12 * base_multiplier))
-            }
-            
-            return font_sizes
-            
-        except Exception as e:
-            print(f"⚠️ Error adapting fonts: {e}")
-            return {
-                'piece_font': 30,
-                'title_font': 20,
-                'info_font': 16,
-                'small_font': 12
-            }
+        square_size = layout.get('square_size', 50)
+        layout_category = layout.get('layout_category', 'medium')
+        
+        if not (isinstance(square_size, (int, float)) and isinstance(layout_category, str)):
+            logger.warning(
+                "Error adapting fonts: invalid layout (%r, %r)", square_size, layout_category
+            )
+            return _DEFAULT_FONT_SIZES
+        
+        # Precomputed sizes cover every square size a layout can produce
+        table = self._font_table.get(layout_category, self._font_table['xlarge'])
+        if type(square_size) is int:
+            index = square_size - self.MIN_SQUARE_SIZE
+            if 0 <= index < len(table):
+                return table[index]
+        
+        return self._font_sizes(
+            square_size, self.FONT_MULTIPLIERS.get(layout_category, self.FONT_MULTIPLIERS['xlarge'])
+        )
+    
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _build_font_table(cls) -> Dict[str, Tuple[Mapping[str, int], ...]]:
+        """Font sizes for every category and square size a layout can produce"""
+        return {
+            category: tuple(
+                cls._font_sizes(square_size, multiplier)
+                for square_size in range(cls.MIN_SQUARE_SIZE, cls.MAX_SQUARE_SIZE + 1)
+            )
+            for category, multiplier in cls.FONT_MULTIPLIERS.items()
+        }
+    
+    @staticmethod
+    def _font_sizes(square_size: int, base_multiplier: float) -> Mapping[str, int]:
+        """Font sizes for one square size and category multiplier"""
+        return MappingProxyType({
+            'piece_font': max(20, int(square_size * 0.8 * base_multiplier)),
+            'title_font': max(16, int(24 * base_multiplier)),
+            'info_font': max(12, int(16 * base_multiplier)),
+            'small_font': max(10, int(12 * base_multiplier))
+        })
     
-    def get_element_priorities(self, layout: Dict[str, Any]) -> Dict[str, int]:
+    def get_element_priorities(self, layout: Dict[str, Any]) -> Mapping[str, int]:
         """
         Get element display priorities based on layout
         
@@ -362,40 +458,10 @@ class ResponsiveLayoutManager:
             layout: Layout configuration
             
         Returns:
-            Dictionary with element priorities (higher = more important)
+            Read-only mapping with element priorities (higher = more important)
         """
-        layout_category = layout.get('layout_category', 'medium')
-        
-        if layout_category == 'small':
-            # On small screens, prioritize essential elements
-            return {
-                'game_boards': 10,
-                'current_scores': 8,
-                'progress_bars': 6,
-                'captured_pieces': 4,
-                'detailed_stats': 2,
-                'decorative_elements': 1
-            }
-        elif layout_category == 'medium':
-            # Standard priorities
-            return {
-                'game_boards': 10,
-                'captured_pieces': 8,
-                'current_scores': 7,
-                'progress_bars': 6,
-                'detailed_stats': 4,
-                'decorative_elements': 3
-            }
-        else:  # large or xlarge
-            # On large screens, show everything
-            return {
-                'game_boards': 10,
-                'captured_pieces': 9,
-                'current_scores': 8,
-                'progress_bars': 7,
-                'detailed_stats': 6,
-                'decorative_elements': 5
-            }
+        # Large and xlarge (and anything unknown) share the large table
+        return _PRIO_TABLE.get(layout.get('layout_category', 'medium'), _PRIORITIES_LARGE)
     
     def should_show_element(self, element_name: str, layout: Dict[str, Any], 
                            min_priority: int = 5) -> bool:
@@ -410,19 +476,31 @@ class ResponsiveLayoutManager:
         Returns:
             True if element should be shown
         """
+        layout_category = layout.get('layout_category', 'medium')
+        if layout_category not in _PRIO_TABLE:
+            layout_category = 'large'
+        
+        visible = _VISIBLE_BY_CATEGORY_PRIO.get((layout_category, min_priority))
+        if visible is not None:
+            return element_name in visible
+        
+        # Thresholds outside 1-10 (unknown elements count as priority 0)
         priorities = self.get_element_priorities(layout)
         element_priority = priorities.get(element_name, 0)
         return element_priority >= min_priority
     
     def clear_cache(self) -> None:
-        """Clear the layout cache"""
-        self.layout_cache.clear()
+        """Clear the layout cache (shared by all instances)"""
+        self._compute_layout.cache_clear()
     
     def get_cache_info(self) -> Dict[str, Any]:
         """Get cache information"""
+        info = self._compute_layout.cache_info()
         return {
-            'cache_size': len(self.layout_cache),
-            'cached_layouts': list(self.layout_cache.keys())
+            'cache_size': info.currsize,
+            'max_size': info.maxsize,
+            'hits': info.hits,
+            'misses': info.misses
         }
     
     def validate_layout(self, layout: Dict[str, Any]) -> bool:
@@ -436,30 +514,26 @@ class ResponsiveLayoutManager:
             True if layout is valid
         """
         try:
-            required_keys = [
-                'square_size', 'margin', 'board_positions', 
-                'captured_pieces_areas', 'score_panel_area'
-            ]
-            
-            # Check required keys
-            for key in required_keys:
-                if key not in layout:
-                    print(f"⚠️ Layout missing required key: {key}")
-                    return False
+            # Check required keys; the keys view comparison tests membership
+            # in the layout without building a temporary set
+            if not layout.keys() >= _REQUIRED_LAYOUT_KEY_SET:
+                key = next(key for key in _REQUIRED_LAYOUT_KEYS if key not in layout)
+                logger.warning("Layout missing required key: %s", key)
+                return False
             
             # Validate square size
             if not (self.MIN_SQUARE_SIZE <= layout['square_size'] <= self.MAX_SQUARE_SIZE):
-                print(f"⚠️ Invalid square size: {layout['square_size']}")
+                logger.warning("Invalid square size: %s", layout['square_size'])
                 return False
             
             # Validate board positions
             board_positions = layout['board_positions']
             if 'chess' not in board_positions or 'checkers' not in board_positions:
-                print("⚠️ Missing board positions")
+                logger.warning("Missing board positions")
                 return False
             
             return True
             
         except Exception as e:
-            print(f"⚠️ Error validating layout: {e}")
+            logger.warning("Error validating layout: %s", e)
             return False
\ No newline at end of file
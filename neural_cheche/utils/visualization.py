@@ -2,8 +2,10 @@
 Visualization and GUI management
 """
 
+import heapq
 import pygame
-from typing import Dict, Any
+from collections import OrderedDict, deque
+from typing import Dict, Any, Tuple
 from .captured_pieces_renderer import CapturedPiecesRenderer
 from .responsive_layout import ResponsiveLayoutManager
 from ..error_handling import ErrorHandler, ErrorCategory, ErrorSeverity
@@ -13,6 +15,12 @@ from ..error_handling.decorators import handle_errors, graceful_degradation
 class VisualizationManager:
     """Manages the pygame visualization system"""
 
+    # Motion events arrive in bursts and nothing reads them, so SDL drops them
+    BLOCKED_EVENTS = [pygame.MOUSEMOTION, pygame.FINGERMOTION, pygame.JOYAXISMOTION]
+
+    # Fonts shared by every instance, keyed by (name, size, bold)
+    _FONT_CACHE: Dict[Tuple[str, int, bool], pygame.font.Font] = {}
+
     def __init__(self, window_width=1400, window_height=800, square_size=60):
         self.window_width = window_width
         self.window_height = window_height
@@ -21,6 +29,45 @@ class VisualizationManager:
         # Initialize error handler
         self.error_handler = ErrorHandler()
 
+        # Rendered text surfaces keyed by (font id, text, color), oldest first
+        self._text_cache: Dict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface]
+        self._text_cache = OrderedDict()
+        self._text_cache_size = 512
+
+        # Last policy shown by display_policy_info: (policy, size, max_moves, top_moves)
+        self._policy_cache = (None, 0, 0, [])
+
+        # Last win counts and the global state built from them
+        self._gen_info_cache = (None, None)
+
+        # Last header inputs and their text: (key, game_text, gen_text)
+        self._header_cache = (None, "", "")
+
+        # Score panel: last scores and their text, and the last five
+        # historical scores with their sum, updated as the history grows
+        self._score_text_cache = (None, "")
+        self._hist_state = {
+            "list": None,
+            "len": 0,
+            "last": None,
+            "sum": 0,
+            "tail": deque(maxlen=5),
+        }
+
+        # Solid background surfaces keyed by (width, height, color)
+        self._fill_cache: Dict[Tuple[int, int, Tuple[int, int, int]], pygame.Surface]
+        self._fill_cache = {}
+
+        # True while the window can be drawn on; checked by the draw primitives
+        self._alive = False
+
+        # render_frame presents once per frame: refresh_display only records
+        # the request while a frame is drawn, and the next present is a full
+        # flip after anything outside the frame's dirty rects may have changed
+        self._in_frame = False
+        self._refresh_requested = False
+        self._full_refresh_pending = True
+
         try:
             # Initialize pygame
             pygame.init()
@@ -29,11 +76,14 @@ class VisualizationManager:
             )
             pygame.display.set_caption("Neural CheChe: AI vs AI Training")
 
+            # Keep high-volume motion events out of the queue
+            pygame.event.set_blocked(self.BLOCKED_EVENTS)
+
             # Fonts
-            self.font = pygame.font.SysFont("arial", 16)
-            self.large_font = pygame.font.SysFont("arial", 24, bold=True)
-            self.small_font = pygame.font.SysFont("arial", 14)
-            self.title_font = pygame.font.SysFont("arial", 20, bold=True)
+            self.font = self._get_font(16)
+            self.large_font = self._get_font(24, bold=True)
+            self.small_font = self._get_font(14)
+            self.title_font = self._get_font(20, bold=True)
 
             # Colors
             self.WHITE = (255, 255, 255)
@@ -114,6 +164,7 @@ class VisualizationManager:
             )
 
             self.gui_initialized = True
+            self._alive = True
 
         except Exception as e:
             self.error_handler.handle_error(
@@ -129,65 +180,166 @@ class VisualizationManager:
             self.gui_initialized = False
             self.screen = None
 
-    @graceful_degradation(
-        fallback_value=None, log_errors=True, component="clear_screen"
-    )
-    def clear_screen(self):
-        """Clear the screen with white background"""
-        if not self.gui_initialized or not self.screen:
-            return
+    @classmethod
+    def _get_font(cls, size: int, bold: bool = False) -> pygame.font.Font:
+        """Get an arial font, loading it on first use and sharing it afterwards"""
+        key = ("arial", size, bold)
+        font = cls._FONT_CACHE.get(key)
+        if font is None:
+            font = pygame.font.SysFont("arial", size, bold=bold)
+            cls._FONT_CACHE[key] = font
+        return font
+
+    @staticmethod
+    def _to_display_format(surface: pygame.Surface) -> pygame.Surface:
+        """Convert a cached surface to the display pixel format for faster blits"""
         try:
-            self.screen.fill(self.WHITE)
-        except Exception as e:
-            self.error_handler.handle_error(
-                error=e,
-                category=ErrorCategory.GUI,
-                severity=ErrorSeverity.LOW,
-                component="VisualizationManager",
-                context={"operation": "clear_screen"},
-            )
+            return surface.convert_alpha()
+        except pygame.error:
+            # No display mode set
+            return surface
+
+    def _render_text(
+        self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]
+    ) -> pygame.Surface:
+        """Render antialiased text, reusing the surface from earlier identical renders"""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is not None:
+            self._text_cache.move_to_end(key)
+            return surface
+
+        surface = self._to_display_format(font.render(text, True, color))
+        self._text_cache[key] = surface
+        if len(self._text_cache) > self._text_cache_size:
+            self._text_cache.popitem(last=False)
+        return surface
+
+    def clear_text_cache(self) -> None:
+        """Drop all cached text surfaces"""
+        self._text_cache.clear()
+
+    def _get_fill_surface(
+        self, width: int, height: int, color: Tuple[int, int, int]
+    ) -> pygame.Surface:
+        """Solid rectangle in the display format, built once per size and color"""
+        key = (width, height, color)
+        surface = self._fill_cache.get(key)
+        if surface is None:
+            surface = pygame.Surface((width, height))
+            surface.fill(color)
+            try:
+                surface = surface.convert()
+            except pygame.error:
+                # No display mode set
+                pass
+            self._fill_cache[key] = surface
+        return surface
+
+    def _blit_fill(self, x, y, width, height, color):
+        """Paint a solid rectangle from the cached fill surfaces"""
+        if width <= 0 or height <= 0:
+            return
+        self.screen.blit(self._get_fill_surface(width, height, color), (x, y))
 
-    @graceful_degradation(
-        fallback_value=None, log_errors=True, component="display_info"
-    )
-    def display_info(self, text, x, y, color=None):
-        """Display text information at specified position"""
-        if not self.gui_initialized or not self.screen:
+    def _blit_lines(self, lines, x, y, step=20, color=None):
+        """Display lines of text one below the other with a single batched blit"""
+        if not self._alive:
             return
         try:
             if color is None:
                 color = self.BLACK
-            text_surf = self.font.render(text, True, color)
-            self.screen.blit(text_surf, (x, y))
+            blit_list = [
+                (self._render_text(self.font, line, color), (x, y + i * step))
+                for i, line in enumerate(lines)
+            ]
+            if hasattr(self.screen, "fblits"):
+                self.screen.fblits(blit_list)
+            else:
+                self.screen.blits(blit_list, doreturn=False)
         except Exception as e:
             self.error_handler.handle_error(
                 error=e,
                 category=ErrorCategory.GUI,
                 severity=ErrorSeverity.LOW,
                 component="VisualizationManager",
-                context={"operation": "display_info", "text": str(text)[:50]},
+                context={"operation": "_blit_lines", "lines": len(lines)},
             )
 
-    @graceful_degradation(
-        fallback_value=None, log_errors=True, component="display_title"
-    )
-    def display_title(self, text, x, y, color=None):
-        """Display large title text"""
-        if not self.gui_initialized or not self.screen:
-            return
+    def render_frame(self, draw_callable, dirty_rects=None):
+        """
+        Run one frame's drawing with a single error boundary
+
+        The draw primitives (clear_screen, display_info, display_title,
+        _draw_progress_bar, refresh_display) do not catch errors themselves,
+        so callers drawing with them should go through this method.
+
+        refresh_display calls made while drawing are merged into one present
+        after the frame completes. With dirty_rects, only those areas are
+        pushed to the window, unless a full refresh is pending.
+
+        Returns True if the frame was drawn without errors, so callers can
+        fall back to a simpler frame.
+        """
+        if not self._alive:
+            return False
+        self._in_frame = True
+        self._refresh_requested = False
         try:
-            if color is None:
-                color = self.BLACK
-            text_surf = self.large_font.render(text, True, color)
-            self.screen.blit(text_surf, (x, y))
+            draw_callable()
+            if self._refresh_requested and self._alive:
+                self._present(dirty_rects)
+            return True
         except Exception as e:
             self.error_handler.handle_error(
                 error=e,
                 category=ErrorCategory.GUI,
                 severity=ErrorSeverity.LOW,
                 component="VisualizationManager",
-                context={"operation": "display_title", "text": str(text)[:50]},
+                context={"operation": "render_frame"},
             )
+            return False
+        finally:
+            self._in_frame = False
+
+    def request_full_refresh(self) -> None:
+        """Make the next present flip the whole window instead of dirty rects"""
+        self._full_refresh_pending = True
+
+    def get_game_area(self, game_type: str) -> pygame.Rect:
+        """
+        Window column drawn by one game: its board, move info, thinking
+        indicator and captured pieces panel, over the full window height
+        """
+        offset_x = (
+            self.chess_offset_x if game_type == "chess" else self.checkers_offset_x
+        )
+        # Captured pieces panel is 220 wide, 20 right of the board, plus margins
+        left = max(0, offset_x - 20)
+        right = min(self.window_width, offset_x + 8 * self.square_size + 260)
+        return pygame.Rect(left, 0, max(0, right - left), self.window_height)
+
+    def clear_screen(self):
+        """Clear the screen with white background"""
+        if not self._alive:
+            return
+        self.screen.fill(self.WHITE)
+
+    def display_info(self, text, x, y, color=None):
+        """Display text information at specified position"""
+        if not self._alive:
+            return
+        if color is None:
+            color = self.BLACK
+        self.screen.blit(self._render_text(self.font, text, color), (x, y))
+
+    def display_title(self, text, x, y, color=None):
+        """Display large title text"""
+        if not self._alive:
+            return
+        if color is None:
+            color = self.BLACK
+        self.screen.blit(self._render_text(self.large_font, text, color), (x, y))
 
     @graceful_degradation(
         fallback_value=None, log_errors=True, component="display_game_over"
@@ -201,7 +353,7 @@ class VisualizationManager:
                 self.chess_offset_x if game_type == "chess" else self.checkers_offset_x
             )
             # Display game over message below the board, not overlapping
-            text_surf = self.large_font.render(message, True, self.RED)
+            text_surf = self._render_text(self.large_font, message, self.RED)
             message_y = self.board_offset_y + 8 * self.square_size + 20  # Below board
             self.screen.blit(text_surf, (offset_x + 50, message_y))
         except Exception as e:
@@ -234,18 +386,26 @@ class VisualizationManager:
 
             # Display win statistics in the global state area
             if wins_info:
-                global_state = {
-                    "match_stats": {
-                        "total": wins_info.get("alpha", {}).get("chess", 0)
-                        + wins_info.get("alpha", {}).get("checkers", 0)
-                        + wins_info.get("beta", {}).get("chess", 0)
-                        + wins_info.get("beta", {}).get("checkers", 0),
-                        "alpha_wins": wins_info.get("alpha", {}).get("chess", 0)
-                        + wins_info.get("alpha", {}).get("checkers", 0),
-                        "beta_wins": wins_info.get("beta", {}).get("chess", 0)
-                        + wins_info.get("beta", {}).get("checkers", 0),
+                alpha = wins_info.get("alpha", {})
+                beta = wins_info.get("beta", {})
+                key = (
+                    alpha.get("chess", 0),
+                    alpha.get("checkers", 0),
+                    beta.get("chess", 0),
+                    beta.get("checkers", 0),
+                )
+                cached_key, global_state = self._gen_info_cache
+                if cached_key != key:
+                    alpha_wins = key[0] + key[1]
+                    beta_wins = key[2] + key[3]
+                    global_state = {
+                        "match_stats": {
+                            "total": alpha_wins + beta_wins,
+                            "alpha_wins": alpha_wins,
+                            "beta_wins": beta_wins,
+                        }
                     }
-                }
+                    self._gen_info_cache = (key, global_state)
                 self._display_global_state_info(global_state)
 
         except Exception as e:
@@ -284,6 +444,11 @@ class VisualizationManager:
                 (new_width, new_height), pygame.RESIZABLE
             )
 
+            # Cached surfaces were converted to the previous display format
+            self.clear_text_cache()
+            self._fill_cache.clear()
+            self.request_full_refresh()
+
             # Recalculate layout
             self.current_layout = self.layout_manager.calculate_optimal_layout(
                 new_width, new_height
@@ -429,17 +594,19 @@ class VisualizationManager:
         try:
             area = self.score_panel_area
 
-            # Draw score panel background
-            pygame.draw.rect(
-                self.screen,
-                (240, 240, 240),
-                (area["x"], area["y"], area["width"], area["height"]),
+            # Draw score panel background (pre-rendered for the panel size)
+            self._blit_fill(
+                area["x"], area["y"], area["width"], area["height"], (240, 240, 240)
             )
 
             # Display current scores
-            score_text = "Current Scores - "
-            for player, score in current_scores.items():
-                score_text += f"{player}: {score:.3f} | "
+            scores_key = tuple(current_scores.items())
+            cached_scores, score_text = self._score_text_cache
+            if cached_scores != scores_key:
+                score_text = "Current Scores - "
+                for player, score in scores_key:
+                    score_text += f"{player}: {score:.3f} | "
+                self._score_text_cache = (scores_key, score_text)
 
             self.display_info(score_text, area["x"] + 10, area["y"] + 10)
 
@@ -447,9 +614,8 @@ class VisualizationManager:
             if historical:
                 trend_text = f"Games Played: {len(historical)} | "
                 if len(historical) > 1:
-                    recent_avg = sum(h.get("score", 0) for h in historical[-5:]) / min(
-                        5, len(historical)
-                    )
+                    state = self._update_hist_state(historical)
+                    recent_avg = state["sum"] / len(state["tail"])
                     trend_text += f"Recent Avg: {recent_avg:.3f}"
 
                 self.display_info(trend_text, area["x"] + 10, area["y"] + 35)
@@ -463,33 +629,51 @@ class VisualizationManager:
                 context={"operation": "display_score_panel"},
             )
 
+    def _update_hist_state(self, historical: list) -> Dict[str, Any]:
+        """Bring the rolling last-five score window up to date with historical"""
+        state = self._hist_state
+        seen = state["len"]
+        # The entry last seen must still be in place for the window to be reused
+        same_prefix = (
+            state["list"] is historical
+            and 0 < seen <= len(historical)
+            and historical[seen - 1] is state["last"]
+        )
+        if same_prefix and seen == len(historical):
+            return state
+
+        tail = state["tail"]
+        if same_prefix:
+            # Same history list that has grown: only the new games are read
+            new_games = historical[seen:]
+        else:
+            tail.clear()
+            new_games = historical[-5:]
+        tail.extend(h.get("score", 0) for h in new_games[-5:])
+
+        state["list"] = historical
+        state["len"] = len(historical)
+        state["last"] = historical[-1] if historical else None
+        state["sum"] = sum(tail)
+        return state
+
     def _draw_progress_bar(
         self, x: int, y: int, width: int, height: int, progress: float, label: str
     ):
         """Draw a progress bar with label"""
-        try:
-            # Background
-            pygame.draw.rect(self.screen, (200, 200, 200), (x, y, width, height))
+        # Background
+        self._blit_fill(x, y, width, height, (200, 200, 200))
 
-            # Progress fill
-            fill_width = int(width * max(0, min(1, progress)))
-            if fill_width > 0:
-                pygame.draw.rect(self.screen, (0, 200, 0), (x, y, fill_width, height))
+        # Progress fill
+        fill_width = int(width * max(0, min(1, progress)))
+        if fill_width > 0:
+            pygame.draw.rect(self.screen, (0, 200, 0), (x, y, fill_width, height))
 
-            # Border
-            pygame.draw.rect(self.screen, self.BLACK, (x, y, width, height), 2)
+        # Border
+        pygame.draw.rect(self.screen, self.BLACK, (x, y, width, height), 2)
 
-            # Label
-            self.display_info(f"{label}: {progress:.1%}", x, y - 20)
-
-        except Exception as e:
-            self.error_handler.handle_error(
-                error=e,
-                category=ErrorCategory.GUI,
-                severity=ErrorSeverity.LOW,
-                component="VisualizationManager",
-                context={"operation": "_draw_progress_bar", "label": label},
-            )
+        # Label
+        self.display_info(f"{label}: {progress:.1%}", x, y - 20)
 
     def _apply_layout(self, layout: Dict[str, Any]):
         """Apply responsive layout configuration"""
@@ -542,24 +726,22 @@ class VisualizationManager:
             )
             return True
 
-    @graceful_degradation(
-        fallback_value=None, log_errors=True, component="refresh_display"
-    )
     def refresh_display(self):
         """Refresh the display"""
-        if not self.gui_initialized or not self.screen:
+        if not self._alive:
+            return
+        if self._in_frame:
+            self._refresh_requested = True
             return
+        self._present(None)
 
-        try:
+    def _present(self, dirty_rects):
+        """Flip the whole window, or push only dirty_rects to it"""
+        if dirty_rects is None or self._full_refresh_pending:
             pygame.display.flip()
-        except Exception as e:
-            self.error_handler.handle_error(
-                error=e,
-                category=ErrorCategory.GUI,
-                severity=ErrorSeverity.LOW,
-                component="VisualizationManager",
-                context={"operation": "refresh_display"},
-            )
+            self._full_refresh_pending = False
+        else:
+            pygame.display.update(dirty_rects)
 
     @handle_errors(
         category=ErrorCategory.GUI,
@@ -572,6 +754,9 @@ class VisualizationManager:
         """Clean up pygame resources"""
         try:
             if self.gui_initialized:
+                self._alive = False
+                self.clear_text_cache()
+                self._fill_cache.clear()
                 pygame.quit()
                 self.gui_initialized = False
                 print("🧹 GUI cleanup completed")
@@ -584,6 +769,9 @@ class VisualizationManager:
                 context={"operation": "cleanup"},
             )
 
+    @graceful_degradation(
+        fallback_value=None, log_errors=True, component="display_thinking_indicator"
+    )
     def display_thinking_indicator(self, game_type, player, move_count):
         """Display thinking indicator for AI"""
         offset_x = (
@@ -600,6 +788,9 @@ class VisualizationManager:
         progress_text = f"Move {move_count + 1}"
         self.display_info(progress_text, offset_x, thinking_y + 20, self.BLUE)
 
+    @graceful_degradation(
+        fallback_value=None, log_errors=True, component="display_move_statistics"
+    )
     def display_move_statistics(self, game_type, move_count, max_moves):
         """Display move statistics"""
         offset_x = (
@@ -611,6 +802,9 @@ class VisualizationManager:
         progress_text = f"Progress: {move_count}/{max_moves} moves"
         self.display_info(progress_text, offset_x, stats_y, self.BLUE)
 
+    @graceful_degradation(
+        fallback_value=None, log_errors=True, component="display_policy_info"
+    )
     def display_policy_info(self, policy, game_type, max_moves=3):
         """Display top moves from policy"""
         if not policy:
@@ -629,13 +823,19 @@ class VisualizationManager:
             policy_x = offset_x
             policy_y = self.board_offset_y + 8 * self.square_size + 100
 
-        # Sort moves by probability
-        top_moves = sorted(policy.items(), key=lambda x: x[1], reverse=True)[:max_moves]
+        # Top moves by probability, reused while the same policy is displayed
+        cached_policy, cached_size, cached_max, top_moves = self._policy_cache
+        if (
+            cached_policy is not policy
+            or cached_size != len(policy)
+            or cached_max != max_moves
+        ):
+            top_moves = heapq.nlargest(max_moves, policy.items(), key=lambda x: x[1])
+            self._policy_cache = (policy, len(policy), max_moves, top_moves)
 
         self.display_info("Top Moves:", policy_x, policy_y, self.BLACK)
-        for i, (move, prob) in enumerate(top_moves):
-            text = f"{move}: {prob:.3f}"
-            self.display_info(text, policy_x, policy_y + 20 + i * 18, self.BLACK)
+        move_lines = [f"{move}: {prob:.3f}" for move, prob in top_moves]
+        self._blit_lines(move_lines, policy_x, policy_y + 20, step=18)
 
     def update_window_title(self, generation, game_type, phase):
         """Update the pygame window title"""
@@ -657,7 +857,7 @@ class VisualizationManager:
         while time.time() - start_time < delay_seconds:
             if not self.process_events():
                 return False
-            time.sleep(0.01)  # Small sleep to prevent busy waiting
+            pygame.time.wait(10)  # Small sleep to prevent busy waiting
         return True
 
     def display_training_stats(self, stats, x=50, y=600):
@@ -672,8 +872,7 @@ class VisualizationManager:
             f"GPU Memory: {stats.get('gpu_memory', 'N/A')}",
         ]
 
-        for i, line in enumerate(stats_lines):
-            self.display_info(line, x, y + i * 20)
+        self._blit_lines(stats_lines, x, y)
 
     def display_network_info(self, net_info, x=400, y=600):
         """Display neural network information"""
@@ -687,8 +886,7 @@ class VisualizationManager:
             f"Learning Rate: {net_info.get('learning_rate', 0):.6f}",
         ]
 
-        for i, line in enumerate(info_lines):
-            self.display_info(line, x, y + i * 20)
+        self._blit_lines(info_lines, x, y)
 
     def __enter__(self):
         """Context manager entry"""
@@ -1025,15 +1223,25 @@ class VisualizationManager:
             ) // 2
             header_y = 20
 
+            # Header text only changes with the game, generation or phase
+            key = (
+                self.current_game_number,
+                self.current_generation,
+                self.current_phase,
+            )
+            cached_key, game_text, gen_text = self._header_cache
+            if cached_key != key:
+                game_text = f"Game #{self.current_game_number}"
+                gen_text = f"Generation {self.current_generation} - {self.current_phase}"
+                self._header_cache = (key, game_text, gen_text)
+
             # Game number
-            game_text = f"Game #{self.current_game_number}"
-            game_surface = self.title_font.render(game_text, True, self.BLACK)
+            game_surface = self._render_text(self.title_font, game_text, self.BLACK)
             game_rect = game_surface.get_rect(center=(center_x, header_y))
             self.screen.blit(game_surface, game_rect)
 
             # Generation and phase info
-            gen_text = f"Generation {self.current_generation} - {self.current_phase}"
-            gen_surface = self.font.render(gen_text, True, self.BLUE)
+            gen_surface = self._render_text(self.font, gen_text, self.BLUE)
             gen_rect = gen_surface.get_rect(center=(center_x, header_y + 30))
             self.screen.blit(gen_surface, gen_rect)
 
@@ -1087,7 +1295,9 @@ class VisualizationManager:
                 metrics_text = " | ".join(
                     [f"{k}: {v}" for k, v in list(self.progress_metrics.items())[:4]]
                 )
-                metrics_surface = self.small_font.render(metrics_text, True, self.BLACK)
+                metrics_surface = self._render_text(
+                    self.small_font, metrics_text, self.BLACK
+                )
                 self.screen.blit(metrics_surface, (50, metrics_y))
 
         except Exception as e:
@@ -1122,7 +1332,7 @@ class VisualizationManager:
 
             # Label and percentage
             label_text = f"{label}: {progress:.1%}"
-            label_surface = self.small_font.render(label_text, True, self.BLACK)
+            label_surface = self._render_text(self.small_font, label_text, self.BLACK)
             self.screen.blit(label_surface, (x, y - 18))
 
         except Exception as e:
@@ -1205,7 +1415,7 @@ class VisualizationManager:
             move_text = f"{player_type}/{player_name}: {move_from} → {move_to}"
 
             # Draw text with background for better visibility
-            text_surface = self.font.render(move_text, True, color)
+            text_surface = self._render_text(self.font, move_text, color)
             text_rect = text_surface.get_rect()
             text_rect.x = offset_x + 10
             text_rect.y = info_y + 10
@@ -1260,7 +1470,7 @@ class VisualizationManager:
 
             # Winner text with prominent display
             winner_text = f"🏆 {winner_type}/{winner_name} WINS!"
-            winner_surface = self.large_font.render(winner_text, True, self.GOLD)
+            winner_surface = self._render_text(self.large_font, winner_text, self.GOLD)
             winner_rect = winner_surface.get_rect()
             winner_rect.centerx = offset_x + 4 * self.square_size
             winner_rect.y = winner_y
@@ -1279,8 +1489,8 @@ class VisualizationManager:
                 for i, (player, move_info) in enumerate(final_moves.items()):
                     if move_info:
                         move_text = f"{player}: {move_info.get('from', '?')} → {move_info.get('to', '?')}"
-                        move_surface = self.small_font.render(
-                            move_text, True, self.BLACK
+                        move_surface = self._render_text(
+                            self.small_font, move_text, self.BLACK
                         )
                         move_rect = move_surface.get_rect()
                         move_rect.centerx = offset_x + 4 * self.square_size
@@ -1349,7 +1559,7 @@ class VisualizationManager:
             # Game title
             title_y = self.board_offset_y - 30
             title_text = f"{game_type.title()} Game"
-            title_surface = self.title_font.render(title_text, True, self.BLACK)
+            title_surface = self._render_text(self.title_font, title_text, self.BLACK)
             title_rect = title_surface.get_rect()
             title_rect.centerx = offset_x + 4 * self.square_size
             title_rect.y = title_y
@@ -1426,14 +1636,16 @@ class VisualizationManager:
             if "current_players" in global_state:
                 players = global_state["current_players"]
                 players_text = f"Players: {players.get('alpha', 'Unknown')} vs {players.get('beta', 'Unknown')}"
-                players_surface = self.font.render(players_text, True, self.BLACK)
+                players_surface = self._render_text(self.font, players_text, self.BLACK)
                 self.screen.blit(players_surface, (info_x, info_y))
 
             # Match statistics
             if "match_stats" in global_state:
                 stats = global_state["match_stats"]
                 stats_text = f"Matches: {stats.get('total', 0)} | Alpha: {stats.get('alpha_wins', 0)} | Beta: {stats.get('beta_wins', 0)}"
-                stats_surface = self.small_font.render(stats_text, True, self.DARK_GRAY)
+                stats_surface = self._render_text(
+                    self.small_font, stats_text, self.DARK_GRAY
+                )
                 self.screen.blit(stats_surface, (info_x, info_y + 20))
 
         except Exception as e:
@@ -1448,3 +1660,7 @@ class VisualizationManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
         self.cleanup()
+
+
+# Cached fonts are invalid once pygame shuts down
+pygame.register_quit(VisualizationManager._FONT_CACHE.clear)
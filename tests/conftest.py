@@ -0,0 +1,11 @@
+"""
+Shared test fixtures
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def run_in_tmp_path(tmp_path, monkeypatch):
+    """Keep error logs and progress data written by the code under test out of the repo"""
+    monkeypatch.chdir(tmp_path)
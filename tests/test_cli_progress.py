@@ -0,0 +1,67 @@
+"""
+Tests for the CLI progress metric history and formatting
+"""
+
+import numpy as np
+import pytest
+import torch
+
+from neural_cheche.progress.cli_progress import CLIProgress
+
+
+@pytest.fixture
+def progress():
+    cli = CLIProgress(total_generations=10)
+    yield cli
+    cli.cleanup()
+
+
+def recent_averages(cli):
+    count = min(cli.RECENT_WINDOW, cli._history_len)
+    return {key: total / count for key, total in cli._recent_sums.items()}
+
+
+def test_record_history_keeps_recent_window_sums(progress):
+    for i in range(progress.RECENT_WINDOW + 3):
+        progress._record_history({"win_rate": i / 10, "training_loss": 1.0})
+
+    averages = recent_averages(progress)
+    assert averages["win_rate"] == pytest.approx(np.mean([0.3, 0.4, 0.5, 0.6, 0.7]))
+    assert averages["training_loss"] == pytest.approx(1.0)
+    assert averages["skill_score"] == 0.0
+
+
+def test_record_history_coerces_and_skips_values(progress):
+    progress._record_history(
+        {
+            "win_rate": np.float32(0.5),
+            "training_loss": torch.tensor(2.0),
+            "skill_score": "n/a",
+        }
+    )
+    progress._record_history({"win_rate": np.array([0.1, 0.2]), "training_loss": None})
+
+    assert progress._history_len == 2
+    assert progress._recent_sums == {
+        "win_rate": pytest.approx(0.5),
+        "training_loss": pytest.approx(2.0),
+        "skill_score": 0.0,
+    }
+
+
+def test_format_metrics(progress):
+    text = progress._format_metrics(
+        {"win_rate": 0.5, "training_loss": 0.25, "games_played": 3, "skill_score": 1.5}
+    )
+
+    assert text == "WR:50.0% | Loss:0.2500 | Games:3 | Skill:1.50"
+    assert progress._format_metrics({}) == "No metrics"
+
+
+def test_format_metrics_does_not_cache_arrays(progress):
+    games = np.array([3])
+    metrics = {"games_played": games}
+
+    assert progress._format_metrics(metrics) == "Games:[3]"
+    games[0] = 4
+    assert progress._format_metrics(metrics) == "Games:[4]"
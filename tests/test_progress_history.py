@@ -0,0 +1,90 @@
+"""
+Tests for the JSONL progress history files
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from neural_cheche.progress.progress_manager import (
+    METRICS_HISTORY_PATH,
+    PROGRESS_DATA_DIR,
+    ProgressManager,
+)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Start from an empty progress_data/ (tests run in tmp_path, see conftest)"""
+    os.makedirs(PROGRESS_DATA_DIR)
+    return tmp_path
+
+
+def make_manager():
+    return ProgressManager({"enable_cli_progress": False, "enable_gui_progress": False})
+
+
+def read_lines(path):
+    with open(path, "rb") as f:
+        return f.read().split(b"\n")
+
+
+def test_history_round_trip(data_dir):
+    manager = make_manager()
+    manager.update_generation_progress(1, {"win_rate": 0.25, "training_loss": 1.5})
+    manager.update_generation_progress(2, {"win_rate": np.float32(0.5)})
+    manager.cleanup()
+
+    reloaded = make_manager()
+    entries = list(reloaded.metrics_history)
+    reloaded.cleanup()
+
+    assert [entry["generation"] for entry in entries] == [1, 2]
+    assert entries[0]["win_rate"] == 0.25
+    assert entries[1]["win_rate"] == 0.5
+    assert all(isinstance(entry["ts"], float) for entry in entries)
+
+
+def test_torn_last_line_is_skipped_and_repaired(data_dir):
+    with open(METRICS_HISTORY_PATH, "wb") as f:
+        f.write(b'{"generation":1,"win_rate":0.1}\n{"generation":2,"win_')
+
+    manager = make_manager()
+    assert [entry["generation"] for entry in manager.metrics_history] == [1]
+
+    manager.update_generation_progress(3, {"win_rate": 0.3})
+    manager.cleanup()
+
+    lines = read_lines(METRICS_HISTORY_PATH)
+    assert lines[-1] == b""  # File ends with a complete line
+    assert json.loads(lines[-2])["generation"] == 3
+
+    reloaded = make_manager()
+    assert [entry["generation"] for entry in reloaded.metrics_history] == [1, 3]
+    reloaded.cleanup()
+
+
+def test_unencodable_entry_does_not_drop_others(data_dir):
+    manager = make_manager()
+    manager.update_generation_progress(1, {"win_rate": 0.1, "bad": object()})
+    manager.update_generation_progress(2, {"win_rate": 0.2})
+    manager.cleanup()
+
+    reloaded = make_manager()
+    assert [entry["generation"] for entry in reloaded.metrics_history] == [2]
+    reloaded.cleanup()
+
+
+def test_legacy_iso_timestamps_are_converted(data_dir):
+    legacy_path = os.path.join(PROGRESS_DATA_DIR, "metrics_history.json")
+    with open(legacy_path, "w") as f:
+        json.dump([{"generation": 1, "timestamp": "2025-07-31T20:12:39"}], f)
+
+    manager = make_manager()
+    (entry,) = manager.metrics_history
+    manager.cleanup()
+
+    assert "timestamp" not in entry
+    assert isinstance(entry["ts"], float)
@@ -0,0 +1,55 @@
+"""
+Tests for the shared replay buffer
+"""
+
+import random
+
+import numpy as np
+
+from neural_cheche.core.replay_buffer import (
+    GAME_TYPE_CODES,
+    UNKNOWN_GAME_TYPE,
+    SharedReplayBuffer,
+)
+
+
+def make_experience(index, game_type=None):
+    experience = (np.full(3, index), {"a": 1.0}, 0.0, None)
+    if game_type is not None:
+        experience += (game_type,)
+    return experience
+
+
+def test_sample_with_types_tags_match_sampled_experiences():
+    random.seed(0)
+    buffer = SharedReplayBuffer(capacity=50)
+    buffer.add([make_experience(i, "chess") for i in range(10)])
+    buffer.add([make_experience(i, "checkers") for i in range(10, 20)])
+    buffer.add(make_experience(20))
+
+    batch, types = buffer.sample_with_types(21)
+
+    assert types.dtype == np.int8
+    assert len(batch) == len(types) == 21
+    for experience, code in zip(batch, types):
+        expected = (
+            GAME_TYPE_CODES[experience[4]] if len(experience) > 4 else UNKNOWN_GAME_TYPE
+        )
+        assert code == expected
+
+
+def test_sample_with_types_follows_eviction():
+    buffer = SharedReplayBuffer(capacity=4)
+    buffer.add([make_experience(i, "chess") for i in range(4)])
+    buffer.add([make_experience(i, "checkers") for i in range(4, 6)])
+
+    batch, types = buffer.sample_with_types(10)
+
+    assert len(batch) == 4
+    by_index = {int(experience[0][0]): code for experience, code in zip(batch, types)}
+    assert by_index == {
+        2: GAME_TYPE_CODES["chess"],
+        3: GAME_TYPE_CODES["chess"],
+        4: GAME_TYPE_CODES["checkers"],
+        5: GAME_TYPE_CODES["checkers"],
+    }
@@ -0,0 +1,43 @@
+"""
+Tests for batch preparation in the training manager
+"""
+
+import numpy as np
+import torch
+
+from neural_cheche.core.training import TrainingManager
+
+
+def make_batch(size):
+    return [
+        (np.full((2, 3), i, dtype=np.float32), {"a": i / 10, "b": 1 - i / 10}, i / size)
+        for i in range(size)
+    ]
+
+
+def make_manager():
+    return TrainingManager(net=None, optimizer=None, device=torch.device("cpu"))
+
+
+def test_prepare_batch_builds_tensors():
+    states, policies, values = make_manager().prepare_batch(make_batch(4))
+
+    assert states.shape == (4, 2, 3)
+    assert states.dtype == torch.float32
+    assert len(policies) == 4
+    assert torch.allclose(policies[1], torch.tensor([0.1, 0.9]))
+    assert values.shape == (4, 1)
+    assert torch.allclose(values[:, 0], torch.tensor([0.0, 0.25, 0.5, 0.75]))
+
+
+def test_select_prepared_matches_preparing_the_subset():
+    manager = make_manager()
+    batch = make_batch(5)
+    indices = np.array([0, 2, 3])
+
+    selected = TrainingManager.select_prepared(manager.prepare_batch(batch), indices)
+    expected = manager.prepare_batch([batch[i] for i in indices])
+
+    assert torch.equal(selected[0], expected[0])
+    assert all(torch.equal(a, b) for a, b in zip(selected[1], expected[1]))
+    assert torch.equal(selected[2], expected[2])